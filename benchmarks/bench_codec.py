@@ -0,0 +1,44 @@
+"""Compare full pipeline wall time for each available JSON backend.
+
+    python benchmarks/bench_codec.py --rows 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+import run_benchmarks
+from pipeline import codec
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results: dict[str, list[dict]] = {}
+    try:
+        for name in codec.BACKENDS:
+            try:
+                codec.set_backend(name)
+            except ImportError:
+                print(f"skipping {name}: not installed", file=sys.stderr)
+                continue
+            results[name] = []
+            for rows in args.rows:
+                run = run_benchmarks.bench_scale(rows, datasets=6, repeat=args.repeat)
+                total = sum(stage["wall_seconds"] for stage in run["stages"].values())
+                results[name].append({"rows": rows, "total_wall_seconds": round(total, 6), **run})
+                print(f"{name:>7} {rows:>8} rows: {total:.3f}s", file=sys.stderr)
+    finally:
+        codec.set_backend()
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+"""Benchmark ``atlas scan`` on a synthetic file tree.
+
+    python benchmarks/bench_scan.py --files 1000000
+
+The tree is created once under --tree (reused on later runs) with a
+``.git`` directory and a .gitignore'd build directory, so skipped subtrees
+are part of what is measured.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import atlas_cli  # noqa: E402
+
+FILES_PER_DIR = 1000
+EXTENSIONS = (".json", ".py", ".svg", ".md", ".txt")
+
+
+def build_tree(tree: Path, files: int) -> None:
+    marker = tree / ".bench-files"
+    if marker.exists() and marker.read_text(encoding="utf-8") == str(files):
+        return
+    tree.mkdir(parents=True, exist_ok=True)
+    (tree / ".gitignore").write_text("build/\n*.tmp\n", encoding="utf-8")
+
+    # Roughly 10% of the files sit in paths the scan must skip.
+    skipped = files // 10
+    for name, count in ((".git/objects", skipped // 2), ("build", skipped - skipped // 2)):
+        target = tree / name
+        target.mkdir(parents=True, exist_ok=True)
+        for i in range(count):
+            (target / f"obj{i:07d}").touch()
+
+    remaining = files - skipped
+    for d in range((remaining + FILES_PER_DIR - 1) // FILES_PER_DIR):
+        directory = tree / f"src{d // 100:03d}" / f"pkg{d % 100:02d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        for i in range(min(FILES_PER_DIR, remaining - d * FILES_PER_DIR)):
+            ext = EXTENSIONS[i % len(EXTENSIONS)]
+            with open(directory / f"f{i:04d}{ext}", "wb") as handle:
+                handle.write(b"x" * (i % 64))
+    marker.write_text(str(files), encoding="utf-8")
+
+
+def _legacy_scan(root: Path) -> int:
+    files = [p for p in root.rglob("*") if p.is_file()]
+    return len(files)
+
+
+def _timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=1_000_000)
+    parser.add_argument("--tree", default=os.path.join("/tmp", "atlas-scan-bench"))
+    parser.add_argument("--jobs", type=int, default=min(8, os.cpu_count() or 1))
+    parser.add_argument("--skip-legacy", action="store_true", help="Do not time the old rglob scan")
+    args = parser.parse_args()
+
+    tree = Path(args.tree).resolve()
+    build_seconds, _ = _timed(lambda: build_tree(tree, args.files))
+
+    results: dict[str, dict] = {}
+    if not args.skip_legacy:
+        seconds, count = _timed(lambda: _legacy_scan(tree))
+        results["legacy_rglob"] = {"seconds": round(seconds, 3), "file_count": count}
+    for label, kwargs in (
+        ("scandir_serial", {"jobs": 1}),
+        (f"scandir_jobs_{args.jobs}", {"jobs": args.jobs}),
+        ("sample_only", {"with_stats": False}),
+    ):
+        seconds, report = _timed(lambda: atlas_cli.scan_tree(tree, **kwargs))
+        results[label] = {"seconds": round(seconds, 3), "file_count": report["file_count"]}
+
+    print(
+        json.dumps(
+            {"tree": str(tree), "files": args.files, "build_seconds": round(build_seconds, 3), "results": results},
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
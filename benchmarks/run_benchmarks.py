@@ -0,0 +1,168 @@
+"""Time and memory-profile each pipeline stage on synthetic leaderboards.
+
+    python benchmarks/run_benchmarks.py --rows 1000 10000 100000 --out benchmarks/results/head.json
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/base.json benchmarks/results/head.json
+
+Stages run against a scratch directory, never the repo's data/ or site/.
+Wall and CPU time are the best of ``--repeat`` untraced runs; peak memory
+comes from one extra run under tracemalloc.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import synthetic  # noqa: E402
+from pipeline import analyze, charts, cube, export, pages, search, transform  # noqa: E402
+from pipeline.profiling import recording, span  # noqa: E402
+
+STAGES: tuple[tuple[str, Callable[[], Any]], ...] = (
+    ("normalize_sources", lambda: transform.write_unified(transform.normalize_sources())),
+    ("build_analysis_payload", lambda: analyze.write_analysis(analyze.build_analysis_payload())),
+    ("build_cube", lambda: cube.write_cube(analyze.build_cube_payload())),
+    ("export_site_data", lambda: export.export_site_data()),
+    ("export_search_index", lambda: search.export_search_index()),
+    # Repeats after the first only re-render pages whose inputs changed.
+    ("export_pages", lambda: pages.export_pages()),
+    ("charts.generate", lambda: charts.generate()),
+)
+
+
+@contextmanager
+def redirected(workdir: Path) -> Iterator[Path]:
+    """Point every stage's module-level paths at ``workdir``."""
+    sources, processed = workdir / "sources", workdir / "processed"
+    patches = {
+        transform: {"SOURCES_DIR": sources, "PROCESSED_DIR": processed},
+        analyze: {"PROCESSED_DIR": processed},
+        cube: {"CUBE_PATH": processed / "cube.json"},
+        export: {
+            "PROCESSED_DIR": processed,
+            "SITE_DATA_PATH": workdir / "site" / "data.json",
+            "SITE_FRESHNESS_PATH": workdir / "site" / "freshness.json",
+            "SITE_MANIFEST_PATH": workdir / "site" / "manifest.json",
+            "SITE_TIMELINE_DIR": workdir / "site" / "timeline",
+        },
+        search: {
+            "PROCESSED_DIR": processed,
+            "SITE_SEARCH_INDEX_PATH": workdir / "site" / "search-index.json",
+        },
+        pages: {
+            "PROCESSED_DIR": processed,
+            "SITE_PAGES_DIR": workdir / "site" / "pages",
+            "PAGES_MANIFEST_PATH": processed / "pages_manifest.json",
+        },
+        charts: {"ANALYSIS_PATH": processed / "analysis.json", "OUT_DIR": workdir / "charts"},
+    }
+    saved = {module: {name: getattr(module, name) for name in names} for module, names in patches.items()}
+    for module, values in patches.items():
+        for name, value in values.items():
+            setattr(module, name, value)
+    try:
+        yield sources
+    finally:
+        for module, values in saved.items():
+            for name, value in values.items():
+                setattr(module, name, value)
+
+
+def _run_stages(trace_memory: bool) -> dict[str, dict[str, Any]]:
+    with recording(trace_memory=trace_memory) as recorder:
+        for name, stage in STAGES:
+            with span(name):
+                stage()
+    return {node.name: node.to_dict() for node in recorder.roots}
+
+
+def bench_scale(rows: int, datasets: int, repeat: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="atlas-bench-") as tmp, redirected(Path(tmp)) as sources:
+        synthetic.write_sources(sources, rows, datasets=datasets)
+        source_bytes = sum(p.stat().st_size for p in sources.glob("*.json"))
+
+        timings = [_run_stages(trace_memory=False) for _ in range(repeat)]
+        traced = _run_stages(trace_memory=True)
+
+        stages: dict[str, dict[str, Any]] = {}
+        for name, _ in STAGES:
+            best = min(timings, key=lambda run: run[name]["wall_seconds"])[name]
+            stages[name] = {
+                "wall_seconds": best["wall_seconds"],
+                "cpu_seconds": best["cpu_seconds"],
+                "peak_bytes": traced[name]["peak_bytes"],
+            }
+        return {"rows": rows, "datasets": datasets, "source_bytes": source_bytes, "stages": stages}
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def compare(base_path: Path, head_path: Path) -> None:
+    base = json.loads(base_path.read_text(encoding="utf-8"))
+    head = json.loads(head_path.read_text(encoding="utf-8"))
+    base_by_rows = {run["rows"]: run for run in base["runs"]}
+    print(f"{'rows':>9}  {'stage':<24} {'base s':>9} {'head s':>9} {'ratio':>7} {'peak MB':>9}")
+    for run in head["runs"]:
+        previous = base_by_rows.get(run["rows"])
+        if previous is None:
+            continue
+        for name, stats in run["stages"].items():
+            old = previous["stages"].get(name)
+            if old is None:
+                continue
+            ratio = stats["wall_seconds"] / old["wall_seconds"] if old["wall_seconds"] else float("nan")
+            print(
+                f"{run['rows']:>9}  {name:<24} {old['wall_seconds']:>9.3f} {stats['wall_seconds']:>9.3f}"
+                f" {ratio:>6.2f}x {stats['peak_bytes'] / 1e6:>9.1f}"
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pipeline stages on synthetic leaderboards")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--datasets", type=int, default=6, help="Distinct ARC datasetIds")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", type=Path, help="Write results JSON here")
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("BASE", "HEAD"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    runs = []
+    for rows in args.rows:
+        result = bench_scale(rows, args.datasets, args.repeat)
+        runs.append(result)
+        summary = ", ".join(f"{name} {s['wall_seconds']:.3f}s" for name, s in result["stages"].items())
+        print(f"{rows} rows: {summary}", file=sys.stderr)
+
+    report = {"revision": _git_revision(), "python": platform.python_version(), "runs": runs}
+    text = json.dumps(report, indent=2)
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(text, encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
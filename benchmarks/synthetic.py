@@ -0,0 +1,86 @@
+"""Synthetic leaderboard generator shaped like the live ARC and HLE sources."""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+PROVIDERS = ("OpenAI", "Anthropic", "Google", "DeepSeek", "xAI", "Meta", "Mistral", "Qwen")
+HLE_EXTRA_SCORES = ("textquests", "swebench_verified", "terminal_bench", "masks", "enigmaeval", "erqa")
+
+
+def _dataset_ids(count: int) -> list[str]:
+    base = ["v1_Semi_Private", "v1_Public_Eval", "v1_Private_Eval", "v2_Public_Eval", "v2_Semi_Private", "v2_Private_Eval"]
+    return base[:count] + [f"synthetic_{i:03d}" for i in range(max(0, count - len(base)))]
+
+
+def generate(rows: int, datasets: int = 6, hle_ratio: float = 0.25, seed: int = 0) -> dict[str, list[dict]]:
+    """Build in-memory payloads with ``rows`` ARC evaluation records.
+
+    Models are spread evenly across datasets, so ``rows // datasets`` models
+    exist; ``hle_ratio`` of them also appear in the HLE payload.
+    """
+    rng = random.Random(seed)
+    dataset_ids = _dataset_ids(datasets)
+    model_count = max(1, rows // len(dataset_ids))
+    start = date(2023, 1, 1)
+
+    arc_models = []
+    for i in range(model_count):
+        released = start + timedelta(days=rng.randrange(0, 1200))
+        arc_models.append(
+            {
+                "id": f"model-{i:07d}",
+                "displayName": f"Synthetic Model {i}",
+                "modelReleaseDate": f"{released.isoformat()}T00:00:00.000Z",
+                "providerId": PROVIDERS[i % len(PROVIDERS)],
+                "modelType": "Synthetic",
+                "display": True,
+            }
+        )
+
+    arc_evaluations = []
+    for n in range(rows):
+        model = arc_models[n % model_count]
+        arc_evaluations.append(
+            {
+                "datasetId": dataset_ids[(n // model_count) % len(dataset_ids)],
+                "modelId": model["id"],
+                "score": round(rng.random(), 4),
+                "costPerTask": round(rng.lognormvariate(-1.0, 1.5), 4),
+                "resultsUrl": "",
+                "display": rng.random() > 0.02,
+            }
+        )
+
+    hle_models = []
+    hle_every = max(1, round(1 / hle_ratio)) if hle_ratio > 0 else model_count + 1
+    for i in range(0, model_count, hle_every):
+        scores = {"hle": round(rng.uniform(1, 50), 2), "hle_calibration_error": round(rng.uniform(5, 90), 1)}
+        if rng.random() > 0.5:
+            scores["arc_agi_2"] = round(rng.uniform(0, 80), 2)
+        for key in HLE_EXTRA_SCORES:
+            scores[key] = round(rng.uniform(0, 100), 2)
+        hle_models.append(
+            {
+                "name": f"Synthetic Model {i}",
+                "id": f"synthetic-model-{i}",
+                "provider": PROVIDERS[i % len(PROVIDERS)].lower(),
+                "scores": scores,
+                "model_size": "standard",
+            }
+        )
+
+    return {"arc_evaluations": arc_evaluations, "arc_models": arc_models, "hle_models": hle_models}
+
+
+def write_sources(out_dir: Path, rows: int, datasets: int = 6, seed: int = 0) -> dict[str, Path]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths: dict[str, Path] = {}
+    for name, payload in generate(rows, datasets=datasets, seed=seed).items():
+        path = out_dir / f"{name}.json"
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        paths[name] = path
+    return paths
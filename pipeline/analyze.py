@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
+from . import codec
 from .config import PROCESSED_DIR
+from .cube import build_cube
+from .downsample import timeline_resolutions
+from .milestones import align_milestones, load_milestones
+from .trends import release_ordinal, trend_payload
+from .uncertainty import annotate
 
 
 def _load_unified() -> list[dict[str, Any]]:
     path = PROCESSED_DIR / "unified_models.json"
     if not path.exists():
         raise FileNotFoundError(f"Missing unified records: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
+    return codec.read_json(path)
 
 
 def _safe_ratio(score: float | None, cost: float | None) -> float | None:
@@ -92,6 +97,11 @@ def build_analysis_payload() -> dict[str, Any]:
         for row in rows
         if row.get("release_date") and (row.get("arc_score") is not None or row.get("hle_score") is not None)
     ]
+    # By date, not string: "2024-9-01" must come before "2024-10-01".
+    timeline.sort(key=lambda x: (release_ordinal(x["release_date"]) or 0, x["release_date"]))
+    trend = trend_payload(timeline)
+    milestones = align_milestones(load_milestones(), trend)
+    uncertainty = annotate(efficiency, confidence, transfer)
 
     return {
         "summary": {
@@ -101,6 +111,7 @@ def build_analysis_payload() -> dict[str, Any]:
             "transfer_points": len(transfer),
             "timeline_points": len(timeline),
         },
+        "uncertainty": uncertainty,
         "efficiency_map": {
             "points": efficiency,
             "pareto_frontier": _pareto_frontier(efficiency),
@@ -118,17 +129,28 @@ def build_analysis_payload() -> dict[str, Any]:
             "assumption_note": "ARC and HLE scores are compared as percentages; semantics differ by benchmark.",
         },
         "twin_rivers": {
-            "points": sorted(timeline, key=lambda x: x.get("release_date") or ""),
+            "points": timeline,
+            "trend": trend,
+            "milestones": milestones,
+            "resolutions": timeline_resolutions(timeline, trend, milestones),
             "source": "https://arcprize.org/media/data/leaderboard/evaluations.json + https://dashboard.safe.ai/api/models",
-            "assumption_note": "Release dates may be missing or inferred by source systems.",
+            "assumption_note": (
+                "Release dates may be missing or inferred by source systems. "
+                "Trend lines fit log(score) to the running best; bands are 90% bootstrap intervals."
+            ),
         },
     }
 
 
+def build_cube_payload() -> dict[str, Any]:
+    """Provider × month × benchmark aggregates over the unified records."""
+    return build_cube(_load_unified())
+
+
 def write_analysis(payload: dict[str, Any]) -> Path:
     PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
     out_path = PROCESSED_DIR / "analysis.json"
-    out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    codec.write_json(out_path, payload, sort_keys=True)
     return out_path
 
 
@@ -0,0 +1,81 @@
+"""Colour and font themes for the static SVG charts.
+
+Chart geometry is laid out once with slot tokens (``SLOT.text`` and so on) in
+place of colours and fonts. compile_template() splits that text into literal
+pieces and slot names, after which each theme is a single join.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+
+_MARK = "\x00"
+
+
+@dataclass(frozen=True)
+class Theme:
+    background: str
+    text: str
+    muted: str
+    grid: str
+    arc: str
+    hle: str
+    bridge: str
+    gap_line: str
+    font: str = "system-ui, -apple-system, sans-serif"
+    mono: str = "ui-monospace, 'SF Mono', monospace"
+
+
+LIGHT = Theme(
+    background="#fbfdfb",
+    text="#1d2a1d",
+    muted="#5a6e58",
+    grid="#d3dfd4",
+    arc="#0f766e",
+    hle="#b91c1c",
+    bridge="#cad8cb",
+    gap_line="#a8bbb0",
+)
+
+DARK = Theme(
+    background="#111a14",
+    text="#e3ece3",
+    muted="#9fb3a0",
+    grid="#2c3b30",
+    arc="#2dd4bf",
+    hle="#f87171",
+    bridge="#3d5244",
+    gap_line="#4f6656",
+)
+
+# Theme name -> palette; "light" is the default and has no filename suffix.
+THEMES = {"light": LIGHT, "dark": DARK}
+
+
+class _Slots:
+    """Attribute access yields the token for that Theme field."""
+
+    def __getattr__(self, name: str) -> str:
+        if name not in _FIELDS:
+            raise AttributeError(name)
+        return f"{_MARK}{name}{_MARK}"
+
+
+_FIELDS = {f.name for f in fields(Theme)}
+SLOT = _Slots()
+
+
+def strip_marks(text: str) -> str:
+    """Remove the slot delimiter from untrusted text such as model names."""
+    return text.replace(_MARK, "")
+
+
+def compile_template(svg: str) -> list[str]:
+    """Split themed SVG text into literals (even indices) and slot names (odd)."""
+    return svg.split(_MARK)
+
+
+def render(template: list[str], theme: Theme) -> str:
+    out = template[:]
+    out[1::2] = [getattr(theme, name) for name in template[1::2]]
+    return "".join(out)
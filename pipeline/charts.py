@@ -1,38 +1,60 @@
-"""Generate static SVG chart previews for README."""
+"""Generate static SVG chart previews for README.
+
+Each chart is laid out once per frame (width class) with theme slots in place
+of colours and fonts; every theme is then a cheap substitution over that
+template (see chart_theme).
+"""
 
 from __future__ import annotations
 
-import json
 import math
+from dataclasses import dataclass
 from datetime import date as dt_date
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from . import codec, storage
+from .chart_theme import SLOT, THEMES, compile_template, render, strip_marks
+from .downsample import pick_resolution
+from .trends import release_ordinal
 
 ROOT = Path(__file__).resolve().parents[1]
 ANALYSIS_PATH = ROOT / "data" / "processed" / "analysis.json"
 OUT_DIR = ROOT / "assets" / "charts"
 
-W, H = 900, 420
-MARGIN = {"top": 60, "right": 30, "bottom": 50, "left": 70}
-IW = W - MARGIN["left"] - MARGIN["right"]
-IH = H - MARGIN["top"] - MARGIN["bottom"]
 
-ARC_COLOR = "#0f766e"
-HLE_COLOR = "#b91c1c"
-GRID_COLOR = "#d3dfd4"
-TEXT_COLOR = "#1d2a1d"
-MUTED_COLOR = "#5a6e58"
-BG_COLOR = "#fbfdfb"
-FONT = "system-ui, -apple-system, sans-serif"
-MONO = "ui-monospace, 'SF Mono', monospace"
+@dataclass(frozen=True)
+class Frame:
+    """Canvas size and label budget for one width class."""
+
+    width: int
+    height: int
+    margin: dict[str, int]
+    point_labels: int = 6  # most labelled points per scatter
+    min_label_gap: float = 0.0  # px between month labels on the timeline
+
+    @property
+    def iw(self) -> int:
+        return self.width - self.margin["left"] - self.margin["right"]
+
+    @property
+    def ih(self) -> int:
+        return self.height - self.margin["top"] - self.margin["bottom"]
+
+
+# Width class -> frame; "desktop" is the default and has no filename suffix.
+FRAMES = {
+    "desktop": Frame(900, 420, {"top": 60, "right": 30, "bottom": 50, "left": 70}),
+    "mobile": Frame(480, 400, {"top": 60, "right": 16, "bottom": 50, "left": 52}, point_labels=3, min_label_gap=56),
+}
 
 
 def _load() -> dict[str, Any]:
-    return json.loads(ANALYSIS_PATH.read_text(encoding="utf-8"))
+    return codec.read_json(ANALYSIS_PATH)
 
 
 def _esc(text: str) -> str:
-    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+    return strip_marks(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
 
 
 def _scale(v: float, lo: float, hi: float, dst_lo: float, dst_hi: float) -> float:
@@ -59,39 +81,38 @@ def _nice_ticks(lo: float, hi: float, count: int = 5) -> list[float]:
 
 
 def _write(name: str, content: str) -> None:
-    OUT_DIR.mkdir(parents=True, exist_ok=True)
-    (OUT_DIR / name).write_text(content, encoding="utf-8")
+    storage.write_if_changed(OUT_DIR / name, content.encode("utf-8"))
 
 
-def _header(title: str, subtitle: str) -> str:
+def _header(f: Frame, title: str, subtitle: str) -> str:
     return (
-        f'<svg xmlns="http://www.w3.org/2000/svg" width="{W}" height="{H}" viewBox="0 0 {W} {H}">'
-        f'<rect width="{W}" height="{H}" fill="{BG_COLOR}" rx="8"/>'
-        f'<text x="{MARGIN["left"]}" y="30" font-family="{FONT}" font-size="20" font-weight="700" fill="{TEXT_COLOR}">{_esc(title)}</text>'
-        f'<text x="{MARGIN["left"]}" y="48" font-family="{FONT}" font-size="12" fill="{MUTED_COLOR}">{_esc(subtitle)}</text>'
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{f.width}" height="{f.height}" viewBox="0 0 {f.width} {f.height}">'
+        f'<rect width="{f.width}" height="{f.height}" fill="{SLOT.background}" rx="8"/>'
+        f'<text x="{f.margin["left"]}" y="30" font-family="{SLOT.font}" font-size="20" font-weight="700" fill="{SLOT.text}">{_esc(title)}</text>'
+        f'<text x="{f.margin["left"]}" y="48" font-family="{SLOT.font}" font-size="12" fill="{SLOT.muted}">{_esc(subtitle)}</text>'
     )
 
 
-def _axes_xy(x_ticks: list[float], y_ticks: list[float],
+def _axes_xy(f: Frame, x_ticks: list[float], y_ticks: list[float],
              x_label: str, y_label: str,
              x_lo: float, x_hi: float, y_lo: float, y_hi: float) -> str:
-    ox, oy = MARGIN["left"], MARGIN["top"]
+    ox, oy = f.margin["left"], f.margin["top"]
     parts: list[str] = []
 
     for yv in y_ticks:
-        py = oy + _scale(yv, y_lo, y_hi, IH, 0)
-        parts.append(f'<line x1="{ox}" y1="{py:.1f}" x2="{ox + IW}" y2="{py:.1f}" stroke="{GRID_COLOR}" stroke-width="0.5"/>')
-        parts.append(f'<text x="{ox - 8}" y="{py + 4:.1f}" font-family="{MONO}" font-size="10" fill="{MUTED_COLOR}" text-anchor="end">{yv:g}</text>')
+        py = oy + _scale(yv, y_lo, y_hi, f.ih, 0)
+        parts.append(f'<line x1="{ox}" y1="{py:.1f}" x2="{ox + f.iw}" y2="{py:.1f}" stroke="{SLOT.grid}" stroke-width="0.5"/>')
+        parts.append(f'<text x="{ox - 8}" y="{py + 4:.1f}" font-family="{SLOT.mono}" font-size="10" fill="{SLOT.muted}" text-anchor="end">{yv:g}</text>')
 
     for xv in x_ticks:
-        px = ox + _scale(xv, x_lo, x_hi, 0, IW)
-        parts.append(f'<line x1="{px:.1f}" y1="{oy + IH}" x2="{px:.1f}" y2="{oy + IH + 5}" stroke="{GRID_COLOR}"/>')
-        parts.append(f'<text x="{px:.1f}" y="{oy + IH + 18}" font-family="{MONO}" font-size="10" fill="{MUTED_COLOR}" text-anchor="middle">{xv:g}</text>')
-
-    parts.append(f'<line x1="{ox}" y1="{oy}" x2="{ox}" y2="{oy + IH}" stroke="{GRID_COLOR}"/>')
-    parts.append(f'<line x1="{ox}" y1="{oy + IH}" x2="{ox + IW}" y2="{oy + IH}" stroke="{GRID_COLOR}"/>')
-    parts.append(f'<text x="{ox + IW / 2}" y="{oy + IH + 38}" font-family="{FONT}" font-size="11" fill="{MUTED_COLOR}" text-anchor="middle">{_esc(x_label)}</text>')
-    parts.append(f'<text x="14" y="{oy + IH / 2}" font-family="{FONT}" font-size="11" fill="{MUTED_COLOR}" text-anchor="middle" transform="rotate(-90, 14, {oy + IH / 2})">{_esc(y_label)}</text>')
+        px = ox + _scale(xv, x_lo, x_hi, 0, f.iw)
+        parts.append(f'<line x1="{px:.1f}" y1="{oy + f.ih}" x2="{px:.1f}" y2="{oy + f.ih + 5}" stroke="{SLOT.grid}"/>')
+        parts.append(f'<text x="{px:.1f}" y="{oy + f.ih + 18}" font-family="{SLOT.mono}" font-size="10" fill="{SLOT.muted}" text-anchor="middle">{xv:g}</text>')
+
+    parts.append(f'<line x1="{ox}" y1="{oy}" x2="{ox}" y2="{oy + f.ih}" stroke="{SLOT.grid}"/>')
+    parts.append(f'<line x1="{ox}" y1="{oy + f.ih}" x2="{ox + f.iw}" y2="{oy + f.ih}" stroke="{SLOT.grid}"/>')
+    parts.append(f'<text x="{ox + f.iw / 2}" y="{oy + f.ih + 38}" font-family="{SLOT.font}" font-size="11" fill="{SLOT.muted}" text-anchor="middle">{_esc(x_label)}</text>')
+    parts.append(f'<text x="14" y="{oy + f.ih / 2}" font-family="{SLOT.font}" font-size="11" fill="{SLOT.muted}" text-anchor="middle" transform="rotate(-90, 14, {oy + f.ih / 2})">{_esc(y_label)}</text>')
     return "\n".join(parts)
 
 
@@ -100,18 +121,18 @@ def _legend(items: list[tuple[str, str]], x: float, y: float) -> str:
     cx = x
     for label, color in items:
         parts.append(f'<circle cx="{cx}" cy="{y}" r="4" fill="{color}"/>')
-        parts.append(f'<text x="{cx + 8}" y="{y + 3}" font-family="{FONT}" font-size="10" fill="{MUTED_COLOR}">{_esc(label)}</text>')
+        parts.append(f'<text x="{cx + 8}" y="{y + 3}" font-family="{SLOT.font}" font-size="10" fill="{SLOT.muted}">{_esc(label)}</text>')
         cx += len(label) * 6.5 + 24
     return "\n".join(parts)
 
 
-def _gen_efficiency(data: dict) -> None:
+def _efficiency(data: dict, f: Frame) -> str | None:
     pts = [p for p in data.get("efficiency_map", {}).get("points", []) if p["cost_per_task"] > 0 and p["score"] > 0]
     pareto = data.get("efficiency_map", {}).get("pareto_frontier", [])
     if not pts:
-        return
+        return None
 
-    ox, oy = MARGIN["left"], MARGIN["top"]
+    ox, oy = f.margin["left"], f.margin["top"]
     scores = [p["score"] for p in pts]
     costs = [p["cost_per_task"] for p in pts]
     x_lo, x_hi = min(costs), max(costs)
@@ -120,39 +141,39 @@ def _gen_efficiency(data: dict) -> None:
     y_ticks = _nice_ticks(0, y_hi)
     y_hi = max(y_ticks) if y_ticks else y_hi
 
-    out = [_header("Efficiency Illusion Map", f"{len(pts)} models | Cost per task vs ARC score")]
-    out.append(_axes_xy(x_ticks, y_ticks, "Cost per task (USD)", "ARC score (%)", x_lo, x_hi, 0, y_hi))
-    out.append(_legend([("Models", ARC_COLOR), ("Pareto frontier", HLE_COLOR)], ox, oy - 14))
+    out = [_header(f, "Efficiency Illusion Map", f"{len(pts)} models | Cost per task vs ARC score")]
+    out.append(_axes_xy(f, x_ticks, y_ticks, "Cost per task (USD)", "ARC score (%)", x_lo, x_hi, 0, y_hi))
+    out.append(_legend([("Models", SLOT.arc), ("Pareto frontier", SLOT.hle)], ox, oy - 14))
 
     for p in pts:
-        px = ox + _scale(p["cost_per_task"], x_lo, x_hi, 0, IW)
-        py = oy + _scale(p["score"], 0, y_hi, IH, 0)
-        out.append(f'<circle cx="{px:.1f}" cy="{py:.1f}" r="4" fill="{ARC_COLOR}" opacity="0.5"/>')
+        px = ox + _scale(p["cost_per_task"], x_lo, x_hi, 0, f.iw)
+        py = oy + _scale(p["score"], 0, y_hi, f.ih, 0)
+        out.append(f'<circle cx="{px:.1f}" cy="{py:.1f}" r="4" fill="{SLOT.arc}" opacity="0.5"/>')
 
     pareto_ok = [p for p in pareto if p.get("cost_per_task", 0) > 0]
     if len(pareto_ok) >= 2:
         d_parts = []
         for i, p in enumerate(pareto_ok):
-            px = ox + _scale(p["cost_per_task"], x_lo, x_hi, 0, IW)
-            py = oy + _scale(p["score"], 0, y_hi, IH, 0)
+            px = ox + _scale(p["cost_per_task"], x_lo, x_hi, 0, f.iw)
+            py = oy + _scale(p["score"], 0, y_hi, f.ih, 0)
             d_parts.append(f"{'M' if i == 0 else 'L'}{px:.1f},{py:.1f}")
-        out.append(f'<path d="{" ".join(d_parts)}" fill="none" stroke="{HLE_COLOR}" stroke-width="2"/>')
+        out.append(f'<path d="{" ".join(d_parts)}" fill="none" stroke="{SLOT.hle}" stroke-width="2"/>')
 
-    for p in sorted(pts, key=lambda p: p["score"], reverse=True)[:6]:
-        px = ox + _scale(p["cost_per_task"], x_lo, x_hi, 0, IW)
-        py = oy + _scale(p["score"], 0, y_hi, IH, 0)
-        out.append(f'<text x="{px + 6:.1f}" y="{py - 6:.1f}" font-family="{MONO}" font-size="9" fill="{TEXT_COLOR}">{_esc(p["model"][:20])}</text>')
+    for p in sorted(pts, key=lambda p: p["score"], reverse=True)[: f.point_labels]:
+        px = ox + _scale(p["cost_per_task"], x_lo, x_hi, 0, f.iw)
+        py = oy + _scale(p["score"], 0, y_hi, f.ih, 0)
+        out.append(f'<text x="{px + 6:.1f}" y="{py - 6:.1f}" font-family="{SLOT.mono}" font-size="9" fill="{SLOT.text}">{_esc(p["model"][:20])}</text>')
 
     out.append("</svg>")
-    _write("efficiency-map.svg", "\n".join(out))
+    return "\n".join(out)
 
 
-def _gen_confidence(data: dict) -> None:
+def _confidence(data: dict, f: Frame) -> str | None:
     pts = data.get("confidence_lens", {}).get("points", [])
     if not pts:
-        return
+        return None
 
-    ox, oy = MARGIN["left"], MARGIN["top"]
+    ox, oy = f.margin["left"], f.margin["top"]
     x_hi = max(p["hle_score"] for p in pts)
     y_hi = max(p["calibration_error"] for p in pts)
     x_ticks = _nice_ticks(0, x_hi)
@@ -160,34 +181,34 @@ def _gen_confidence(data: dict) -> None:
     x_hi = max(x_ticks) if x_ticks else x_hi
     y_hi = max(y_ticks) if y_ticks else y_hi
 
-    out = [_header("Confidence vs Competence", f"{len(pts)} models | HLE accuracy vs calibration error")]
-    out.append(_axes_xy(x_ticks, y_ticks, "HLE accuracy (%)", "Calibration error (lower = better)", 0, x_hi, 0, y_hi))
-    out.append(_legend([("Model (size = ARC score)", ARC_COLOR)], ox, oy - 14))
+    out = [_header(f, "Confidence vs Competence", f"{len(pts)} models | HLE accuracy vs calibration error")]
+    out.append(_axes_xy(f, x_ticks, y_ticks, "HLE accuracy (%)", "Calibration error (lower = better)", 0, x_hi, 0, y_hi))
+    out.append(_legend([("Model (size = ARC score)", SLOT.arc)], ox, oy - 14))
 
     # Quadrant hints
-    out.append(f'<text x="{ox + IW - 4}" y="{oy + IH - 8}" font-family="{FONT}" font-size="9" fill="{MUTED_COLOR}" text-anchor="end" opacity="0.6">Ideal: accurate &amp; calibrated</text>')
-    out.append(f'<text x="{ox + 4}" y="{oy + 12}" font-family="{FONT}" font-size="9" fill="{MUTED_COLOR}" opacity="0.6">Danger: overconfident</text>')
+    out.append(f'<text x="{ox + f.iw - 4}" y="{oy + f.ih - 8}" font-family="{SLOT.font}" font-size="9" fill="{SLOT.muted}" text-anchor="end" opacity="0.6">Ideal: accurate &amp; calibrated</text>')
+    out.append(f'<text x="{ox + 4}" y="{oy + 12}" font-family="{SLOT.font}" font-size="9" fill="{SLOT.muted}" opacity="0.6">Danger: overconfident</text>')
 
     for p in pts:
-        px = ox + _scale(p["hle_score"], 0, x_hi, 0, IW)
-        py = oy + _scale(p["calibration_error"], 0, y_hi, IH, 0)
+        px = ox + _scale(p["hle_score"], 0, x_hi, 0, f.iw)
+        py = oy + _scale(p["calibration_error"], 0, y_hi, f.ih, 0)
         arc = p.get("arc_agi_2") or 10
         r = max(3, min(12, math.sqrt(arc) * 1.3))
-        out.append(f'<circle cx="{px:.1f}" cy="{py:.1f}" r="{r:.1f}" fill="{ARC_COLOR}" opacity="0.5"/>')
+        out.append(f'<circle cx="{px:.1f}" cy="{py:.1f}" r="{r:.1f}" fill="{SLOT.arc}" opacity="0.5"/>')
 
-    for p in sorted(pts, key=lambda p: p["hle_score"], reverse=True)[:6]:
-        px = ox + _scale(p["hle_score"], 0, x_hi, 0, IW)
-        py = oy + _scale(p["calibration_error"], 0, y_hi, IH, 0)
-        out.append(f'<text x="{px + 6:.1f}" y="{py - 6:.1f}" font-family="{MONO}" font-size="9" fill="{TEXT_COLOR}">{_esc(p["model"][:20])}</text>')
+    for p in sorted(pts, key=lambda p: p["hle_score"], reverse=True)[: f.point_labels]:
+        px = ox + _scale(p["hle_score"], 0, x_hi, 0, f.iw)
+        py = oy + _scale(p["calibration_error"], 0, y_hi, f.ih, 0)
+        out.append(f'<text x="{px + 6:.1f}" y="{py - 6:.1f}" font-family="{SLOT.mono}" font-size="9" fill="{SLOT.text}">{_esc(p["model"][:20])}</text>')
 
     out.append("</svg>")
-    _write("confidence-lens.svg", "\n".join(out))
+    return "\n".join(out)
 
 
-def _gen_transfer_gap(data: dict) -> None:
+def _transfer_gap(data: dict, f: Frame) -> str | None:
     pts = data.get("transfer_gap", {}).get("points", [])[:18]
     if not pts:
-        return
+        return None
 
     all_s = [p["arc_agi_2"] for p in pts] + [p["hle"] for p in pts]
     x_hi = max(all_s) if all_s else 100
@@ -195,55 +216,59 @@ def _gen_transfer_gap(data: dict) -> None:
     x_hi = max(x_ticks) if x_ticks else x_hi
 
     row_h = 22
-    ch = MARGIN["top"] + len(pts) * row_h + MARGIN["bottom"]
-    ox = MARGIN["left"] + 90
-    iw = W - ox - MARGIN["right"]
+    ch = f.margin["top"] + len(pts) * row_h + f.margin["bottom"]
+    ox = f.margin["left"] + 90
+    iw = f.width - ox - f.margin["right"]
 
     out = [
-        f'<svg xmlns="http://www.w3.org/2000/svg" width="{W}" height="{ch}" viewBox="0 0 {W} {ch}">',
-        f'<rect width="{W}" height="{ch}" fill="{BG_COLOR}" rx="8"/>',
-        f'<text x="{ox}" y="30" font-family="{FONT}" font-size="20" font-weight="700" fill="{TEXT_COLOR}">Transfer Gap Matrix</text>',
-        f'<text x="{ox}" y="48" font-family="{FONT}" font-size="12" fill="{MUTED_COLOR}">{len(pts)} models | ARC-AGI vs HLE score gap</text>',
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{f.width}" height="{ch}" viewBox="0 0 {f.width} {ch}">',
+        f'<rect width="{f.width}" height="{ch}" fill="{SLOT.background}" rx="8"/>',
+        f'<text x="{ox}" y="30" font-family="{SLOT.font}" font-size="20" font-weight="700" fill="{SLOT.text}">Transfer Gap Matrix</text>',
+        f'<text x="{ox}" y="48" font-family="{SLOT.font}" font-size="12" fill="{SLOT.muted}">{len(pts)} models | ARC-AGI vs HLE score gap</text>',
     ]
-    out.append(_legend([("ARC-AGI", ARC_COLOR), ("HLE", HLE_COLOR)], ox, MARGIN["top"] - 14))
+    out.append(_legend([("ARC-AGI", SLOT.arc), ("HLE", SLOT.hle)], ox, f.margin["top"] - 14))
 
-    bottom = MARGIN["top"] + len(pts) * row_h
+    bottom = f.margin["top"] + len(pts) * row_h
     for xv in x_ticks:
         px = ox + _scale(xv, 0, x_hi, 0, iw)
-        out.append(f'<line x1="{px:.1f}" y1="{MARGIN["top"]}" x2="{px:.1f}" y2="{bottom}" stroke="{GRID_COLOR}" stroke-width="0.5"/>')
-        out.append(f'<text x="{px:.1f}" y="{bottom + 16}" font-family="{MONO}" font-size="10" fill="{MUTED_COLOR}" text-anchor="middle">{xv:g}</text>')
-    out.append(f'<text x="{ox + iw / 2}" y="{bottom + 36}" font-family="{FONT}" font-size="11" fill="{MUTED_COLOR}" text-anchor="middle">Score (%)</text>')
+        out.append(f'<line x1="{px:.1f}" y1="{f.margin["top"]}" x2="{px:.1f}" y2="{bottom}" stroke="{SLOT.grid}" stroke-width="0.5"/>')
+        out.append(f'<text x="{px:.1f}" y="{bottom + 16}" font-family="{SLOT.mono}" font-size="10" fill="{SLOT.muted}" text-anchor="middle">{xv:g}</text>')
+    out.append(f'<text x="{ox + iw / 2}" y="{bottom + 36}" font-family="{SLOT.font}" font-size="11" fill="{SLOT.muted}" text-anchor="middle">Score (%)</text>')
 
     for i, p in enumerate(pts):
-        cy = MARGIN["top"] + i * row_h + row_h / 2
+        cy = f.margin["top"] + i * row_h + row_h / 2
         arc_x = ox + _scale(p["arc_agi_2"], 0, x_hi, 0, iw)
         hle_x = ox + _scale(p["hle"], 0, x_hi, 0, iw)
         x1, x2 = min(arc_x, hle_x), max(arc_x, hle_x)
 
-        out.append(f'<text x="{ox - 6}" y="{cy + 3:.1f}" font-family="{MONO}" font-size="9" fill="{MUTED_COLOR}" text-anchor="end">{_esc(p["model"][:18])}</text>')
-        out.append(f'<line x1="{x1:.1f}" y1="{cy:.1f}" x2="{x2:.1f}" y2="{cy:.1f}" stroke="#a8bbb0" stroke-width="2"/>')
-        out.append(f'<circle cx="{arc_x:.1f}" cy="{cy:.1f}" r="4" fill="{ARC_COLOR}"/>')
-        out.append(f'<circle cx="{hle_x:.1f}" cy="{cy:.1f}" r="4" fill="{HLE_COLOR}"/>')
-        out.append(f'<text x="{x2 + 8:.1f}" y="{cy + 3:.1f}" font-family="{MONO}" font-size="9" fill="{TEXT_COLOR}">{p["gap"]:+.1f}</text>')
+        out.append(f'<text x="{ox - 6}" y="{cy + 3:.1f}" font-family="{SLOT.mono}" font-size="9" fill="{SLOT.muted}" text-anchor="end">{_esc(p["model"][:18])}</text>')
+        out.append(f'<line x1="{x1:.1f}" y1="{cy:.1f}" x2="{x2:.1f}" y2="{cy:.1f}" stroke="{SLOT.gap_line}" stroke-width="2"/>')
+        out.append(f'<circle cx="{arc_x:.1f}" cy="{cy:.1f}" r="4" fill="{SLOT.arc}"/>')
+        out.append(f'<circle cx="{hle_x:.1f}" cy="{cy:.1f}" r="4" fill="{SLOT.hle}"/>')
+        out.append(f'<text x="{x2 + 8:.1f}" y="{cy + 3:.1f}" font-family="{SLOT.mono}" font-size="9" fill="{SLOT.text}">{p["gap"]:+.1f}</text>')
 
     out.append("</svg>")
-    _write("transfer-gap.svg", "\n".join(out))
+    return "\n".join(out)
 
 
-def _gen_twin_rivers(data: dict) -> None:
-    raw = [p for p in data.get("twin_rivers", {}).get("points", []) if p.get("release_date")]
+def _twin_rivers(data: dict, f: Frame) -> str | None:
+    twin = data.get("twin_rivers", {})
     dated = []
-    for p in raw:
-        try:
-            y, m, d = p["release_date"].split("-")
-            dd = dt_date(int(y), int(m), int(d))
-            dated.append({**p, "_ord": dd.toordinal(), "_d": dd})
-        except (ValueError, IndexError):
-            pass
+    for i, p in enumerate(twin.get("points", [])):
+        ordinal = release_ordinal(p.get("release_date"))
+        if ordinal is not None:
+            dated.append({**p, "_i": i, "_ord": ordinal, "_d": dt_date.fromordinal(ordinal)})
     if not dated:
-        return
+        return None
 
-    ox, oy = MARGIN["left"], MARGIN["top"]
+    # Draw at most the resolution the plot width can show; None keeps every point.
+    resolution = pick_resolution(twin.get("resolutions", []), f.iw)
+    if resolution:
+        arc_keep, hle_keep = set(resolution["arc"]), set(resolution["hle"])
+    else:
+        arc_keep = hle_keep = {p["_i"] for p in dated}
+
+    ox, oy = f.margin["left"], f.margin["top"]
     ords = [p["_ord"] for p in dated]
     all_s = [p.get("arc_score", 0) or 0 for p in dated] + [p.get("hle_score", 0) or 0 for p in dated]
     x_lo, x_hi = min(ords), max(ords)
@@ -251,61 +276,136 @@ def _gen_twin_rivers(data: dict) -> None:
     y_ticks = _nice_ticks(0, y_hi)
     y_hi = max(y_ticks) if y_ticks else y_hi
 
-    out = [_header("Twin Rivers Timeline", f"{len(dated)} models | ARC-AGI and HLE scores over time")]
-    out.append(_legend([("ARC-AGI", ARC_COLOR), ("HLE", HLE_COLOR)], ox, oy - 14))
+    out = [_header(f, "Twin Rivers Timeline", f"{len(dated)} models | ARC-AGI and HLE scores over time")]
+    out.append(_legend([("ARC-AGI", SLOT.arc), ("HLE", SLOT.hle), ("Running best + log-linear trend", SLOT.muted)], ox, oy - 14))
 
     # Y grid
     for yv in y_ticks:
-        py = oy + _scale(yv, 0, y_hi, IH, 0)
-        out.append(f'<line x1="{ox}" y1="{py:.1f}" x2="{ox + IW}" y2="{py:.1f}" stroke="{GRID_COLOR}" stroke-width="0.5"/>')
-        out.append(f'<text x="{ox - 8}" y="{py + 4:.1f}" font-family="{MONO}" font-size="10" fill="{MUTED_COLOR}" text-anchor="end">{yv:g}</text>')
+        py = oy + _scale(yv, 0, y_hi, f.ih, 0)
+        out.append(f'<line x1="{ox}" y1="{py:.1f}" x2="{ox + f.iw}" y2="{py:.1f}" stroke="{SLOT.grid}" stroke-width="0.5"/>')
+        out.append(f'<text x="{ox - 8}" y="{py + 4:.1f}" font-family="{SLOT.mono}" font-size="10" fill="{SLOT.muted}" text-anchor="end">{yv:g}</text>')
 
     # X labels (unique months)
     seen_months: set[tuple[int, int]] = set()
+    last_px = -math.inf
     for p in sorted(dated, key=lambda x: x["_ord"]):
         ym = (p["_d"].year, p["_d"].month)
         if ym not in seen_months:
             seen_months.add(ym)
-            px = ox + _scale(p["_ord"], x_lo, x_hi, 0, IW)
-            out.append(f'<text x="{px:.1f}" y="{oy + IH + 16}" font-family="{MONO}" font-size="9" fill="{MUTED_COLOR}" text-anchor="middle">{p["_d"].strftime("%b %Y")}</text>')
-
-    out.append(f'<line x1="{ox}" y1="{oy}" x2="{ox}" y2="{oy + IH}" stroke="{GRID_COLOR}"/>')
-    out.append(f'<line x1="{ox}" y1="{oy + IH}" x2="{ox + IW}" y2="{oy + IH}" stroke="{GRID_COLOR}"/>')
-    out.append(f'<text x="{ox + IW / 2}" y="{oy + IH + 38}" font-family="{FONT}" font-size="11" fill="{MUTED_COLOR}" text-anchor="middle">Release date</text>')
-    out.append(f'<text x="14" y="{oy + IH / 2}" font-family="{FONT}" font-size="11" fill="{MUTED_COLOR}" text-anchor="middle" transform="rotate(-90, 14, {oy + IH / 2})">Score (%)</text>')
+            px = ox + _scale(p["_ord"], x_lo, x_hi, 0, f.iw)
+            if px - last_px < f.min_label_gap:
+                continue
+            last_px = px
+            out.append(f'<text x="{px:.1f}" y="{oy + f.ih + 16}" font-family="{SLOT.mono}" font-size="9" fill="{SLOT.muted}" text-anchor="middle">{p["_d"].strftime("%b %Y")}</text>')
+
+    out.append(f'<line x1="{ox}" y1="{oy}" x2="{ox}" y2="{oy + f.ih}" stroke="{SLOT.grid}"/>')
+    out.append(f'<line x1="{ox}" y1="{oy + f.ih}" x2="{ox + f.iw}" y2="{oy + f.ih}" stroke="{SLOT.grid}"/>')
+    out.append(f'<text x="{ox + f.iw / 2}" y="{oy + f.ih + 38}" font-family="{SLOT.font}" font-size="11" fill="{SLOT.muted}" text-anchor="middle">Release date</text>')
+    out.append(f'<text x="14" y="{oy + f.ih / 2}" font-family="{SLOT.font}" font-size="11" fill="{SLOT.muted}" text-anchor="middle" transform="rotate(-90, 14, {oy + f.ih / 2})">Score (%)</text>')
+
+    # Trend bands and running-best steps
+    trend = data.get("twin_rivers", {}).get("trend", {})
+    for key, color in (("arc", SLOT.arc), ("hle", SLOT.hle)):
+        series = trend.get(key, {})
+        band = [b for b in series.get("band", []) if b.get("lo") is not None and b.get("hi") is not None]
+        band_pts = [(release_ordinal(b["release_date"]), b) for b in band]
+        band_pts = [(o, b) for o, b in band_pts if o is not None and x_lo <= o <= x_hi]
+        if len(band_pts) >= 2:
+            upper = [f"{ox + _scale(o, x_lo, x_hi, 0, f.iw):.1f},{oy + _scale(min(b['hi'], y_hi), 0, y_hi, f.ih, 0):.1f}" for o, b in band_pts]
+            lower = [f"{ox + _scale(o, x_lo, x_hi, 0, f.iw):.1f},{oy + _scale(min(b['lo'], y_hi), 0, y_hi, f.ih, 0):.1f}" for o, b in reversed(band_pts)]
+            out.append(f'<polygon points="{" ".join(upper + lower)}" fill="{color}" opacity="0.08"/>')
+            fit_d = " ".join(
+                f"{'M' if i == 0 else 'L'}{ox + _scale(o, x_lo, x_hi, 0, f.iw):.1f},{oy + _scale(min(b['fit'], y_hi), 0, y_hi, f.ih, 0):.1f}"
+                for i, (o, b) in enumerate(band_pts)
+            )
+            out.append(f'<path d="{fit_d}" fill="none" stroke="{color}" stroke-width="1" stroke-dasharray="4,3" opacity="0.6"/>')
+
+        frontier = series.get("frontier", [])
+        if resolution:
+            frontier = [frontier[i] for i in resolution["frontier"][key]]
+        steps = [(release_ordinal(s["release_date"]), s["score"]) for s in frontier]
+        steps = [(o, v) for o, v in steps if o is not None]
+        if steps:
+            d_parts = []
+            for i, (o, v) in enumerate(steps):
+                px = ox + _scale(o, x_lo, x_hi, 0, f.iw)
+                py = oy + _scale(v, 0, y_hi, f.ih, 0)
+                if i == 0:
+                    d_parts.append(f"M{px:.1f},{py:.1f}")
+                else:
+                    d_parts.append(f"H{px:.1f} V{py:.1f}")
+            d_parts.append(f"H{ox + f.iw:.1f}")
+            out.append(f'<path d="{" ".join(d_parts)}" fill="none" stroke="{color}" stroke-width="1.5" opacity="0.7"/>')
+
+    # Milestone goalposts: held until the running best first beats them
+    for m in data.get("twin_rivers", {}).get("milestones", []):
+        m_ord = release_ordinal(m.get("date"))
+        if m_ord is None or m_ord > x_hi or m.get("score") is None:
+            continue
+        color = SLOT.arc if m.get("series") == "arc" else SLOT.hle
+        end_ord = release_ordinal(m.get("surpassed_on")) or x_hi
+        x1 = ox + _scale(max(m_ord, x_lo), x_lo, x_hi, 0, f.iw)
+        x2 = ox + _scale(min(max(end_ord, m_ord, x_lo), x_hi), x_lo, x_hi, 0, f.iw)
+        py = oy + _scale(min(m["score"], y_hi), 0, y_hi, f.ih, 0)
+        out.append(f'<line x1="{x1:.1f}" y1="{py:.1f}" x2="{x2:.1f}" y2="{py:.1f}" stroke="{color}" stroke-width="1" stroke-dasharray="2,2" opacity="0.8"/>')
+        out.append(f'<path d="M{x1:.1f},{py - 4:.1f} L{x1 + 4:.1f},{py:.1f} L{x1:.1f},{py + 4:.1f} L{x1 - 4:.1f},{py:.1f} Z" fill="{SLOT.background}" stroke="{color}"/>')
+        label = f'{m["benchmark"]} {m["score"]:g}%'
+        if m.get("already_surpassed"):
+            label += " | already beaten"
+        elif m.get("days_to_surpass") is not None:
+            label += f' | beaten in {m["days_to_surpass"]}d'
+        out.append(f'<text x="{x1 + 6:.1f}" y="{py - 5:.1f}" font-family="{SLOT.mono}" font-size="8" fill="{SLOT.muted}">{_esc(label)}</text>')
 
     # Bridges
     for p in dated:
-        if p.get("arc_score") is not None and p.get("hle_score") is not None:
-            px = ox + _scale(p["_ord"], x_lo, x_hi, 0, IW)
-            out.append(f'<line x1="{px:.1f}" y1="{oy + _scale(p["arc_score"], 0, y_hi, IH, 0):.1f}" x2="{px:.1f}" y2="{oy + _scale(p["hle_score"], 0, y_hi, IH, 0):.1f}" stroke="#cad8cb" stroke-width="1"/>')
+        if p.get("arc_score") is not None and p.get("hle_score") is not None and p["_i"] in arc_keep and p["_i"] in hle_keep:
+            px = ox + _scale(p["_ord"], x_lo, x_hi, 0, f.iw)
+            out.append(f'<line x1="{px:.1f}" y1="{oy + _scale(p["arc_score"], 0, y_hi, f.ih, 0):.1f}" x2="{px:.1f}" y2="{oy + _scale(p["hle_score"], 0, y_hi, f.ih, 0):.1f}" stroke="{SLOT.bridge}" stroke-width="1"/>')
 
     # Dots
     for p in dated:
-        px = ox + _scale(p["_ord"], x_lo, x_hi, 0, IW)
-        if p.get("arc_score") is not None:
-            py = oy + _scale(p["arc_score"], 0, y_hi, IH, 0)
-            out.append(f'<circle cx="{px:.1f}" cy="{py:.1f}" r="4" fill="{ARC_COLOR}"/>')
-        if p.get("hle_score") is not None:
-            py = oy + _scale(p["hle_score"], 0, y_hi, IH, 0)
-            out.append(f'<circle cx="{px:.1f}" cy="{py:.1f}" r="4" fill="{HLE_COLOR}"/>')
+        px = ox + _scale(p["_ord"], x_lo, x_hi, 0, f.iw)
+        if p.get("arc_score") is not None and p["_i"] in arc_keep:
+            py = oy + _scale(p["arc_score"], 0, y_hi, f.ih, 0)
+            out.append(f'<circle cx="{px:.1f}" cy="{py:.1f}" r="4" fill="{SLOT.arc}"/>')
+        if p.get("hle_score") is not None and p["_i"] in hle_keep:
+            py = oy + _scale(p["hle_score"], 0, y_hi, f.ih, 0)
+            out.append(f'<circle cx="{px:.1f}" cy="{py:.1f}" r="4" fill="{SLOT.hle}"/>')
 
     # Label top-5
-    for p in sorted(dated, key=lambda p: p.get("arc_score", 0) or 0, reverse=True)[:5]:
-        px = ox + _scale(p["_ord"], x_lo, x_hi, 0, IW)
-        py = oy + _scale(p.get("arc_score", 0) or 0, 0, y_hi, IH, 0)
-        out.append(f'<text x="{px + 6:.1f}" y="{py - 6:.1f}" font-family="{MONO}" font-size="9" fill="{TEXT_COLOR}">{_esc(p["model"][:18])}</text>')
+    for p in sorted(dated, key=lambda p: p.get("arc_score", 0) or 0, reverse=True)[: min(5, f.point_labels)]:
+        px = ox + _scale(p["_ord"], x_lo, x_hi, 0, f.iw)
+        py = oy + _scale(p.get("arc_score", 0) or 0, 0, y_hi, f.ih, 0)
+        out.append(f'<text x="{px + 6:.1f}" y="{py - 6:.1f}" font-family="{SLOT.mono}" font-size="9" fill="{SLOT.text}">{_esc(p["model"][:18])}</text>')
 
     out.append("</svg>")
-    _write("twin-rivers.svg", "\n".join(out))
+    return "\n".join(out)
+
+
+CHARTS: tuple[tuple[str, Callable[[dict, Frame], str | None]], ...] = (
+    ("efficiency-map", _efficiency),
+    ("confidence-lens", _confidence),
+    ("transfer-gap", _transfer_gap),
+    ("twin-rivers", _twin_rivers),
+)
+
+
+def variant_name(chart: str, frame: str, theme: str) -> str:
+    """``twin-rivers.svg`` for desktop/light, else e.g. ``twin-rivers.mobile.dark.svg``."""
+    suffix = "".join(f".{part}" for part in (frame, theme) if part not in ("desktop", "light"))
+    return f"{chart}{suffix}.svg"
 
 
 def generate() -> None:
     data = _load()
-    _gen_efficiency(data)
-    _gen_confidence(data)
-    _gen_transfer_gap(data)
-    _gen_twin_rivers(data)
+    for frame_name, frame in FRAMES.items():
+        for chart, layout in CHARTS:
+            svg = layout(data, frame)
+            if svg is None:
+                continue
+            template = compile_template(svg)
+            for theme_name, theme in THEMES.items():
+                _write(variant_name(chart, frame_name, theme_name), render(template, theme))
 
 
 if __name__ == "__main__":
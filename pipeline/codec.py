@@ -0,0 +1,86 @@
+"""JSON encoding and decoding shared by every pipeline stage.
+
+Uses orjson when it is installed and falls back to the stdlib ``json``
+module. Set ``ATLAS_JSON_BACKEND=stdlib`` (or ``orjson``) to force one.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from . import storage
+
+BACKEND_ENV = "ATLAS_JSON_BACKEND"
+BACKENDS = ("orjson", "stdlib")
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one type covers both.
+DecodeError = json.JSONDecodeError
+
+_orjson: ModuleType | None = None
+_backend = "stdlib"
+
+
+def set_backend(name: str | None = None) -> str:
+    """Select a backend by name, or the fastest installed one when ``name`` is None."""
+    global _orjson, _backend
+    requested = name or os.environ.get(BACKEND_ENV) or "auto"
+    if requested not in (*BACKENDS, "auto"):
+        raise ValueError(f"Unknown JSON backend {requested!r}; expected one of {BACKENDS}")
+
+    _orjson, _backend = None, "stdlib"
+    if requested in ("orjson", "auto"):
+        try:
+            import orjson
+        except ImportError:
+            if requested == "orjson":
+                raise
+        else:
+            _orjson, _backend = orjson, "orjson"
+    return _backend
+
+
+def backend() -> str:
+    return _backend
+
+
+def loads(data: str | bytes) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumpb(obj: Any, pretty: bool = True, sort_keys: bool = False) -> bytes:
+    """Encode to UTF-8 bytes; ``pretty`` gives the 2-space indented form."""
+    if _orjson is not None:
+        option = _orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= _orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= _orjson.OPT_SORT_KEYS
+        return _orjson.dumps(obj, option=option)
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys)
+    return text.encode("utf-8")
+
+
+def dumps(obj: Any, pretty: bool = True, sort_keys: bool = False) -> str:
+    return dumpb(obj, pretty=pretty, sort_keys=sort_keys).decode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    return loads(path.read_bytes())
+
+
+def write_json(path: Path, obj: Any, pretty: bool = True, sort_keys: bool = False) -> Path:
+    """Encode ``obj`` and write it atomically, skipping the write if unchanged."""
+    storage.write_if_changed(path, dumpb(obj, pretty=pretty, sort_keys=sort_keys))
+    return path
+
+
+set_backend()
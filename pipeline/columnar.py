@@ -0,0 +1,227 @@
+"""Optional typed columnar export of the unified table, analysis views and aggregates.
+
+Writes Arrow IPC files (memory-mappable without copying) or Parquet under
+``data/processed/columnar/``. Needs pyarrow (``pip install -e .[columnar]``);
+the JSON outputs used by the site are unaffected. The HLE subject tables are
+only written when hle_subjects.json exists; their per-cell calibration bins
+stay in the JSON.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable
+
+from . import codec, storage
+from .config import PROCESSED_DIR
+from .transform import arc_evaluation_rows
+
+COLUMNAR_DIR = PROCESSED_DIR / "columnar"
+FORMATS = {"arrow": ".arrow", "parquet": ".parquet"}
+
+# Column name -> logical type; "dict" columns are dictionary-encoded strings.
+UNIFIED_COLUMNS = {
+    "model_key": "dict",
+    "canonical_name": "dict",
+    "provider": "dict",
+    "release_date": "date",
+    "arc_score": "float",
+    "arc_cost_per_task": "float",
+    "arc_tasks_evaluated": "int",
+    "hle_score": "float",
+    "calibration_error": "float",
+    "hle_arc_agi_2": "float",
+    "source_arc": "dict",
+    "source_hle": "dict",
+}
+
+ARC_RESULT_COLUMNS = {
+    "dataset_id": "dict",
+    "model_id": "dict",
+    "model_key": "dict",
+    "model": "dict",
+    "provider": "dict",
+    "score": "float",
+    "cost_per_task": "float",
+    "display": "bool",
+}
+
+# Table name -> (analysis section, list key, columns).
+VIEW_TABLES = {
+    "efficiency_map": (
+        "efficiency_map",
+        "points",
+        {
+            "model": "dict",
+            "provider": "dict",
+            "score": "float",
+            "cost_per_task": "float",
+            "tasks_evaluated": "int",
+            "efficiency_ratio": "float",
+        },
+    ),
+    "pareto_frontier": (
+        "efficiency_map",
+        "pareto_frontier",
+        {"model": "dict", "provider": "dict", "score": "float", "cost_per_task": "float"},
+    ),
+    "confidence_lens": (
+        "confidence_lens",
+        "points",
+        {"model": "dict", "provider": "dict", "hle_score": "float", "calibration_error": "float", "arc_agi_2": "float"},
+    ),
+    "transfer_gap": (
+        "transfer_gap",
+        "points",
+        {"model": "dict", "provider": "dict", "arc_agi_2": "float", "hle": "float", "gap": "float"},
+    ),
+    "twin_rivers": (
+        "twin_rivers",
+        "points",
+        {"model": "dict", "provider": "dict", "release_date": "date", "arc_score": "float", "hle_score": "float"},
+    ),
+}
+
+
+_HLE_SUMMARY_COLUMNS = {
+    "questions": "int",
+    "accuracy": "float",
+    "mean_confidence": "float",
+    "calibration_error": "float",
+}
+
+# Table name -> (processed JSON file, list key, columns, skipped when the file is missing).
+FILE_TABLES = {
+    "cube_cells": (
+        "cube.json",
+        "cells",
+        {
+            "provider": "dict",
+            "month": "dict",
+            "benchmark": "dict",
+            "count": "int",
+            "sum": "float",
+            "best": "float",
+            "median": "float",
+            "best_model": "dict",
+            "best_efficiency": "float",
+            "best_efficiency_model": "dict",
+            "histogram": "ints",
+        },
+        False,
+    ),
+    "hle_subjects": ("hle_subjects.json", "subjects", {"subject": "dict", **_HLE_SUMMARY_COLUMNS}, True),
+    "hle_subject_models": (
+        "hle_subjects.json",
+        "models",
+        {"model": "dict", "model_key": "dict", "in_unified": "bool", **_HLE_SUMMARY_COLUMNS},
+        True,
+    ),
+    "hle_subject_cells": (
+        "hle_subjects.json",
+        "cells",
+        {"subject": "dict", "model_key": "dict", **_HLE_SUMMARY_COLUMNS},
+        True,
+    ),
+}
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise RuntimeError("Columnar export needs pyarrow: pip install -e .[columnar]") from exc
+    return pyarrow
+
+
+def _to_date(value: Any) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _optional(cast: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda value: None if value is None else cast(value)
+
+
+# Inputs are already normalized JSON, so plain casts are enough.
+_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "dict": _optional(str),
+    "date": _to_date,
+    "float": _optional(float),
+    "int": _optional(int),
+    "bool": _optional(bool),
+    "ints": _optional(lambda values: [int(v) for v in values]),
+}
+
+
+def _arrow_type(pa: Any, kind: str) -> Any:
+    return {
+        "dict": pa.string(),
+        "date": pa.date32(),
+        "float": pa.float64(),
+        "int": pa.int64(),
+        "bool": pa.bool_(),
+        "ints": pa.list_(pa.int64()),
+    }[kind]
+
+
+def build_table(rows: list[dict[str, Any]], columns: dict[str, str]) -> Any:
+    """Build a pyarrow Table with the declared column types."""
+    pa = _pyarrow()
+    arrays, fields = [], []
+    for name, kind in columns.items():
+        convert = _CONVERTERS[kind]
+        array = pa.array([convert(row.get(name)) for row in rows], type=_arrow_type(pa, kind))
+        if kind == "dict":
+            array = array.dictionary_encode()
+        arrays.append(array)
+        fields.append(pa.field(name, array.type))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def _encode(table: Any, fmt: str) -> bytes:
+    pa = _pyarrow()
+    sink = pa.BufferOutputStream()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, sink)
+    else:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def export_columnar(fmt: str = "arrow") -> list[Path]:
+    """Write every table in ``fmt`` and return the paths."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown columnar format {fmt!r}; expected one of {tuple(FORMATS)}")
+    tables = {
+        "unified_models": build_table(codec.read_json(PROCESSED_DIR / "unified_models.json"), UNIFIED_COLUMNS),
+        "arc_results": build_table(arc_evaluation_rows(), ARC_RESULT_COLUMNS),
+    }
+    analysis = codec.read_json(PROCESSED_DIR / "analysis.json")
+    for name, (section, key, columns) in VIEW_TABLES.items():
+        tables[name] = build_table(analysis.get(section, {}).get(key, []), columns)
+    for name, (filename, key, columns, optional) in FILE_TABLES.items():
+        path = PROCESSED_DIR / filename
+        if optional and not path.exists():
+            continue
+        tables[name] = build_table(codec.read_json(path).get(key, []), columns)
+
+    paths = []
+    for name, table in tables.items():
+        path = COLUMNAR_DIR / f"{name}{FORMATS[fmt]}"
+        storage.write_if_changed(path, _encode(table, fmt))
+        paths.append(path)
+    return paths
+
+
+if __name__ == "__main__":
+    for path in export_columnar():
+        print(f"Wrote {path}")
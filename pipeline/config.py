@@ -6,7 +6,15 @@ ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data"
 SOURCES_DIR = DATA_DIR / "sources"
 PROCESSED_DIR = DATA_DIR / "processed"
+# Local HLE evaluation logs (JSONL or JSONL.gz), not committed.
+HLE_LOGS_DIR = DATA_DIR / "hle_logs"
 SITE_DATA_PATH = ROOT / "site" / "data.json"
+SITE_FRESHNESS_PATH = ROOT / "site" / "freshness.json"
+SITE_MANIFEST_PATH = ROOT / "site" / "manifest.json"
+SITE_PAGES_DIR = ROOT / "site" / "pages"
+SITE_SEARCH_INDEX_PATH = ROOT / "site" / "search-index.json"
+# Twin Rivers series, one content-hashed file per resolution.
+SITE_TIMELINE_DIR = ROOT / "site" / "timeline"
 
 SOURCES = {
     "arc_evaluations": "https://arcprize.org/media/data/leaderboard/evaluations.json",
@@ -0,0 +1,167 @@
+"""Provider × release month × benchmark aggregate cube.
+
+Every cell carries mergeable measures: count, best, score sum, best
+efficiency and a fixed-bin score histogram, plus its exact median. rollup()
+answers coarser questions (all providers, by quarter or year) from the cells
+alone; rolled-up medians are interpolated from the merged histograms.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from pathlib import Path
+from statistics import median
+from typing import Any, Callable, Iterable
+
+from . import codec
+from .config import PROCESSED_DIR
+from .transform import provider_display_names, provider_key
+
+CUBE_PATH = PROCESSED_DIR / "cube.json"
+CUBE_VERSION = 1
+
+# Scores are percentages; the last bin also takes anything above 100.
+HISTOGRAM_BIN_WIDTH = 5.0
+HISTOGRAM_BINS = 20
+
+# Benchmark -> (score field, cost field or None).
+BENCHMARKS = {"arc": ("arc_score", "arc_cost_per_task"), "hle": ("hle_score", None)}
+
+DIMENSIONS = ("provider", "month", "benchmark")
+
+PERIODS: dict[str, Callable[[str], str]] = {
+    "month": lambda month: month,
+    "quarter": lambda month: f"{month[:4]}-Q{(int(month[5:7]) - 1) // 3 + 1}",
+    "year": lambda month: month[:4],
+}
+
+Cell = dict[str, Any]
+
+
+def _bin(score: float) -> int:
+    return min(max(int(score // HISTOGRAM_BIN_WIDTH), 0), HISTOGRAM_BINS - 1)
+
+
+def build_cube(rows: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Group rows into cells in one pass; rows without a release month are counted and skipped."""
+    rows = list(rows)
+    groups: dict[tuple[str, str, str], list[tuple[float, float | None, str]]] = defaultdict(list)
+    undated = 0
+    for row in rows:
+        release = row.get("release_date") or ""
+        if len(release) < 7:
+            undated += 1
+            continue
+        provider, month = provider_key(row.get("provider")), release[:7]
+        for benchmark, (score_field, cost_field) in BENCHMARKS.items():
+            score = row.get(score_field)
+            if score is None:
+                continue
+            cost = row.get(cost_field) if cost_field else None
+            groups[(provider, month, benchmark)].append(
+                (score, score / cost if cost else None, row["canonical_name"])
+            )
+
+    cells = []
+    for (provider, month, benchmark), members in sorted(groups.items()):
+        histogram = [0] * HISTOGRAM_BINS
+        for score, _, _ in members:
+            histogram[_bin(score)] += 1
+        best_score, _, best_model = max(members, key=lambda m: (m[0], m[2]))
+        efficient = [m for m in members if m[1] is not None]
+        best_eff = max(efficient, key=lambda m: (m[1], m[2])) if efficient else None
+        cells.append(
+            {
+                "provider": provider,
+                "month": month,
+                "benchmark": benchmark,
+                "count": len(members),
+                "best": best_score,
+                "best_model": best_model,
+                "median": median(m[0] for m in members),
+                "sum": sum(m[0] for m in members),
+                "best_efficiency": best_eff[1] if best_eff else None,
+                "best_efficiency_model": best_eff[2] if best_eff else None,
+                "histogram": histogram,
+            }
+        )
+
+    return {
+        "version": CUBE_VERSION,
+        "dimensions": list(DIMENSIONS),
+        "histogram": {"bin_width": HISTOGRAM_BIN_WIDTH, "bins": HISTOGRAM_BINS},
+        "providers": provider_display_names(rows),
+        "undated_models": undated,
+        "cells": cells,
+    }
+
+
+def histogram_median(histogram: list[int]) -> float | None:
+    """Median interpolated linearly within the bin that holds it."""
+    total = sum(histogram)
+    if not total:
+        return None
+    half, seen = total / 2, 0
+    for i, count in enumerate(histogram):
+        if count and seen + count >= half:
+            return (i + (half - seen) / count) * HISTOGRAM_BIN_WIDTH
+        seen += count
+    return None
+
+
+def _better(a: tuple[Any, str | None], b: tuple[Any, str | None]) -> bool:
+    """Whether ``b`` beats ``a`` as a (value, model) pair, ties going to the later
+    model name as in build_cube; a None value never wins."""
+    return b[0] is not None and (a[0] is None or b > a)
+
+
+def rollup(
+    cube: dict[str, Any],
+    by: Iterable[str] = ("benchmark",),
+    period: str = "month",
+    where: Callable[[Cell], bool] | None = None,
+) -> list[Cell]:
+    """Merge cells that share the ``by`` dimensions, with months mapped to ``period``.
+
+    ``by=("benchmark",)`` gives all providers together; add "month" to keep
+    time, relabelled by ``period``. A group of one cell keeps its exact median.
+    """
+    by = tuple(by)
+    unknown = set(by) - set(DIMENSIONS)
+    if unknown:
+        raise ValueError(f"Unknown cube dimensions: {sorted(unknown)}")
+    to_period = PERIODS[period]
+
+    merged: dict[tuple, Cell] = {}
+    sizes: dict[tuple, int] = defaultdict(int)
+    for cell in cube["cells"]:
+        if where and not where(cell):
+            continue
+        coords = {**cell, "month": to_period(cell["month"])}
+        key = tuple(coords[d] for d in by)
+        sizes[key] += 1
+        out = merged.get(key)
+        if out is None:
+            merged[key] = {**{d: coords[d] for d in by}, **{k: cell[k] for k in cell if k not in DIMENSIONS}}
+            merged[key]["histogram"] = list(cell["histogram"])
+            continue
+        out["count"] += cell["count"]
+        out["sum"] += cell["sum"]
+        out["histogram"] = [a + b for a, b in zip(out["histogram"], cell["histogram"])]
+        if _better((out["best"], out["best_model"]), (cell["best"], cell["best_model"])):
+            out["best"], out["best_model"] = cell["best"], cell["best_model"]
+        if _better(
+            (out["best_efficiency"], out["best_efficiency_model"]),
+            (cell["best_efficiency"], cell["best_efficiency_model"]),
+        ):
+            out["best_efficiency"] = cell["best_efficiency"]
+            out["best_efficiency_model"] = cell["best_efficiency_model"]
+
+    for key, out in merged.items():
+        if sizes[key] > 1:
+            out["median"] = histogram_median(out["histogram"])
+    return [merged[key] for key in sorted(merged)]
+
+
+def write_cube(cube: dict[str, Any]) -> Path:
+    return codec.write_json(CUBE_PATH, cube, sort_keys=True)
@@ -0,0 +1,205 @@
+"""Stage dependency graph and a small thread-pool scheduler.
+
+Each stage names the artifacts it reads and writes. A stage depends on the
+stages that produce its inputs; inputs nobody in the graph produces are taken
+to be on disk already, which is what lets a subgraph run on its own. Stages
+start as soon as their producers finish, so independent ones (fetching one
+host while parsing another's sources, exporting while charts render) overlap.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+# Threads, not processes: stages mostly wait on the network and disk, and the
+# heavy ones already fan out to their own process pools (see Stage.exclusive).
+DEFAULT_WORKERS = 4
+
+Artifacts = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """``run`` gets the declared inputs produced in this run and returns its outputs.
+
+    Outputs the stage does not return are recorded as None. ``modules`` names
+    the pipeline modules ``run`` imports, so a caller can load (and time) them
+    before the run. An ``exclusive`` stage runs on the main thread once no other
+    stage is in flight: stages that fork a process pool need this, since a
+    fork copies only the forking thread and can leave a lock held by another
+    thread locked forever in the child.
+    """
+
+    name: str
+    run: Callable[[Artifacts], Artifacts | None]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    modules: tuple[str, ...] = ()
+    exclusive: bool = False
+
+
+@dataclass
+class GraphRun:
+    artifacts: Artifacts
+    deps: dict[str, list[str]]
+    # Stage name -> (start, end) in seconds from the start of the run.
+    timings: dict[str, tuple[float, float]] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+
+    def duration(self, name: str) -> float:
+        start, end = self.timings[name]
+        return end - start
+
+    def critical_path(self) -> list[str]:
+        """The dependency chain with the largest summed stage time."""
+        best: dict[str, tuple[float, list[str]]] = {}
+        for name in self.timings:  # completion order is a topological order
+            chains = [best[d] for d in self.deps[name] if d in best]
+            cost, chain = max(chains, key=lambda c: c[0], default=(0.0, []))
+            best[name] = (cost + self.duration(name), chain + [name])
+        return max(best.values(), key=lambda c: c[0], default=(0.0, []))[1]
+
+    def to_dict(self) -> dict[str, Any]:
+        path = self.critical_path()
+        return {
+            "wall_seconds": round(self.wall_seconds, 6),
+            "stage_seconds": round(sum(self.duration(n) for n in self.timings), 6),
+            "critical_path_seconds": round(sum(self.duration(n) for n in path), 6),
+            "critical_path": path,
+            "stages": {
+                name: {"start": round(start, 6), "end": round(end, 6), "deps": self.deps[name]}
+                for name, (start, end) in self.timings.items()
+            },
+        }
+
+    def summary(self) -> str:
+        path = self.critical_path()
+        chain = " -> ".join(f"{name} {self.duration(name):.2f}s" for name in path)
+        total = sum(self.duration(n) for n in self.timings)
+        return (
+            f"Critical path {sum(self.duration(n) for n in path):.2f}s of {self.wall_seconds:.2f}s wall "
+            f"({total:.2f}s across {len(self.timings)} stages): {chain}"
+        )
+
+
+class Graph:
+    def __init__(self, stages: Iterable[Stage]) -> None:
+        self.stages: dict[str, Stage] = {}
+        self.producers: dict[str, str] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage: {stage.name}")
+            self.stages[stage.name] = stage
+            for artifact in stage.outputs:
+                if artifact in self.producers:
+                    raise ValueError(f"{artifact} is produced by both {self.producers[artifact]} and {stage.name}")
+                self.producers[artifact] = stage.name
+        self.deps = {
+            name: sorted({self.producers[a] for a in stage.inputs if a in self.producers})
+            for name, stage in self.stages.items()
+        }
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> list[str]:
+        """Stages in waves of ready ones, each wave in declaration order."""
+        order: list[str] = []
+        placed: set[str] = set()
+        remaining = list(self.stages)
+        while remaining:
+            ready = [name for name in remaining if placed.issuperset(self.deps[name])]
+            if not ready:
+                raise ValueError(f"Dependency cycle among: {', '.join(remaining)}")
+            order += ready
+            placed.update(ready)
+            remaining = [name for name in remaining if name not in placed]
+        return order
+
+    def subgraph(self, targets: Iterable[str], upstream: bool = True) -> "Graph":
+        """Stages named by ``targets`` (stage or artifact names) and, by default, everything they need."""
+        wanted: set[str] = set()
+        pending = []
+        for target in targets:
+            name = self.producers.get(target, target)
+            if name not in self.stages:
+                raise KeyError(f"Unknown stage or artifact: {target}")
+            pending.append(name)
+        while pending:
+            name = pending.pop()
+            if name not in wanted:
+                wanted.add(name)
+                if upstream:
+                    pending.extend(self.deps[name])
+        return Graph(self.stages[name] for name in self.stages if name in wanted)
+
+    def run(self, workers: int = DEFAULT_WORKERS) -> GraphRun:
+        """Run every stage once its producers are done; the first failure is re-raised."""
+        result = GraphRun(artifacts={}, deps=self.deps)
+        started = time.perf_counter()
+
+        def execute(name: str) -> tuple[float, float, Artifacts | None]:
+            stage = self.stages[name]
+            inputs = {a: result.artifacts[a] for a in stage.inputs if a in result.artifacts}
+            begin = time.perf_counter() - started
+            outputs = stage.run(inputs)
+            return begin, time.perf_counter() - started, outputs
+
+        def finish(name: str, begin: float, end: float, outputs: Artifacts | None) -> None:
+            outputs = outputs or {}
+            for artifact in self.stages[name].outputs:
+                result.artifacts[artifact] = outputs.get(artifact)
+            result.timings[name] = (begin, end)
+
+        if workers <= 1:
+            for name in self.order:
+                finish(name, *execute(name))
+        else:
+            self._run_pool(workers, execute, finish)
+        result.wall_seconds = time.perf_counter() - started
+        return result
+
+    def _run_pool(
+        self,
+        workers: int,
+        execute: Callable[[str], tuple[float, float, Artifacts | None]],
+        finish: Callable[..., None],
+    ) -> None:
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        waiting = {name: len(deps) for name, deps in self.deps.items()}
+        dependents: dict[str, list[str]] = {name: [] for name in self.stages}
+        for name, deps in self.deps.items():
+            for dep in deps:
+                dependents[dep].append(name)
+
+        ready = [name for name in self.order if not waiting[name]]
+        running: dict[Any, str] = {}
+
+        def release(name: str, *timing: Any) -> None:
+            finish(name, *timing)
+            for child in dependents[name]:
+                waiting[child] -= 1
+                if not waiting[child]:
+                    ready.append(child)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while ready or running:
+                # A ready exclusive stage holds back the rest until the pool drains.
+                gate = next((name for name in ready if self.stages[name].exclusive), None)
+                if gate is None:
+                    for name in ready:
+                        running[pool.submit(execute, name)] = name
+                    ready.clear()
+                elif not running:
+                    ready.remove(gate)
+                    release(gate, *execute(gate))
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if future.exception() is not None:
+                        for other in running:
+                            other.cancel()
+                        raise future.exception()
+                    release(name, *future.result())
@@ -0,0 +1,157 @@
+"""Largest-Triangle-Three-Buckets downsampling of the Twin Rivers timeline.
+
+analysis.json stores resolutions as index lists into ``twin_rivers.points``
+and each trend frontier. The site export turns each one into a standalone
+series (see ``resolution_series``) so browsers load only the resolution that
+fits their plot width.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from .trends import release_ordinal
+
+# Target points per series; a resolution is only emitted when it is smaller
+# than the series it summarizes.
+RESOLUTIONS = (100, 250, 500, 1000)
+# Horizontal pixels per point when choosing a resolution for a plot width.
+PX_PER_POINT = 2
+# Matches the site's label count; the static SVG labels a subset of these.
+LABEL_TOP_N = 10
+
+SERIES = {"arc": "arc_score", "hle": "hle_score"}
+
+
+def lttb(xs: Sequence[float], ys: Sequence[float], threshold: int) -> list[int]:
+    """Indices of the ``threshold`` points that best preserve the series' shape.
+
+    ``xs`` must be sorted. The first and last points are always kept.
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    every = (n - 2) / (threshold - 2)
+    kept = [0]
+    a = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, n)
+        span = next_end - end
+        avg_x = sum(xs[end:next_end]) / span
+        avg_y = sum(ys[end:next_end]) / span
+
+        ax, ay = xs[a], ys[a]
+        dx, dy = ax - avg_x, avg_y - ay
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs(dx * (ys[j] - ay) - (ax - xs[j]) * dy)
+            if area > best_area:
+                best, best_area = j, area
+        kept.append(best)
+        a = best
+    kept.append(n - 1)
+    return kept
+
+
+def downsample(xs: Sequence[float], ys: Sequence[float], threshold: int, keep: Sequence[int] = ()) -> list[int]:
+    """At most ``threshold`` indices: as many of ``keep`` as fit, in order, then LTTB picks."""
+    n = len(xs)
+    if threshold >= n:
+        return list(range(n))
+    forced = list(dict.fromkeys(keep))[:threshold]
+    budget = threshold - len(forced)
+    picked = lttb(xs, ys, budget) if budget >= 3 else [0, n - 1][:budget]
+    return sorted(set(picked) | set(forced))
+
+
+def labelled_models(points: list[dict[str, Any]], milestones: list[dict[str, Any]]) -> set[str]:
+    """Models a timeline renderer may label or annotate."""
+    names: set[str] = set()
+    for field in SERIES.values():
+        scored = [p for p in points if p.get(field) is not None]
+        scored.sort(key=lambda p: p[field], reverse=True)
+        names.update(p["model"] for p in scored[:LABEL_TOP_N])
+    names.update(m["surpassed_by"] for m in milestones if m.get("surpassed_by"))
+    return names
+
+
+def timeline_resolutions(
+    points: list[dict[str, Any]], trend: dict[str, Any], milestones: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Downsampled index lists for each series and frontier, one entry per resolution.
+
+    No list is longer than the entry's ``size``. Labelled models are kept
+    first, then frontier models, each by score; ``dropped`` counts the ones
+    that did not fit.
+    """
+    labelled = labelled_models(points, milestones)
+    series: dict[str, tuple[list[int], list[float], list[float], list[int]]] = {}
+    for key, field in SERIES.items():
+        frontier = {step["model"] for step in trend.get(key, {}).get("frontier", [])}
+        idx, xs, ys, forced = [], [], [], []
+        for i, point in enumerate(points):
+            ordinal = release_ordinal(point.get("release_date"))
+            if ordinal is None or point.get(field) is None:
+                continue
+            if point["model"] in labelled or point["model"] in frontier:
+                forced.append(len(idx))
+            idx.append(i)
+            xs.append(ordinal)
+            ys.append(point[field])
+        forced.sort(key=lambda j: (points[idx[j]]["model"] not in labelled, -ys[j]))
+        series[key] = (idx, xs, ys, forced)
+
+    steps: dict[str, tuple[list[float], list[float]]] = {}
+    for key in SERIES:
+        frontier = trend.get(key, {}).get("frontier", [])
+        steps[key] = (
+            [release_ordinal(s["release_date"]) or 0 for s in frontier],
+            [s["score"] for s in frontier],
+        )
+
+    longest = max([len(s[0]) for s in series.values()] + [len(s[0]) for s in steps.values()])
+    resolutions = []
+    for size in RESOLUTIONS:
+        if size >= longest:
+            break
+        entry: dict[str, Any] = {"size": size, "frontier": {}, "dropped": {}}
+        for key, (idx, xs, ys, forced) in series.items():
+            entry[key] = [idx[j] for j in downsample(xs, ys, size, forced)]
+            entry["dropped"][key] = max(0, len(forced) - size)
+        for key, (xs, ys) in steps.items():
+            entry["frontier"][key] = downsample(xs, ys, size)
+        resolutions.append(entry)
+    return resolutions
+
+
+def resolution_series(twin: dict[str, Any], entry: dict[str, Any] | None) -> dict[str, Any]:
+    """The points and frontiers of one resolution; None gives every point.
+
+    A point kept in only one series has the other score set to None.
+    """
+    trend = twin.get("trend", {})
+    points = twin.get("points", [])
+    if entry is None:
+        frontier = {key: trend.get(key, {}).get("frontier", []) for key in SERIES}
+        return {"size": None, "points": points, "frontier": frontier}
+    kept = {key: set(entry[key]) for key in SERIES}
+    series = []
+    for i, point in enumerate(points):
+        if any(i in k for k in kept.values()):
+            series.append({**point, **{field: None for key, field in SERIES.items() if i not in kept[key]}})
+    frontier = {
+        key: [trend.get(key, {}).get("frontier", [])[j] for j in entry["frontier"][key]] for key in SERIES
+    }
+    return {"size": entry["size"], "points": series, "frontier": frontier}
+
+
+def pick_resolution(resolutions: list[dict[str, Any]], plot_width: float) -> dict[str, Any] | None:
+    """Smallest resolution with enough points for ``plot_width``; None means full detail."""
+    wanted = plot_width / PX_PER_POINT
+    for entry in resolutions:
+        if entry["size"] >= wanted:
+            return entry
+    return None
@@ -2,31 +2,129 @@
 
 from __future__ import annotations
 
-import json
+import re
 from datetime import datetime, UTC
 from pathlib import Path
 from typing import Any
 
-from .config import PROCESSED_DIR, SITE_DATA_PATH
+from . import codec, storage
+from .config import PROCESSED_DIR, SITE_DATA_PATH, SITE_FRESHNESS_PATH, SITE_MANIFEST_PATH, SITE_TIMELINE_DIR
+from .downsample import SERIES, resolution_series
+
+# Hex digits of the data hash used as the site's cache version.
+MANIFEST_VERSION_LENGTH = 12
+
+# Hashed data files kept for clients still holding an older manifest.
+SITE_DATA_KEEP_VERSIONS = 3
 
 
 def _load_analysis() -> dict[str, Any]:
     path = PROCESSED_DIR / "analysis.json"
     if not path.exists():
         raise FileNotFoundError(f"Missing analysis payload: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
+    return codec.read_json(path)
+
+
+def write_freshness(data_path: Path) -> Path:
+    """Record when the site data was last regenerated.
+
+    Kept out of data.json so that file only changes when scores do.
+    """
+    freshness = {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "data_sha256": storage.file_hash(data_path),
+    }
+    return codec.write_json(SITE_FRESHNESS_PATH, freshness, pretty=False)
+
+
+def versioned_data_path(version: str) -> Path:
+    return SITE_DATA_PATH.with_name(f"{SITE_DATA_PATH.stem}.{version}{SITE_DATA_PATH.suffix}")
+
+
+def write_manifest(version: str, data_path: Path) -> Path:
+    """Point the site at the current immutable data file.
+
+    This is the only site file fetched at a fixed URL on every load.
+    """
+    manifest = {"version": version, "data": data_path.name}
+    return codec.write_json(SITE_MANIFEST_PATH, manifest, pretty=False, sort_keys=True)
+
+
+def _prune_versions(current: Path, pattern: re.Pattern[str], keep: int) -> list[Path]:
+    older = sorted(
+        (p for p in current.parent.iterdir() if pattern.fullmatch(p.name) and p != current),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    stale = older[max(0, keep - 1) :]
+    for path in stale:
+        path.unlink(missing_ok=True)
+    return stale
+
+
+def prune_data_versions(current: Path, keep: int = SITE_DATA_KEEP_VERSIONS) -> list[Path]:
+    """Delete hashed data files beyond the ``keep`` most recent, never ``current``."""
+    pattern = re.compile(
+        rf"{re.escape(SITE_DATA_PATH.stem)}\.[0-9a-f]{{{MANIFEST_VERSION_LENGTH}}}{re.escape(SITE_DATA_PATH.suffix)}"
+    )
+    return _prune_versions(current, pattern, keep)
+
+
+def export_timeline(twin: dict[str, Any]) -> dict[str, Any]:
+    """Write each Twin Rivers resolution to its own file; return the inline payload.
+
+    The smallest resolution replaces the full points and frontiers in
+    data.json, and ``resolutions`` lists every file (the last one holding all
+    points) for the site to load the one its plot width needs.
+    """
+    entries = twin.get("resolutions") or []
+    if not entries:
+        return twin
+    index = []
+    for entry in [*entries, None]:
+        series = resolution_series(twin, entry)
+        label = "full" if entry is None else str(entry["size"])
+        data = codec.dumpb(series, pretty=False, sort_keys=True)
+        path = SITE_TIMELINE_DIR / f"{label}.{storage.content_hash(data)[:MANIFEST_VERSION_LENGTH]}.json"
+        storage.write_if_changed(path, data)
+        versions = re.compile(rf"{label}\.[0-9a-f]{{{MANIFEST_VERSION_LENGTH}}}\.json")
+        _prune_versions(path, versions, SITE_DATA_KEEP_VERSIONS)
+        index.append(
+            {
+                "size": series["size"],
+                "points": len(series["points"]),
+                "dropped": entry["dropped"] if entry else {},
+                "data": f"{SITE_TIMELINE_DIR.name}/{path.name}",
+            }
+        )
+    inline = resolution_series(twin, entries[0])
+    trend = dict(twin.get("trend", {}))
+    for key in SERIES:
+        if key in trend:
+            trend[key] = {**trend[key], "frontier": inline["frontier"][key]}
+    return {**twin, "points": inline["points"], "trend": trend, "resolutions": index}
 
 
 def export_site_data() -> Path:
     analysis = _load_analysis()
+    if "twin_rivers" in analysis:
+        analysis["twin_rivers"] = export_timeline(analysis["twin_rivers"])
     payload = {
-        "generated_at": datetime.now(UTC).isoformat(),
         "project": "AGI Gap Atlas",
         "version": "0.1.0",
         "data": analysis,
     }
-    SITE_DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
-    SITE_DATA_PATH.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    # The site payload is shipped to browsers, so it is written compact.
+    data = codec.dumpb(payload, pretty=False, sort_keys=True)
+    version = storage.content_hash(data)[:MANIFEST_VERSION_LENGTH]
+    # data.json stays at a fixed path for the refresh workflow and older
+    # clients; the site itself loads the content-addressed copy.
+    storage.write_if_changed(SITE_DATA_PATH, data)
+    hashed = versioned_data_path(version)
+    storage.write_if_changed(hashed, data)
+    write_manifest(version, hashed)
+    prune_data_versions(hashed)
+    write_freshness(SITE_DATA_PATH)
     return SITE_DATA_PATH
 
 
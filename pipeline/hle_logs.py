@@ -0,0 +1,266 @@
+"""Subject-level HLE accuracy and calibration from local evaluation logs.
+
+Logs are JSONL files (optionally gzipped) under HLE_LOGS_DIR, one line per
+question, model and run. Files are streamed line by line into per
+(subject, model id) counters, so memory grows with the number of subjects and
+models, not with the size of the logs. Large log sets are split across
+processes by file. Model ids are resolved to unified model_keys with the same
+alias rules as the HLE leaderboard.
+"""
+
+from __future__ import annotations
+
+import gzip
+import math
+import os
+import zlib
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from . import codec
+from .config import HLE_LOGS_DIR, PROCESSED_DIR
+from .transform import resolve_model_keys
+
+HLE_SUBJECTS_PATH = PROCESSED_DIR / "hle_subjects.json"
+SUBJECTS_VERSION = 1
+
+MODEL_FIELDS = ("model", "model_id", "model_name")
+SUBJECT_FIELDS = ("subject", "category", "raw_subject")
+CORRECT_FIELDS = ("correct", "is_correct", "judge_correct")
+CONFIDENCE_FIELDS = ("confidence", "confidence_score")
+
+# Equal-width confidence bins; counts merge across files, unlike HLE's own
+# sorted 100-question bins.
+CALIBRATION_BINS = 10
+
+# Below this many bytes of logs, process start-up costs more than it saves.
+PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+
+_TRUE = {"yes", "true", "correct", "1"}
+_FALSE = {"no", "false", "incorrect", "0"}
+
+
+class SubjectStats:
+    """Mergeable counters for one subject and model: totals plus confidence bins."""
+
+    def __init__(self) -> None:
+        self.questions = 0
+        self.correct = 0
+        self.confidence = 0.0
+        # Per bin: [questions, correct, summed confidence].
+        self.bins = [[0, 0, 0.0] for _ in range(CALIBRATION_BINS)]
+
+    def add(self, correct: bool, confidence: float | None) -> None:
+        self.questions += 1
+        self.correct += correct
+        if confidence is None:
+            return
+        self.confidence += confidence
+        bucket = self.bins[min(int(confidence * CALIBRATION_BINS), CALIBRATION_BINS - 1)]
+        bucket[0] += 1
+        bucket[1] += correct
+        bucket[2] += confidence
+
+    def merge(self, other: "SubjectStats") -> None:
+        self.questions += other.questions
+        self.correct += other.correct
+        self.confidence += other.confidence
+        for mine, theirs in zip(self.bins, other.bins):
+            mine[0] += theirs[0]
+            mine[1] += theirs[1]
+            mine[2] += theirs[2]
+
+    def summary(self) -> dict[str, Any]:
+        """Percentages, with the RMS gap between confidence and accuracy over bins."""
+        rated = sum(b[0] for b in self.bins)
+        calibration = None
+        if rated:
+            calibration = 100 * math.sqrt(sum((b[1] - b[2]) ** 2 / b[0] for b in self.bins if b[0]) / rated)
+        return {
+            "questions": self.questions,
+            "accuracy": 100 * self.correct / self.questions if self.questions else None,
+            "mean_confidence": 100 * self.confidence / rated if rated else None,
+            "calibration_error": calibration,
+        }
+
+
+Cells = dict[tuple[str, str], SubjectStats]
+
+
+def _first(item: dict[str, Any], fields: tuple[str, ...]) -> Any:
+    for field in fields:
+        value = item.get(field)
+        if value is not None:
+            return value
+    return None
+
+
+def _as_correct(value: Any) -> bool | None:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value > 0
+    if isinstance(value, str):
+        text = value.strip().lower()
+        return True if text in _TRUE else False if text in _FALSE else None
+    return None
+
+
+def _as_confidence(value: Any) -> float | None:
+    """0-1 fraction; values above 1 (or written with %) are read as percentages."""
+    if isinstance(value, str):
+        text = value.strip()
+        percent = text.endswith("%")
+        try:
+            value = float(text.rstrip("%"))
+        except ValueError:
+            return None
+        if percent:
+            value /= 100
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or math.isnan(value):
+        return None
+    if value > 1:
+        value /= 100
+    return min(max(float(value), 0.0), 1.0)
+
+
+def log_files(root: Path) -> list[Path]:
+    """Every *.jsonl and *.jsonl.gz file under ``root``, in path order."""
+    if not root.is_dir():
+        return []
+    return sorted(p for p in root.rglob("*") if p.is_file() and p.name.endswith((".jsonl", ".jsonl.gz")))
+
+
+def _open(path: Path) -> IO[bytes]:
+    return gzip.open(path, "rb") if path.suffix == ".gz" else path.open("rb")
+
+
+def _records(path: Path) -> Iterator[dict[str, Any] | None]:
+    """Parsed lines, with None for lines that are not JSON objects (or not UTF-8)."""
+    with _open(path) as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            try:
+                item = codec.loads(line)
+            except (codec.DecodeError, UnicodeDecodeError):
+                yield None
+                continue
+            yield item if isinstance(item, dict) else None
+
+
+def aggregate_file(path: Path) -> tuple[Cells, int, int, bool]:
+    """Counters for one log file, its (used, skipped) line counts and whether it was damaged.
+
+    A file that cannot be read to the end (a truncated or corrupt gzip) keeps
+    the lines read before the damage. Runs in a worker.
+    """
+    cells: Cells = {}
+    used = skipped = 0
+    damaged = False
+    try:
+        for item in _records(path):
+            model = _first(item, MODEL_FIELDS) if item else None
+            correct = _as_correct(_first(item, CORRECT_FIELDS)) if item else None
+            if not isinstance(model, str) or correct is None:
+                skipped += 1
+                continue
+            subject = str(_first(item, SUBJECT_FIELDS) or "Unknown")
+            stats = cells.get((subject, model))
+            if stats is None:
+                stats = cells[(subject, model)] = SubjectStats()
+            stats.add(correct, _as_confidence(_first(item, CONFIDENCE_FIELDS)))
+            used += 1
+    except (EOFError, gzip.BadGzipFile, zlib.error, OSError):
+        damaged = True
+    return cells, used, skipped, damaged
+
+
+def _aggregate_many(files: list[Path], workers: int) -> Iterable[tuple[Cells, int, int, bool]]:
+    if workers <= 1 or len(files) < 2 or sum(p.stat().st_size for p in files) < PARALLEL_MIN_BYTES:
+        return map(aggregate_file, files)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(aggregate_file, files))
+
+
+def aggregate_logs(files: list[Path], workers: int | None = None) -> tuple[Cells, dict[str, int]]:
+    """Merge per-file counters in file order."""
+    cells: Cells = {}
+    counts = {"files": len(files), "lines": 0, "skipped_lines": 0, "damaged_files": 0}
+    for partial, used, skipped, damaged in _aggregate_many(files, workers or os.cpu_count() or 1):
+        counts["lines"] += used
+        counts["skipped_lines"] += skipped
+        counts["damaged_files"] += damaged
+        for key, stats in partial.items():
+            if key in cells:
+                cells[key].merge(stats)
+            else:
+                cells[key] = stats
+    return cells, counts
+
+
+def _grouped(cells: dict[Any, SubjectStats], key_of: Callable[[Any], Any]) -> dict[Any, SubjectStats]:
+    out: dict[Any, SubjectStats] = {}
+    for key, stats in cells.items():
+        out.setdefault(key_of(key), SubjectStats()).merge(stats)
+    return out
+
+
+def build_matrix(cells: Cells, unified: list[dict[str, Any]]) -> dict[str, Any]:
+    """Subject × model_key matrix, joined to unified records through alias resolution."""
+    resolved = resolve_model_keys(sorted({model for _, model in cells}))
+    known = {row["model_key"]: row["canonical_name"] for row in unified}
+    by_key = _grouped(cells, lambda key: (key[0], resolved[key[1]][1]))
+    per_model = _grouped(by_key, lambda key: key[1])
+    per_subject = _grouped(by_key, lambda key: key[0])
+
+    log_ids: dict[str, list[str]] = {}
+    for raw, (_, model_key) in resolved.items():
+        log_ids.setdefault(model_key, []).append(raw)
+
+    models = []
+    for model_key in sorted(per_model):
+        canonical = known.get(model_key) or resolved[log_ids[model_key][0]][0]
+        models.append(
+            {
+                "model": canonical,
+                "model_key": model_key,
+                "in_unified": model_key in known,
+                "log_ids": log_ids[model_key],
+                **per_model[model_key].summary(),
+            }
+        )
+    return {
+        "version": SUBJECTS_VERSION,
+        "calibration_bins": CALIBRATION_BINS,
+        "subjects": [{"subject": s, **per_subject[s].summary()} for s in sorted(per_subject)],
+        "models": models,
+        "cells": [
+            {"subject": subject, "model_key": model_key, **stats.summary(), "bins": stats.bins}
+            for (subject, model_key), stats in sorted(by_key.items())
+        ],
+        "unmatched": sorted(m["model_key"] for m in models if not m["in_unified"]),
+    }
+
+
+def export_hle_subjects(workers: int | None = None) -> dict[str, int] | None:
+    """Aggregate HLE_LOGS_DIR into hle_subjects.json; None when there are no logs."""
+    files = log_files(HLE_LOGS_DIR)
+    if not files:
+        return None
+    cells, counts = aggregate_logs(files, workers)
+    matrix = build_matrix(cells, codec.read_json(PROCESSED_DIR / "unified_models.json"))
+    codec.write_json(HLE_SUBJECTS_PATH, {**counts, **matrix}, sort_keys=True)
+    return {
+        **counts,
+        "subjects": len(matrix["subjects"]),
+        "models": len(matrix["models"]),
+        "unmatched": len(matrix["unmatched"]),
+    }
+
+
+if __name__ == "__main__":
+    print(export_hle_subjects())
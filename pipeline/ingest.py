@@ -2,62 +2,253 @@
 
 from __future__ import annotations
 
-import json
+import http.client
+import importlib.util
+import ssl
 import time
+import zlib
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
-from urllib.error import URLError, HTTPError
-from urllib.request import Request, urlopen
+from typing import Any, Iterable
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
 
+from . import codec
 from .config import SOURCES, SOURCES_DIR
+from .profiling import span
 
 BOOTSTRAP_DIR = Path(__file__).resolve().parents[1] / "data" / "bootstrap"
 
+USER_AGENT = "BenchmarkAtlas/0.1"
+CHUNK_SIZE = 64 * 1024
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# Brotli is only advertised when the optional decoder is installed.
+ACCEPT_ENCODING = "gzip, br" if importlib.util.find_spec("brotli") else "gzip"
+
+# Errors that mean "this source is unavailable right now" rather than a bug.
+FETCH_ERRORS = (OSError, http.client.HTTPException, codec.DecodeError, UnicodeDecodeError, zlib.error)
+
 
 def _ensure_dirs() -> None:
     SOURCES_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _fetch_json(url: str, timeout: int = 30) -> Any:
-    request = Request(url, headers={"User-Agent": "BenchmarkAtlas/0.1"})
-    with urlopen(request, timeout=timeout) as response:
-        payload = response.read().decode("utf-8")
-    return json.loads(payload)
+@dataclass
+class FetchStats:
+    wire_bytes: int = 0
+    body_bytes: int = 0
+    encoding: str = "identity"
+    reused_connection: bool = False
+    ttfb_seconds: float = 0.0
+
+
+class ConnectionPool:
+    """One persistent HTTP/1.1 connection per scheme, host and port.
+
+    The arcprize.org sources share a single TLS session instead of paying a
+    handshake each. ``HTTP(S)_PROXY`` and ``NO_PROXY`` are honoured the way
+    urllib does: plain HTTP goes to the proxy with absolute URLs, HTTPS is
+    tunnelled through it with CONNECT.
+    """
+
+    def __init__(self, timeout: float = 30) -> None:
+        self.timeout = timeout
+        self.opened = 0
+        self._connections: dict[tuple[str, str, int | None], http.client.HTTPConnection] = {}
+        self._ssl_context: ssl.SSLContext | None = None
+        self._proxies = getproxies()
+
+    def _proxy(self, scheme: str, host: str) -> Any:
+        proxy = self._proxies.get(scheme)
+        if not proxy or proxy_bypass(host):
+            return None
+        return urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+    def _connect(self, scheme: str, host: str, port: int | None) -> http.client.HTTPConnection:
+        self.opened += 1
+        proxy = self._proxy(scheme, host)
+        if proxy is not None:
+            target = (proxy.hostname, proxy.port)
+        else:
+            target = (host, port)
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            conn = http.client.HTTPSConnection(*target, timeout=self.timeout, context=self._ssl_context)
+            if proxy is not None:
+                conn.set_tunnel(host, port)
+            return conn
+        return http.client.HTTPConnection(*target, timeout=self.timeout)
+
+    def _target(self, url: str) -> str:
+        """Request target: the absolute URL through a plain-HTTP proxy, else the path."""
+        parts = urlsplit(url)
+        if parts.scheme == "http" and self._proxy("http", parts.hostname or "") is not None:
+            return url
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+        return path
+
+    def request(self, url: str, headers: dict[str, str]) -> tuple[http.client.HTTPResponse, bool]:
+        """Send a GET and return the response plus whether the connection was reused."""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname or "", parts.port)
+        path = self._target(url)
+
+        conn = self._connections.get(key)
+        reused = conn is not None
+        if conn is None:
+            conn = self._connections[key] = self._connect(*key)
+        try:
+            conn.request("GET", path, headers=headers)
+            return conn.getresponse(), reused
+        except (http.client.RemoteDisconnected, ConnectionError, http.client.CannotSendRequest):
+            conn.close()
+            if not reused:
+                raise
+        # The server closed an idle keep-alive connection; retry once on a new one.
+        conn = self._connections[key] = self._connect(*key)
+        conn.request("GET", path, headers=headers)
+        return conn.getresponse(), False
+
+    def discard(self, url: str) -> None:
+        parts = urlsplit(url)
+        conn = self._connections.pop((parts.scheme, parts.hostname or "", parts.port), None)
+        if conn is not None:
+            conn.close()
 
+    def close(self) -> None:
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
 
-def fetch_all(retries: int = 2, retry_delay: float = 1.5) -> dict[str, Path]:
-    """Fetch all source endpoints with local fallback.
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _decompressor(encoding: str) -> Any:
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return zlib.decompressobj()
+    if encoding == "br":
+        import brotli
+
+        return brotli.Decompressor()
+    if encoding in ("", "identity"):
+        return None
+    raise http.client.HTTPException(f"Unsupported Content-Encoding: {encoding}")
+
+
+def _read_body(response: http.client.HTTPResponse, stats: FetchStats) -> bytes:
+    """Read the response in chunks, decoding Content-Encoding as it streams."""
+    stats.encoding = (response.getheader("Content-Encoding") or "identity").strip().lower()
+    decoder = _decompressor(stats.encoding)
+    parts: list[bytes] = []
+    while chunk := response.read(CHUNK_SIZE):
+        stats.wire_bytes += len(chunk)
+        if decoder is None:
+            parts.append(chunk)
+        elif stats.encoding == "br":
+            parts.append(decoder.process(chunk))
+        else:
+            parts.append(decoder.decompress(chunk))
+    if decoder is not None and stats.encoding != "br":
+        parts.append(decoder.flush())
+    body = b"".join(parts)
+    stats.body_bytes = len(body)
+    return body
+
+
+def _fetch_json(url: str, pool: ConnectionPool) -> tuple[bytes, FetchStats]:
+    """Return the decoded response body after checking that it parses as JSON."""
+    headers = {"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING, "Accept": "application/json"}
+    stats = FetchStats()
+    for _ in range(MAX_REDIRECTS + 1):
+        started = time.perf_counter()
+        try:
+            response, stats.reused_connection = pool.request(url, headers)
+            stats.ttfb_seconds = time.perf_counter() - started
+            body = _read_body(response, stats)
+        except FETCH_ERRORS:
+            pool.discard(url)
+            raise
+        if response.will_close:
+            pool.discard(url)
+        if response.status in REDIRECT_STATUSES and response.getheader("Location"):
+            url = urljoin(url, response.getheader("Location"))
+            continue
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.headers, None)
+        codec.loads(body)
+        return body, stats
+    raise HTTPError(url, 310, "Too many redirects", http.client.HTTPMessage(), None)
+
+
+def fetch_all(
+    retries: int = 2,
+    retry_delay: float = 1.5,
+    timeout: float = 30,
+    names: Iterable[str] | None = None,
+) -> dict[str, Path]:
+    """Fetch all source endpoints (or just ``names``) with local fallback.
 
     If network fetch fails and a cached file exists, the cached file is used.
     """
     _ensure_dirs()
+    with ConnectionPool(timeout=timeout) as pool:
+        return _fetch_sources(pool, SOURCES if names is None else names, retries, retry_delay)
+
+
+def _fetch_sources(pool: ConnectionPool, names: Iterable[str], retries: int, retry_delay: float) -> dict[str, Path]:
     results: dict[str, Path] = {}
 
-    for name, url in SOURCES.items():
-        out_path = SOURCES_DIR / f"{name}.json"
-        last_err: Exception | None = None
-
-        for attempt in range(retries + 1):
-            try:
-                data = _fetch_json(url)
-                out_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-                results[name] = out_path
-                last_err = None
-                break
-            except (URLError, HTTPError, TimeoutError, json.JSONDecodeError) as err:
-                last_err = err
-                if attempt < retries:
-                    time.sleep(retry_delay)
-
-        if last_err is not None:
-            if out_path.exists():
-                results[name] = out_path
-            elif (BOOTSTRAP_DIR / f"{name}.json").exists():
-                bootstrap = BOOTSTRAP_DIR / f"{name}.json"
-                out_path.write_text(bootstrap.read_text(encoding="utf-8"), encoding="utf-8")
-                results[name] = out_path
-            else:
-                raise RuntimeError(f"Unable to fetch {name} from {url}: {last_err}") from last_err
+    for name in names:
+        url = SOURCES[name]
+        with span(f"fetch.{name}") as step:
+            out_path = SOURCES_DIR / f"{name}.json"
+            last_err: Exception | None = None
+
+            for attempt in range(retries + 1):
+                try:
+                    body, stats = _fetch_json(url, pool)
+                    # Cache the body as served instead of decoding and re-encoding it.
+                    out_path.write_bytes(body)
+                    results[name] = out_path
+                    step.attrs.update(
+                        origin="live",
+                        attempts=attempt + 1,
+                        encoding=stats.encoding,
+                        wire_bytes=stats.wire_bytes,
+                        body_bytes=stats.body_bytes,
+                        reused_connection=stats.reused_connection,
+                        ttfb_seconds=round(stats.ttfb_seconds, 6),
+                    )
+                    last_err = None
+                    break
+                except FETCH_ERRORS as err:
+                    last_err = err
+                    if attempt < retries:
+                        time.sleep(retry_delay)
+
+            if last_err is not None:
+                if out_path.exists():
+                    results[name] = out_path
+                    step.attrs["origin"] = "cache"
+                elif (BOOTSTRAP_DIR / f"{name}.json").exists():
+                    bootstrap = BOOTSTRAP_DIR / f"{name}.json"
+                    out_path.write_text(bootstrap.read_text(encoding="utf-8"), encoding="utf-8")
+                    results[name] = out_path
+                    step.attrs["origin"] = "bootstrap"
+                else:
+                    raise RuntimeError(f"Unable to fetch {name} from {url}: {last_err}") from last_err
 
     return results
 
@@ -67,7 +258,7 @@ def load_cached(name: str) -> Any:
     path = SOURCES_DIR / f"{name}.json"
     if not path.exists():
         raise FileNotFoundError(f"Missing cached source: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
+    return codec.read_json(path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+"""Load curated benchmark milestones and align them with the running-best timeline."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Any
+
+from .config import MILESTONES_PATH
+from .trends import release_ordinal
+
+BENCHMARK_KEYS = {"arc-agi": "arc", "arc": "arc", "hle": "hle"}
+
+
+def _parse_scalar(raw: str) -> Any:
+    value = raw.strip()
+    if not value or value in ("~", "null"):
+        return None
+    if value[0] in "\"'" and value[-1:] == value[0]:
+        return value[1:-1]
+    if value in ("true", "false"):
+        return value == "true"
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _strip_comment(line: str) -> str:
+    quote: str | None = None
+    for i, char in enumerate(line):
+        if char in "\"'":
+            quote = None if quote == char else (quote or char)
+        elif char == "#" and quote is None and (i == 0 or line[i - 1].isspace()):
+            return line[:i]
+    return line
+
+
+def parse_milestones(text: str) -> list[dict[str, Any]]:
+    """Parse the flat ``milestones:`` list used by data/milestones.yaml.
+
+    Only the subset the file needs is supported: one top-level key holding a
+    list of flat mappings with scalar values.
+    """
+    items: list[dict[str, Any]] = []
+    current: dict[str, Any] | None = None
+    in_list = False
+
+    for lineno, raw_line in enumerate(text.splitlines(), start=1):
+        line = _strip_comment(raw_line).rstrip()
+        if not line.strip():
+            continue
+        stripped = line.lstrip()
+        if line == stripped:
+            in_list = stripped.rstrip(":") == "milestones" and stripped.endswith(":")
+            current = None
+            continue
+        if not in_list:
+            continue
+        if stripped.startswith("- "):
+            current = {}
+            items.append(current)
+            stripped = stripped[2:].strip()
+        if current is None or ":" not in stripped:
+            raise ValueError(f"Unsupported milestones syntax on line {lineno}: {raw_line!r}")
+        key, _, value = stripped.partition(":")
+        current[key.strip()] = _parse_scalar(value)
+
+    return items
+
+
+def load_milestones() -> list[dict[str, Any]]:
+    if not MILESTONES_PATH.exists():
+        return []
+    return parse_milestones(MILESTONES_PATH.read_text(encoding="utf-8"))
+
+
+def align_milestones(milestones: list[dict[str, Any]], trend: dict[str, Any]) -> list[dict[str, Any]]:
+    """Place each milestone on its benchmark's running-best frontier.
+
+    Frontier steps rise in both date and score, so the best score at the
+    milestone date and the first step that beats it are both binary searches.
+    A goal the frontier had already beaten by its date is flagged
+    ``already_surpassed`` with ``days_to_surpass`` 0.
+    """
+    indexed: dict[str, tuple[list[int], list[float], list[dict[str, Any]]]] = {}
+    for key, series in trend.items():
+        steps = [s for s in series.get("frontier", []) if release_ordinal(s.get("release_date")) is not None]
+        indexed[key] = (
+            [release_ordinal(s["release_date"]) for s in steps],
+            [s["score"] for s in steps],
+            steps,
+        )
+
+    aligned: list[dict[str, Any]] = []
+    for milestone in milestones:
+        benchmark = str(milestone.get("benchmark") or "")
+        key = BENCHMARK_KEYS.get(benchmark.strip().lower())
+        ordinal = release_ordinal(str(milestone.get("date") or ""))
+        score = milestone.get("score")
+        if key is None or ordinal is None or not isinstance(score, (int, float)):
+            continue
+
+        ords, scores, steps = indexed.get(key, ([], [], []))
+        at = bisect_right(ords, ordinal) - 1
+        surpass = bisect_right(scores, score)
+        current_best = scores[-1] if scores else None
+        surpassed_by = steps[surpass] if surpass < len(steps) else None
+        days = ords[surpass] - ordinal if surpassed_by else None
+
+        aligned.append(
+            {
+                "date": str(milestone["date"]),
+                "benchmark": benchmark,
+                "series": key,
+                "score": float(score),
+                "note": milestone.get("note"),
+                "best_at_date": scores[at] if at >= 0 else None,
+                "surpassed_by": surpassed_by["model"] if surpassed_by else None,
+                "surpassed_on": surpassed_by["release_date"] if surpassed_by else None,
+                "days_to_surpass": max(days, 0) if days is not None else None,
+                "already_surpassed": days is not None and days < 0,
+                "current_best": current_best,
+                "margin": (current_best - score) if current_best is not None else None,
+            }
+        )
+
+    return aligned
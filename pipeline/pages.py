@@ -0,0 +1,287 @@
+"""Static per-model and per-provider detail pages.
+
+Each page is rendered from a small JSON context. The context hashes are kept in
+a manifest, so a rebuild only renders pages whose inputs changed or whose files
+went missing, and removes pages for models that left the catalogue.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from html import escape
+from pathlib import Path
+from typing import Any
+
+from . import codec, storage
+from .config import PROCESSED_DIR, SITE_PAGES_DIR
+from .transform import arc_evaluation_rows, provider_display_names, provider_key
+
+PAGES_MANIFEST_PATH = PROCESSED_DIR / "pages_manifest.json"
+
+# Bump when the page templates change so every page is re-rendered once.
+TEMPLATE_VERSION = 1
+
+# Fewer dirty pages than this are rendered inline; process start-up would cost more.
+PARALLEL_MIN_PAGES = 256
+
+Page = tuple[str, dict[str, Any]]  # (page id such as "models/gpt-4o", context)
+
+
+def _by_model(points: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    return {p["model"]: p for p in points}
+
+
+def build_contexts(
+    unified: list[dict[str, Any]],
+    analysis: dict[str, Any],
+    evaluations: list[dict[str, Any]],
+) -> list[Page]:
+    """Every page id with the data it renders, including the index page."""
+    efficiency = _by_model(analysis.get("efficiency_map", {}).get("points", []))
+    confidence = _by_model(analysis.get("confidence_lens", {}).get("points", []))
+    transfer = _by_model(analysis.get("transfer_gap", {}).get("points", []))
+    runs: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for row in evaluations:
+        if row.get("display", True):
+            runs[row["model_key"]].append(
+                {"dataset_id": row.get("dataset_id"), "score": row.get("score"), "cost_per_task": row.get("cost_per_task")}
+            )
+
+    provider_names = provider_display_names(unified)
+
+    pages: list[Page] = []
+    members: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for row in sorted(unified, key=lambda r: r["model_key"]):
+        name = row["canonical_name"]
+        provider_slug = provider_key(row.get("provider"))
+        eff, conf, gap = efficiency.get(name, {}), confidence.get(name, {}), transfer.get(name, {})
+        context = {
+            "model": name,
+            "model_key": row["model_key"],
+            "provider": provider_names[provider_slug],
+            "provider_slug": provider_slug,
+            "release_date": row.get("release_date"),
+            "arc": {
+                "score": row.get("arc_score"),
+                "score_ci": eff.get("score_ci"),
+                "cost_per_task": row.get("arc_cost_per_task"),
+                "tasks_evaluated": row.get("arc_tasks_evaluated"),
+                "efficiency_ratio": eff.get("efficiency_ratio"),
+                "pareto_probability": eff.get("pareto_probability"),
+                "runs": sorted(runs.get(row["model_key"], []), key=lambda r: str(r["dataset_id"])),
+            },
+            "hle": {
+                "score": row.get("hle_score"),
+                "score_ci": conf.get("hle_score_ci"),
+                "calibration_error": row.get("calibration_error"),
+                "arc_agi_2": row.get("hle_arc_agi_2"),
+            },
+            "transfer_gap": gap.get("gap"),
+            "transfer_gap_ci": gap.get("gap_ci"),
+            "sources": {"arc": row.get("source_arc"), "hle": row.get("source_hle")},
+        }
+        pages.append((f"models/{row['model_key']}", context))
+        members[provider_slug].append(
+            {
+                "model": name,
+                "model_key": row["model_key"],
+                "release_date": row.get("release_date"),
+                "arc_score": row.get("arc_score"),
+                "hle_score": row.get("hle_score"),
+                "arc_cost_per_task": row.get("arc_cost_per_task"),
+            }
+        )
+
+    for slug in sorted(members):
+        pages.append((f"providers/{slug}", {"provider": provider_names[slug], "slug": slug, "models": members[slug]}))
+    pages.append(
+        (
+            "index",
+            {
+                "providers": [
+                    {"provider": provider_names[slug], "slug": slug, "models": len(members[slug])} for slug in sorted(members)
+                ]
+            },
+        )
+    )
+    return pages
+
+
+def _fmt(value: Any, digits: int = 1, suffix: str = "") -> str:
+    if value is None:
+        return "n/a"
+    if isinstance(value, float):
+        return f"{value:.{digits}f}{suffix}"
+    return escape(str(value))
+
+
+def _money(value: float | None) -> str:
+    return "n/a" if value is None else f"${value:.4f}"
+
+
+def _interval(ci: list[float] | None, digits: int = 1) -> str:
+    return f" [{ci[0]:.{digits}f}–{ci[1]:.{digits}f}]" if ci else ""
+
+
+def _document(title: str, root: str, body: list[str]) -> str:
+    return "\n".join(
+        [
+            "<!doctype html>",
+            '<html lang="en">',
+            "  <head>",
+            '    <meta charset="UTF-8" />',
+            '    <meta name="viewport" content="width=device-width, initial-scale=1.0" />',
+            f"    <title>{escape(title)} · AGI Gap Atlas</title>",
+            f'    <link rel="stylesheet" href="{root}style.css" />',
+            "  </head>",
+            "  <body>",
+            '    <main class="layout detail">',
+            f'      <p class="kicker"><a href="{root}index.html">AGI Gap Atlas</a> / <a href="{root}pages/index.html">All providers</a></p>',
+            *body,
+            "    </main>",
+            "  </body>",
+            "</html>",
+            "",
+        ]
+    )
+
+
+def _table(headers: list[str], rows: list[list[str]]) -> list[str]:
+    out = ['      <table class="detail-table">', "        <tr>" + "".join(f"<th>{h}</th>" for h in headers) + "</tr>"]
+    out += ["        <tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>" for row in rows]
+    out.append("      </table>")
+    return out
+
+
+def _render_model(ctx: dict[str, Any]) -> str:
+    arc, hle = ctx["arc"], ctx["hle"]
+    probability = arc["pareto_probability"]
+    body = [
+        f"      <h1>{escape(ctx['model'])}</h1>",
+        f'      <p class="meta"><a href="../providers/{ctx["provider_slug"]}.html">{escape(ctx["provider"])}</a>'
+        f" · released {_fmt(ctx['release_date'])}</p>",
+        '      <section class="chart-card">',
+        "        <h2>Scores</h2>",
+        *_table(
+            ["Benchmark", "Score (95% CI)", "Detail"],
+            [
+                [
+                    "ARC-AGI",
+                    _fmt(arc["score"], suffix="%") + _interval(arc["score_ci"]),
+                    f"{_money(arc['cost_per_task'])} per task · efficiency {_fmt(arc['efficiency_ratio'], 2)}"
+                    + (f" · on the cost frontier in {probability:.0%} of resamples" if probability is not None else ""),
+                ],
+                [
+                    "HLE",
+                    _fmt(hle["score"], suffix="%") + _interval(hle["score_ci"]),
+                    f"calibration error {_fmt(hle['calibration_error'])}",
+                ],
+                ["ARC − HLE", _fmt(ctx["transfer_gap"]) + _interval(ctx["transfer_gap_ci"]), ""],
+            ],
+        ),
+        "      </section>",
+    ]
+    if arc["runs"]:
+        body += [
+            '      <section class="chart-card">',
+            "        <h2>ARC evaluations</h2>",
+            *_table(
+                ["Dataset", "Score", "Cost/task"],
+                [[_fmt(r["dataset_id"]), _fmt(r["score"]), _money(r["cost_per_task"])] for r in arc["runs"]],
+            ),
+            "      </section>",
+        ]
+    body.append(f'      <p class="meta"><a href="{ctx["model_key"]}.json">JSON</a></p>')
+    return _document(ctx["model"], "../../", body)
+
+
+def _render_provider(ctx: dict[str, Any]) -> str:
+    rows = [
+        [
+            f'<a href="../models/{m["model_key"]}.html">{escape(m["model"])}</a>',
+            _fmt(m["release_date"]),
+            _fmt(m["arc_score"]),
+            _fmt(m["hle_score"]),
+            _money(m["arc_cost_per_task"]),
+        ]
+        for m in ctx["models"]
+    ]
+    body = [
+        f"      <h1>{escape(ctx['provider'])}</h1>",
+        f'      <p class="meta">{len(ctx["models"])} models · <a href="{ctx["slug"]}.json">JSON</a></p>',
+        '      <section class="chart-card">',
+        *_table(["Model", "Released", "ARC (%)", "HLE (%)", "ARC cost/task"], rows),
+        "      </section>",
+    ]
+    return _document(ctx["provider"], "../../", body)
+
+
+def _render_index(ctx: dict[str, Any]) -> str:
+    rows = [[f'<a href="providers/{p["slug"]}.html">{escape(p["provider"])}</a>', str(p["models"])] for p in ctx["providers"]]
+    body = ["      <h1>Providers</h1>", '      <section class="chart-card">', *_table(["Provider", "Models"], rows), "      </section>"]
+    return _document("Providers", "../", body)
+
+
+def render_page(page_id: str, context: dict[str, Any]) -> tuple[bytes, bytes]:
+    """HTML and JSON bytes for one page; pure, so it can run in a worker process."""
+    kind = page_id.split("/", 1)[0]
+    render = {"models": _render_model, "providers": _render_provider, "index": _render_index}[kind]
+    return render(context).encode("utf-8"), codec.dumpb(context, pretty=False, sort_keys=True)
+
+
+def _render_many(pages: list[Page], workers: int) -> list[tuple[bytes, bytes]]:
+    if workers <= 1 or len(pages) < PARALLEL_MIN_PAGES:
+        return [render_page(page_id, context) for page_id, context in pages]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(pages) // (workers * 4))
+        return list(pool.map(render_page, *zip(*pages), chunksize=chunksize))
+
+
+def _page_hash(context: dict[str, Any]) -> str:
+    return storage.content_hash(codec.dumpb([TEMPLATE_VERSION, context], pretty=False, sort_keys=True))
+
+
+def _page_paths(page_id: str) -> tuple[Path, Path]:
+    return SITE_PAGES_DIR / f"{page_id}.html", SITE_PAGES_DIR / f"{page_id}.json"
+
+
+def build_pages(pages: list[Page], workers: int | None = None) -> dict[str, int]:
+    """Render pages whose context hash changed and drop pages no longer listed."""
+    previous = codec.read_json(PAGES_MANIFEST_PATH) if PAGES_MANIFEST_PATH.exists() else {}
+    hashes = {page_id: _page_hash(context) for page_id, context in pages}
+
+    dirty = [
+        (page_id, context)
+        for page_id, context in pages
+        if previous.get(page_id) != hashes[page_id] or not all(p.exists() for p in _page_paths(page_id))
+    ]
+    for (page_id, _), (html, data) in zip(dirty, _render_many(dirty, workers or os.cpu_count() or 1)):
+        html_path, json_path = _page_paths(page_id)
+        storage.write_if_changed(html_path, html)
+        storage.write_if_changed(json_path, data)
+
+    removed = [page_id for page_id in previous if page_id not in hashes]
+    for page_id in removed:
+        for path in _page_paths(page_id):
+            path.unlink(missing_ok=True)
+
+    codec.write_json(PAGES_MANIFEST_PATH, hashes, sort_keys=True)
+    return {"pages": len(pages), "rendered": len(dirty), "removed": len(removed)}
+
+
+def export_pages(workers: int | None = None) -> dict[str, int]:
+    """Build detail pages from the unified records and analysis payload."""
+    pages = build_contexts(
+        codec.read_json(PROCESSED_DIR / "unified_models.json"),
+        codec.read_json(PROCESSED_DIR / "analysis.json"),
+        arc_evaluation_rows(),
+    )
+    return build_pages(pages, workers)
+
+
+if __name__ == "__main__":
+    print(export_pages())
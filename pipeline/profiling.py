@@ -0,0 +1,214 @@
+"""Lightweight spans for per-stage timing, memory and row counts.
+
+Spans are no-ops unless a ``recording()`` block is active, so stage code can
+be instrumented unconditionally. Each thread nests its own spans; a span opened
+with nothing above it in its thread becomes a root. A span's ``cpu_seconds``
+is its own thread's CPU time; the report's totals are for the whole process
+over the recording, so overlapping stages are not counted twice. tracemalloc
+keeps a single process-wide peak, so ``peak_bytes`` is only exact for stages
+that did not overlap with others.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+from . import codec
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float | None = None
+    peak_bytes: int | None = None
+    net_bytes: int | None = None
+    rows_in: int | None = None
+    rows_out: int | None = None
+    calls: int = 1
+    attrs: dict[str, Any] = field(default_factory=dict)
+    children: list["Span"] = field(default_factory=list)
+    _child_peak: int = field(default=0, repr=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"name": self.name, "wall_seconds": round(self.wall_seconds, 6)}
+        if self.cpu_seconds is not None:
+            out["cpu_seconds"] = round(self.cpu_seconds, 6)
+        for key in ("peak_bytes", "net_bytes", "rows_in", "rows_out"):
+            value = getattr(self, key)
+            if value is not None:
+                out[key] = value
+        if self.calls != 1:
+            out["calls"] = self.calls
+        if self.attrs:
+            out["attrs"] = self.attrs
+        if self.children:
+            out["children"] = [child.to_dict() for child in self.children]
+        return out
+
+
+class Recorder:
+    def __init__(self, trace_memory: bool = True, profile_dir: Path | None = None) -> None:
+        self.trace_memory = trace_memory
+        self.profile_dir = profile_dir
+        self.roots: list[Span] = []
+        self.attrs: dict[str, Any] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started = (time.perf_counter(), time.process_time())
+        self._elapsed: tuple[float, float] | None = None
+
+    def elapsed(self) -> tuple[float, float]:
+        """Process wall and CPU seconds since the recording began (or until it ended)."""
+        if self._elapsed is not None:
+            return self._elapsed
+        wall, cpu = self._started
+        return time.perf_counter() - wall, time.process_time() - cpu
+
+    def close(self) -> None:
+        self._elapsed = self.elapsed()
+
+    @property
+    def stack(self) -> list[Span]:
+        """Open spans of the calling thread, innermost last."""
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _attach(self, node: Span) -> None:
+        stack = self.stack
+        if stack:
+            stack[-1].children.append(node)
+        else:
+            with self._lock:
+                self.roots.append(node)
+
+    def _fold_peak(self) -> None:
+        # tracemalloc has a single peak counter; fold it into the open span
+        # before a child resets it so parents still see the true maximum.
+        if self.trace_memory and self.stack:
+            parent = self.stack[-1]
+            parent._child_peak = max(parent._child_peak, tracemalloc.get_traced_memory()[1])
+
+    def to_dict(self) -> dict[str, Any]:
+        wall, cpu = self.elapsed()
+        return {
+            "process_wall_seconds": round(wall, 6),
+            "process_cpu_seconds": round(cpu, 6),
+            "peak_bytes": max((s.peak_bytes or 0 for s in self.roots), default=0),
+            "spans": [s.to_dict() for s in self.roots],
+            **({"attrs": self.attrs} if self.attrs else {}),
+        }
+
+
+_ACTIVE: Recorder | None = None
+
+
+@contextmanager
+def recording(
+    report_path: Path | None = None,
+    profile_dir: Path | None = None,
+    trace_memory: bool = True,
+) -> Iterator[Recorder]:
+    """Collect spans for the duration of the block and optionally write a report."""
+    global _ACTIVE
+    recorder = Recorder(trace_memory=trace_memory, profile_dir=profile_dir)
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    previous, _ACTIVE = _ACTIVE, recorder
+    started_at = datetime.now(UTC).isoformat()
+    try:
+        yield recorder
+    finally:
+        recorder.close()
+        _ACTIVE = previous
+        if started_tracing:
+            tracemalloc.stop()
+        if report_path is not None:
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report = {"started_at": started_at, **recorder.to_dict()}
+            codec.write_json(report_path, report)
+
+
+@contextmanager
+def span(name: str, rows_in: int | None = None, **attrs: Any) -> Iterator[Span]:
+    """Time one stage or sub-step; set ``rows_out``/``attrs`` on the yielded span."""
+    recorder = _ACTIVE
+    node = Span(name=name, rows_in=rows_in, attrs=dict(attrs))
+    if recorder is None:
+        yield node
+        return
+
+    recorder._attach(node)
+    recorder._fold_peak()
+    if recorder.trace_memory:
+        tracemalloc.reset_peak()
+        mem_start = tracemalloc.get_traced_memory()[0]
+    profiler = None
+    if recorder.profile_dir is not None and not recorder.stack:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    recorder.stack.append(node)
+
+    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield node
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        node.wall_seconds = time.perf_counter() - wall_start
+        node.cpu_seconds = time.thread_time() - cpu_start
+        recorder.stack.pop()
+        if recorder.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            node.peak_bytes = max(peak, node._child_peak)
+            node.net_bytes = current - mem_start
+            tracemalloc.reset_peak()
+            if recorder.stack:
+                parent = recorder.stack[-1]
+                parent._child_peak = max(parent._child_peak, node.peak_bytes)
+        if profiler is not None:
+            recorder.profile_dir.mkdir(parents=True, exist_ok=True)
+            out = recorder.profile_dir / f"{name}.prof"
+            profiler.dump_stats(str(out))
+            node.attrs["profile"] = str(out)
+
+
+def timed(name: str, func: F) -> F:
+    """Wrap a hot per-row helper so its calls aggregate into one span.
+
+    Returns ``func`` untouched when no recording is active.
+    """
+    recorder = _ACTIVE
+    if recorder is None:
+        return func
+
+    node = Span(name=name, calls=0)
+    recorder._attach(node)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            node.wall_seconds += time.perf_counter() - start
+            node.calls += 1
+
+    return wrapper  # type: ignore[return-value]
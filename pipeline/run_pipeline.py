@@ -1,18 +1,47 @@
-"""Single-command pipeline runner."""
+"""Single-command pipeline runner.
+
+The stages are declared as a graph (see dag.py) and run as soon as their
+inputs are ready; the run ends with a critical-path summary. Each stage
+imports its own modules when it runs, so a subgraph loads only what it needs.
+"""
 
 from __future__ import annotations
 
+import argparse
+import importlib.util
+import threading
 from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
 
-from .analyze import build_analysis_payload, write_analysis
-from .charts import generate as generate_chart_previews
-from .export import export_site_data
-from .ingest import fetch_all
-from .transform import normalize_sources, write_unified
+from . import codec
+from .config import PROCESSED_DIR, SOURCES
+from .dag import DEFAULT_WORKERS, Artifacts, Graph, Stage
+from .profiling import recording, span
+from .transform import (
+    NORMALIZED_SOURCES,
+    count_usable_records,
+    load_source_payload,
+    normalize_sources,
+    write_unified,
+)
 
 ROOT = Path(__file__).resolve().parents[1]
 BOOTSTRAP_DIR = ROOT / "data" / "bootstrap"
 SOURCES_DIR = ROOT / "data" / "sources"
+RUN_REPORT_PATH = PROCESSED_DIR / "run_report.json"
+PROFILE_DIR = PROCESSED_DIR / "profiles"
+
+# arc_evaluation_rows() reads these sources again, after any bootstrap fallback.
+ARC_EVALUATION_INPUTS = ("checked/arc_evaluations", "checked/arc_models")
+
+_PRINT_LOCK = threading.Lock()
+
+
+def _log(message: str) -> None:
+    # Stages print from worker threads; keep each message on its own line.
+    with _PRINT_LOCK:
+        print(message)
 
 
 def _has_chart_data(payload: dict) -> bool:
@@ -23,37 +52,261 @@ def _has_chart_data(payload: dict) -> bool:
     )
 
 
-def _restore_bootstrap_sources() -> None:
-    for file in BOOTSTRAP_DIR.glob("*.json"):
-        target = SOURCES_DIR / file.name
-        target.write_text(file.read_text(encoding="utf-8"), encoding="utf-8")
+def _restore_bootstrap_source(name: str) -> bool:
+    bootstrap = BOOTSTRAP_DIR / f"{name}.json"
+    if not bootstrap.exists():
+        return False
+    (SOURCES_DIR / bootstrap.name).write_text(bootstrap.read_text(encoding="utf-8"), encoding="utf-8")
+    return True
+
+
+def _usable(name: str) -> tuple[Any, int]:
+    """The parsed source and its usable row count; (None, 0) if it is missing or malformed."""
+    try:
+        payload = load_source_payload(name)
+        return payload, count_usable_records(name, payload)
+    except (OSError, codec.DecodeError, ValueError, KeyError, TypeError, AttributeError):
+        return None, 0
+
+
+def _checked_payload(name: str) -> Any:
+    """Parse one normalized source, falling back to bootstrap only if it is unusable."""
+    with span(f"check.{name}") as step:
+        payload, usable = _usable(name)
+        if usable == 0 and _restore_bootstrap_source(name):
+            _log(f"No usable records in {name}, restoring bootstrap copy...")
+            payload, usable = _usable(name)
+            step.attrs["restored_bootstrap"] = True
+        step.rows_out = usable
+    return payload
+
+
+def sources_by_host() -> dict[str, list[str]]:
+    """Source names grouped by host, in SOURCES order."""
+    groups: dict[str, list[str]] = {}
+    for name, url in SOURCES.items():
+        groups.setdefault(urlsplit(url).hostname or "", []).append(name)
+    return groups
+
+
+def _fetch_stage(host: str, names: list[str]) -> Stage:
+    # One stage per host, so its sources share a connection while hosts overlap.
+    def run(_: Artifacts) -> Artifacts:
+        # Imported here so graphs without a fetch stage never load the network stack.
+        from .ingest import fetch_all
 
+        _log(f"Fetching {', '.join(names)}...")
+        return {f"sources/{name}": path for name, path in fetch_all(names=names).items()}
 
-def run() -> None:
-    print("1/5 Fetching source data...")
-    fetch_all()
+    return Stage(f"fetch.{host}", run, outputs=tuple(f"sources/{name}" for name in names), modules=("ingest",))
 
-    print("2/5 Normalizing records...")
-    records = normalize_sources()
-    write_unified(records)
 
-    print("3/5 Computing derived datasets...")
-    payload = build_analysis_payload()
-    if not _has_chart_data(payload):
-        print("No chart data parsed from live sources, restoring bootstrap data...")
-        _restore_bootstrap_sources()
-        records = normalize_sources()
+def _check_stage(name: str) -> Stage:
+    return Stage(
+        f"check.{name}",
+        lambda _: {f"checked/{name}": _checked_payload(name)},
+        inputs=(f"sources/{name}",),
+        outputs=(f"checked/{name}",),
+    )
+
+
+def _normalize(inputs: Artifacts) -> Artifacts:
+    _log("Normalizing records...")
+    with span("normalize") as step:
+        # Sources not checked in this run are read from disk.
+        payloads = {name: inputs[f"checked/{name}"] for name in NORMALIZED_SOURCES if f"checked/{name}" in inputs}
+        records = normalize_sources(payloads)
         write_unified(records)
+        step.rows_out = len(records)
+    return {"unified": records}
+
+
+def _analyze(inputs: Artifacts) -> Artifacts:
+    from .analyze import build_analysis_payload, write_analysis
+
+    _log("Computing derived datasets...")
+    records = inputs.get("unified")
+    with span("analyze", rows_in=None if records is None else len(records)) as step:
         payload = build_analysis_payload()
-    write_analysis(payload)
+        if not _has_chart_data(payload):
+            _log("Warning: no chart data parsed from sources or bootstrap copies.")
+        path = write_analysis(payload)
+        step.attrs.update(payload.get("summary", {}))
+    return {"analysis": path}
+
+
+def _cube(_: Artifacts) -> Artifacts:
+    from .analyze import build_cube_payload
+    from .cube import write_cube
+
+    with span("cube") as step:
+        cube = build_cube_payload()
+        step.rows_out = len(cube["cells"])
+        return {"cube": write_cube(cube)}
+
+
+def _export(_: Artifacts) -> Artifacts:
+    from .export import export_site_data
+
+    _log("Exporting site/data.json...")
+    with span("export"):
+        return {"site_data": export_site_data()}
+
 
-    print("4/5 Exporting site/data.json...")
-    path = export_site_data()
+def _search_index(_: Artifacts) -> Artifacts:
+    from .search import export_search_index
 
-    print("5/5 Rendering static chart previews...")
-    generate_chart_previews()
-    print(f"Done: {path}")
+    with span("search_index") as step:
+        stats = export_search_index()
+        step.rows_out = stats["terms"]
+        step.attrs.update(stats)
+    _log(
+        f"Search index: {stats['terms']} terms, {stats['trigrams']} trigrams, "
+        f"{stats['bytes'] / 1024:.1f} KiB, built in {stats['build_seconds']:.3f}s"
+    )
+    return {"search_index": stats}
+
+
+def _pages(_: Artifacts) -> Artifacts:
+    from .pages import export_pages
+
+    _log("Rendering detail pages...")
+    with span("pages") as step:
+        stats = export_pages()
+        step.rows_out = stats["rendered"]
+        step.attrs.update(stats)
+    return {"pages": stats}
+
+
+def _hle_subjects(_: Artifacts) -> Artifacts:
+    from .hle_logs import export_hle_subjects
+
+    with span("hle_subjects") as step:
+        stats = export_hle_subjects()
+        if stats is None:
+            step.attrs["logs"] = 0
+            return {"hle_subjects": None}
+        step.rows_in = stats["lines"]
+        step.rows_out = stats["subjects"] * stats["models"]
+        step.attrs.update(stats)
+    _log(
+        f"HLE logs: {stats['lines']} lines from {stats['files']} files, "
+        f"{stats['subjects']} subjects x {stats['models']} models ({stats['unmatched']} not in unified, "
+        f"{stats['skipped_lines']} lines skipped, {stats['damaged_files']} damaged files)"
+    )
+    return {"hle_subjects": stats}
+
+
+def _charts(_: Artifacts) -> None:
+    from .charts import generate as generate_chart_previews
+
+    _log("Rendering static chart previews...")
+    with span("charts"):
+        generate_chart_previews()
+
+
+def _columnar_stage(fmt: str) -> Stage:
+    def run(_: Artifacts) -> Artifacts:
+        # Imported here so runs without the flag never need pyarrow.
+        from .columnar import export_columnar
+
+        _log(f"Writing {fmt} tables...")
+        with span("columnar", format=fmt) as step:
+            tables = export_columnar(fmt)
+            step.rows_out = len(tables)
+        return {"columnar": tables}
+
+    return Stage(
+        "columnar",
+        run,
+        inputs=("unified", "analysis", "cube", "hle_subjects", *ARC_EVALUATION_INPUTS),
+        outputs=("columnar",),
+        modules=("columnar",),
+    )
+
+
+def build_graph(columnar: str | None = None) -> Graph:
+    """Every pipeline stage with the artifacts it reads and writes."""
+    stages = [_fetch_stage(host, names) for host, names in sources_by_host().items()]
+    stages += [_check_stage(name) for name in NORMALIZED_SOURCES]
+    # normalize, pages and hle_subjects may fork process pools, so they run exclusively.
+    stages += [
+        Stage(
+            "normalize",
+            _normalize,
+            inputs=tuple(f"checked/{n}" for n in NORMALIZED_SOURCES),
+            outputs=("unified",),
+            exclusive=True,
+        ),
+        Stage("analyze", _analyze, inputs=("unified",), outputs=("analysis",), modules=("analyze",)),
+        Stage("cube", _cube, inputs=("unified",), outputs=("cube",), modules=("analyze", "cube")),
+        Stage("export", _export, inputs=("analysis",), outputs=("site_data",), modules=("export",)),
+        Stage(
+            "search_index",
+            _search_index,
+            inputs=("unified", *ARC_EVALUATION_INPUTS),
+            outputs=("search_index",),
+            modules=("search",),
+        ),
+        Stage(
+            "pages",
+            _pages,
+            inputs=("unified", "analysis", *ARC_EVALUATION_INPUTS),
+            outputs=("pages",),
+            modules=("pages",),
+            exclusive=True,
+        ),
+        Stage("charts", _charts, inputs=("analysis",), outputs=("charts",), modules=("charts",)),
+        # Needs only unified records; a no-op until logs exist under HLE_LOGS_DIR.
+        Stage(
+            "hle_subjects",
+            _hle_subjects,
+            inputs=("unified",),
+            outputs=("hle_subjects",),
+            modules=("hle_logs",),
+            exclusive=True,
+        ),
+    ]
+    if columnar:
+        stages.append(_columnar_stage(columnar))
+    return Graph(stages)
+
+
+def run(profile: bool = False, columnar: str | None = None, workers: int = DEFAULT_WORKERS) -> None:
+    # cProfile output and memory peaks are only per-stage when stages do not overlap.
+    with recording(report_path=RUN_REPORT_PATH, profile_dir=PROFILE_DIR if profile else None) as recorder:
+        result = build_graph(columnar).run(workers=1 if profile else workers)
+        recorder.attrs["schedule"] = result.to_dict()
+    print(f"Done: {result.artifacts['site_data']}")
+    print(result.summary())
+    print(f"Run report: {RUN_REPORT_PATH}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the full AGI Gap Atlas pipeline")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"Also dump cProfile stats per stage under {PROFILE_DIR}",
+    )
+    parser.add_argument(
+        "--columnar",
+        nargs="?",
+        const="arrow",
+        choices=("arrow", "parquet"),
+        help="Also write typed Arrow IPC (default) or Parquet tables; needs pyarrow",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Stages to run at once; --profile implies 1",
+    )
+    args = parser.parse_args()
+    if args.columnar and importlib.util.find_spec("pyarrow") is None:
+        parser.error("--columnar needs pyarrow: pip install -e .[columnar]")
+    run(profile=args.profile, columnar=args.columnar, workers=args.jobs)
 
 
 if __name__ == "__main__":
-    run()
+    main()
@@ -0,0 +1,97 @@
+"""Prefix/trigram search index over model names, raw ids and aliases.
+
+The site fetches ``search-index.json`` only when search is first used:
+- ``terms`` are normalized names, sorted so that a prefix match is one binary
+  search away;
+- ``grams`` map each trigram to the ids of the terms containing it, as
+  delta-encoded posting lists, for typo-tolerant lookups.
+``site/search.js`` must normalize and split queries exactly like this module.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Any
+
+from . import codec
+from .config import ALIASES_PATH, PROCESSED_DIR, SITE_SEARCH_INDEX_PATH
+from .transform import arc_evaluation_rows
+
+INDEX_VERSION = 1
+
+
+def normalize(text: str) -> str:
+    """Lowercase ASCII words separated by single spaces; accents are folded."""
+    return " ".join(re.findall(r"[a-z0-9]+", unicodedata.normalize("NFKD", text).lower()))
+
+
+def trigrams(term: str) -> set[str]:
+    padded = f" {term} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _delta(ids: list[int]) -> list[int]:
+    return [ids[0]] + [b - a for a, b in zip(ids, ids[1:])]
+
+
+def build_index(
+    unified: list[dict[str, Any]],
+    aliases: dict[str, str],
+    raw_ids: dict[str, set[str]],
+) -> dict[str, Any]:
+    """Index every name a model is known by.
+
+    ``aliases`` maps alias keys to canonical names, as in model_aliases.json;
+    ``raw_ids`` maps model_key to the source ids that resolved to it.
+    """
+    rows = sorted(unified, key=lambda r: r["model_key"])
+    by_name = {row["canonical_name"]: i for i, row in enumerate(rows)}
+    names: dict[str, set[int]] = defaultdict(set)
+    for i, row in enumerate(rows):
+        for text in (row["canonical_name"], row["model_key"], *raw_ids.get(row["model_key"], ())):
+            names[normalize(text)].add(i)
+    for alias, canonical in aliases.items():
+        if canonical in by_name:
+            names[normalize(alias)].add(by_name[canonical])
+
+    pairs = sorted((term, model) for term, models in names.items() if term for model in models)
+    postings: dict[str, list[int]] = defaultdict(list)
+    for term_id, (term, _) in enumerate(pairs):
+        for gram in trigrams(term):
+            postings[gram].append(term_id)
+
+    return {
+        "version": INDEX_VERSION,
+        "models": [[row["canonical_name"], row["model_key"], row.get("provider")] for row in rows],
+        "terms": [term for term, _ in pairs],
+        "term_models": [model for _, model in pairs],
+        "grams": {gram: _delta(ids) for gram, ids in postings.items()},
+    }
+
+
+def export_search_index() -> dict[str, Any]:
+    """Write the site search index; return its size and build time for the run report."""
+    unified = codec.read_json(PROCESSED_DIR / "unified_models.json")
+    aliases = {str(k): str(v) for k, v in codec.read_json(ALIASES_PATH).items()} if ALIASES_PATH.exists() else {}
+    raw_ids: dict[str, set[str]] = defaultdict(set)
+    for row in arc_evaluation_rows():
+        raw_ids[row["model_key"]].add(row["model_id"])
+
+    started = time.perf_counter()
+    index = build_index(unified, aliases, raw_ids)
+    build_seconds = time.perf_counter() - started
+    codec.write_json(SITE_SEARCH_INDEX_PATH, index, pretty=False, sort_keys=True)
+    return {
+        "models": len(index["models"]),
+        "terms": len(index["terms"]),
+        "trigrams": len(index["grams"]),
+        "bytes": SITE_SEARCH_INDEX_PATH.stat().st_size,
+        "build_seconds": round(build_seconds, 6),
+    }
+
+
+if __name__ == "__main__":
+    print(export_search_index())
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import os
 import re
+from collections import Counter
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any
+from itertools import islice
+from typing import Any, Callable, Iterable
 
+from . import codec
 from .config import ALIASES_PATH, PROCESSED_DIR, SOURCES_DIR
+from .profiling import span, timed
 
 
 MODEL_KEY_CANDIDATES = (
@@ -28,6 +32,55 @@ PROVIDER_KEY_CANDIDATES = (
     "company",
 )
 
+ARC_SCORE_KEY_CANDIDATES = ("score", "overall_score", "pass_rate", "accuracy")
+
+HLE_SCORE_KEY_CANDIDATES = (
+    "hle",
+    "hleScore",
+    "hle_score",
+    "humanitys_last_exam",
+    "humanitysLastExam",
+    "score",
+    "accuracy",
+)
+
+CALIBRATION_KEY_CANDIDATES = (
+    "calibration_error",
+    "hle_calibration_error",
+    "calibrationError",
+    "ece",
+    "expected_calibration_error",
+)
+
+ARC_RELEASE_KEY_CANDIDATES = ("release_date", "releaseDate", "modelReleaseDate", "created_at", "date")
+ARC_META_RELEASE_KEY_CANDIDATES = ("modelReleaseDate", "release_date", "releaseDate", "created_at", "date")
+HLE_RELEASE_KEY_CANDIDATES = ("release_date", "releaseDate", "created_at", "date")
+COST_KEY_CANDIDATES = ("costPerTask", "cost_per_task", "cost", "usd_per_task")
+TASKS_KEY_CANDIDATES = ("tasks_evaluated", "tasksEvaluated", "num_tasks", "n_tasks", "sample_size")
+HLE_ARC_KEY_CANDIDATES = ("arc_agi_2", "arcAgi2", "arc", "arc_score")
+
+# Unified HLE field -> variants looked up inside a record's "scores" object.
+HLE_SCORE_VARIANTS = {
+    "hle": ("hleScore", "hle_score", "humanitys_last_exam", "humanitysLastExam"),
+    "calibration_error": (
+        "hle_calibration_error",
+        "calibrationError",
+        "calibration_error",
+        "ece",
+        "expected_calibration_error",
+    ),
+    "arc_agi_2": ("arcAgi2", "arc_agi_2", "arc", "arc_score"),
+}
+
+# Rows inspected per source when compiling field accessors.
+SCHEMA_SAMPLE_SIZE = 32
+
+# Sources that normalize_sources reads; the rest are fetched for reference only.
+NORMALIZED_SOURCES = ("arc_evaluations", "arc_models", "hle_models")
+
+# Below this many evaluation + HLE rows, process start-up costs more than it saves.
+PARALLEL_MIN_ROWS = 200_000
+
 
 @dataclass
 class UnifiedModelRecord:
@@ -51,7 +104,7 @@ def _slugify(text: str) -> str:
 
 
 def _read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return codec.read_json(path)
 
 
 def _load_aliases() -> dict[str, str]:
@@ -172,91 +225,255 @@ def _flatten_hle_record(item: dict[str, Any]) -> dict[str, Any]:
             if key not in flat:
                 flat[key] = value
         # Normalize common score-key variants to unified field names.
-        if "hle" not in flat:
-            for key in ("hleScore", "hle_score", "humanitys_last_exam", "humanitysLastExam"):
-                if key in scores:
-                    flat["hle"] = scores[key]
-                    break
-        if "calibration_error" not in flat:
-            for key in ("hle_calibration_error", "calibrationError", "calibration_error", "ece", "expected_calibration_error"):
-                if key in scores:
-                    flat["calibration_error"] = scores[key]
-                    break
-        if "arc_agi_2" not in flat:
-            for key in ("arcAgi2", "arc_agi_2", "arc", "arc_score"):
-                if key in scores:
-                    flat["arc_agi_2"] = scores[key]
-                    break
+        for field, variants in HLE_SCORE_VARIANTS.items():
+            if field not in flat:
+                for key in variants:
+                    if key in scores:
+                        flat[field] = scores[key]
+                        break
     return flat
 
 
-def normalize_sources() -> list[UnifiedModelRecord]:
-    aliases = _load_aliases()
+def _extract_hle_first(item: dict[str, Any], keys: tuple[str, ...]) -> Any:
+    """``_extract_first(_flatten_hle_record(item), keys)`` without the copy."""
+    scores = item.get("scores")
+    if not isinstance(scores, dict):
+        return _extract_first(item, keys)
+    for key in keys:
+        if key in item:
+            return item[key]
+        if key in scores:
+            return scores[key]
+        for variant in HLE_SCORE_VARIANTS.get(key, ()):
+            if variant in scores:
+                return scores[variant]
+    return None
+
+
+Accessor = Callable[[dict[str, Any]], Any]
+
+
+def _sample(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    return list(islice(rows, SCHEMA_SAMPLE_SIZE))
+
+
+def _present_key(sample: list[dict[str, Any]], keys: tuple[str, ...]) -> str | None:
+    """Highest-priority candidate that any sampled row carries."""
+    for key in keys:
+        if any(key in row for row in sample):
+            return key
+    return None
+
+
+def compile_accessor(sample: list[dict[str, Any]], keys: tuple[str, ...]) -> Accessor:
+    """Build a getter equivalent to ``_extract_first(row, keys)`` for one source.
+
+    Sources are assumed to share one schema per payload, so the key seen in
+    the first rows is read directly; rows without it fall back to the probe.
+    """
+    key = _present_key(sample, keys)
+    if key is None:
+        return lambda item: _extract_first(item, keys)
+
+    def get(item: dict[str, Any]) -> Any:
+        if key in item:
+            return item[key]
+        return _extract_first(item, keys)
+
+    return get
+
+
+def compile_hle_accessor(sample: list[dict[str, Any]], keys: tuple[str, ...]) -> Accessor:
+    """Like compile_accessor, but reads through the nested "scores" object.
+
+    Resolves once where ``_flatten_hle_record`` would find the field, so rows
+    matching the sampled layout are read without copying the record; any other
+    row goes through ``_extract_hle_first``. As with compile_accessor, a row
+    that carries a higher-priority candidate next to the sampled one is read
+    at the sampled spot (checking for that costs more than the full probe).
+    """
+
+    def slow(item: dict[str, Any]) -> Any:
+        return _extract_hle_first(item, keys)
+
+    flat_sample = [_flatten_hle_record(row) for row in sample]
+    key = _present_key(flat_sample, keys)
+    if key is None:
+        return slow
+    raw = next(row for row, flat in zip(sample, flat_sample) if key in flat)
+    if key in raw:
+
+        def get_top(item: dict[str, Any]) -> Any:
+            if key in item:
+                return item[key]
+            return slow(item)
+
+        return get_top
+
+    scores = raw["scores"]
+    nested = key if key in scores else next(v for v in HLE_SCORE_VARIANTS[key] if v in scores)
+
+    def get(item: dict[str, Any]) -> Any:
+        if key not in item:
+            nested_scores = item.get("scores")
+            if isinstance(nested_scores, dict) and nested in nested_scores and (
+                nested == key or key not in nested_scores
+            ):
+                return nested_scores[nested]
+        return slow(item)
+
+    return get
+
+
+def load_source_payload(name: str) -> Any:
+    with span(f"read.{name}"):
+        return _read_json(SOURCES_DIR / f"{name}.json")
+
+
+def _source_rows(name: str, payload: Any) -> list[dict[str, Any]]:
+    with span(f"as_list.{name}") as step:
+        rows = _as_list(payload)
+        step.rows_out = len(rows)
+    return rows
+
+
+def count_usable_records(name: str, payload: Any) -> int:
+    """Count rows normalize_sources would turn into a score for this source.
+
+    Cheap structural check used to decide, per source, whether a fetched
+    payload is good enough or should fall back to its bootstrap copy.
+    """
+    rows = _as_list(payload)
+    sample = _sample(rows)
+    if name == "arc_evaluations":
+        model_of = compile_accessor(sample, MODEL_KEY_CANDIDATES)
+        score_of = compile_accessor(sample, ARC_SCORE_KEY_CANDIDATES)
+        return sum(
+            1
+            for item in rows
+            if isinstance(model_of(item), str)
+            and item.get("display") is not False
+            and _to_float(score_of(item)) is not None
+        )
+    if name == "arc_models":
+        model_of = compile_accessor(sample, MODEL_KEY_CANDIDATES)
+        return sum(
+            1
+            for item in rows
+            if isinstance(item.get("id") or model_of(item), str) and item.get("display") is not False
+        )
+    if name == "hle_models":
+        model_of = compile_hle_accessor(sample, MODEL_KEY_CANDIDATES)
+        score_of = compile_hle_accessor(sample, HLE_SCORE_KEY_CANDIDATES)
+        calibration_of = compile_hle_accessor(sample, CALIBRATION_KEY_CANDIDATES)
+        return sum(
+            1
+            for item in rows
+            if isinstance(model_of(item), str)
+            and (_to_float(score_of(item)) is not None or _to_float(calibration_of(item)) is not None)
+        )
+    return len(rows)
 
-    arc_eval_payload = _read_json(SOURCES_DIR / "arc_evaluations.json")
-    arc_models_payload = _read_json(SOURCES_DIR / "arc_models.json")
-    hle_payload = _read_json(SOURCES_DIR / "hle_models.json")
 
-    arc_eval = _as_list(arc_eval_payload)
-    arc_models = _as_list(arc_models_payload)
-    hle_models = _as_list(hle_payload)
+_WORKER_STATE: dict[str, Any] = {}
 
-    model_index: dict[str, UnifiedModelRecord] = {}
 
+def arc_model_index(arc_models: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Index displayed arc_models rows by the id arc_evaluations use as modelId."""
     arc_model_meta: dict[str, dict[str, Any]] = {}
     for item in arc_models:
-        # ARC models use "id" as the key that matches evaluations' "modelId"
         model_id = item.get("id") or _extract_first(item, MODEL_KEY_CANDIDATES)
         if not isinstance(model_id, str):
             continue
         if item.get("display") is False:
             continue
-        # Index by the raw id so arc_evaluations can look up by their modelId
         arc_model_meta[model_id] = item
+    return arc_model_meta
 
-    for item in arc_eval:
-        model_name = _extract_first(item, MODEL_KEY_CANDIDATES)
+
+def arc_identity(
+    model_name: str,
+    arc_model_meta: dict[str, dict[str, Any]],
+    aliases: dict[str, str],
+    canonical_name: Callable[[str, dict[str, str]], str] = _canonical_name,
+) -> tuple[dict[str, Any], str, str]:
+    """Resolve an ARC modelId to its arc_models entry, canonical name and model_key."""
+    # Look up arc_model_meta by the raw modelId first, then by canonical name
+    arc_meta = arc_model_meta.get(model_name) or arc_model_meta.get(canonical_name(model_name, aliases), {})
+
+    # Use displayName from arc_models as canonical name when available
+    display_name = arc_meta.get("displayName") if arc_meta else None
+    canonical = canonical_name(display_name or model_name, aliases)
+    return arc_meta, canonical, _slugify(canonical)
+
+
+def arc_score_percent(value: Any) -> float | None:
+    raw = _to_float(value)
+    # ARC API returns scores as 0-1 fractions; normalize to 0-100 percentages.
+    return raw * 100.0 if raw is not None and raw <= 1.0 else raw
+
+
+def resolve_model_keys(names: Iterable[str]) -> dict[str, tuple[str, str]]:
+    """Canonical name and model_key for raw model ids, resolved like HLE leaderboard rows."""
+    aliases = _load_aliases()
+    resolved = {}
+    for name in names:
+        canonical = _canonical_name(name, aliases)
+        resolved[name] = (canonical, _slugify(canonical))
+    return resolved
+
+
+def provider_key(provider: str | None) -> str:
+    """Grouping key for a provider; sources disagree on casing ("OpenAI" / "openai")."""
+    return _slugify(provider or "") or "unknown"
+
+
+def provider_display_names(rows: Iterable[dict[str, Any]]) -> dict[str, str]:
+    """Most common spelling of each provider_key among ``rows``."""
+    spellings: dict[str, Counter[str]] = {}
+    for row in rows:
+        provider = row.get("provider")
+        spellings.setdefault(provider_key(provider), Counter())[provider or "Unknown"] += 1
+    return {key: names.most_common(1)[0][0] for key, names in spellings.items()}
+
+
+def _reduce_arc_evaluations(
+    rows: list[dict[str, Any]],
+    arc_model_meta: dict[str, dict[str, Any]],
+    aliases: dict[str, str],
+    canonical_name: Callable[[str, dict[str, str]], str] = _canonical_name,
+    model_index: dict[str, UnifiedModelRecord] | None = None,
+) -> dict[str, UnifiedModelRecord]:
+    model_index = {} if model_index is None else model_index
+    sample = _sample(rows)
+    model_of = compile_accessor(sample, MODEL_KEY_CANDIDATES)
+    provider_of = compile_accessor(sample, PROVIDER_KEY_CANDIDATES)
+    release_of = compile_accessor(sample, ARC_RELEASE_KEY_CANDIDATES)
+    score_of = compile_accessor(sample, ARC_SCORE_KEY_CANDIDATES)
+    cost_of = compile_accessor(sample, COST_KEY_CANDIDATES)
+    tasks_of = compile_accessor(sample, TASKS_KEY_CANDIDATES)
+    meta_sample = _sample(arc_model_meta.values())
+    meta_provider_of = compile_accessor(meta_sample, PROVIDER_KEY_CANDIDATES)
+    meta_release_of = compile_accessor(meta_sample, ARC_META_RELEASE_KEY_CANDIDATES)
+
+    for item in rows:
+        model_name = model_of(item)
         if not isinstance(model_name, str):
             continue
         if item.get("display") is False:
             continue
 
-        # Look up arc_model_meta by the raw modelId first, then by canonical name
-        arc_meta = arc_model_meta.get(model_name) or arc_model_meta.get(
-            _canonical_name(model_name, aliases), {}
-        )
-
-        # Use displayName from arc_models as canonical name when available
-        display_name = arc_meta.get("displayName") if arc_meta else None
-        if display_name:
-            canonical = _canonical_name(display_name, aliases)
-        else:
-            canonical = _canonical_name(model_name, aliases)
-        model_key = _slugify(canonical)
+        arc_meta, canonical, model_key = arc_identity(model_name, arc_model_meta, aliases, canonical_name)
 
-        provider = _extract_first(item, PROVIDER_KEY_CANDIDATES) or _extract_first(
-            arc_meta, PROVIDER_KEY_CANDIDATES
-        )
-        release_date = (
-            _extract_first(item, ("release_date", "releaseDate", "modelReleaseDate", "created_at", "date"))
-            or _extract_first(arc_meta, ("modelReleaseDate", "release_date", "releaseDate", "created_at", "date"))
-        )
+        provider = provider_of(item) or meta_provider_of(arc_meta)
+        release_date = release_of(item) or meta_release_of(arc_meta)
         # Strip ISO timestamp to date only
         if release_date and "T" in str(release_date):
             release_date = str(release_date).split("T")[0]
 
-        raw_arc_score = _to_float(_extract_first(item, ("score", "overall_score", "pass_rate", "accuracy")))
-        # ARC API returns scores as 0-1 fractions; normalize to 0-100 percentages.
-        arc_score = raw_arc_score * 100.0 if raw_arc_score is not None and raw_arc_score <= 1.0 else raw_arc_score
-        arc_cost = _to_float(
-            _extract_first(item, ("costPerTask", "cost_per_task", "cost", "usd_per_task"))
-        )
-        arc_tasks = _to_int(
-            _extract_first(
-                item,
-                ("tasks_evaluated", "tasksEvaluated", "num_tasks", "n_tasks", "sample_size"),
-            )
-        )
+        arc_score = arc_score_percent(score_of(item))
+        arc_cost = _to_float(cost_of(item))
+        arc_tasks = _to_int(tasks_of(item))
 
         record = model_index.get(model_key)
         if record is None:
@@ -277,9 +494,9 @@ def normalize_sources() -> list[UnifiedModelRecord]:
             model_index[model_key] = record
             continue
 
-        if record.provider is None and provider is not None:
+        if record.provider is None and provider:
             record.provider = str(provider)
-        if record.release_date is None and release_date is not None:
+        if record.release_date is None and release_date:
             record.release_date = str(release_date)
         if arc_score is not None:
             record.arc_score = max(record.arc_score, arc_score) if record.arc_score is not None else arc_score
@@ -293,32 +510,38 @@ def normalize_sources() -> list[UnifiedModelRecord]:
                 if record.arc_tasks_evaluated is not None
                 else arc_tasks
             )
-
-    for raw_item in hle_models:
-        item = _flatten_hle_record(raw_item)
-        model_name = _extract_first(item, MODEL_KEY_CANDIDATES)
+    return model_index
+
+
+def _reduce_hle_models(
+    rows: list[dict[str, Any]],
+    aliases: dict[str, str],
+    canonical_name: Callable[[str, dict[str, str]], str] = _canonical_name,
+    model_index: dict[str, UnifiedModelRecord] | None = None,
+) -> dict[str, UnifiedModelRecord]:
+    model_index = {} if model_index is None else model_index
+    sample = _sample(rows)
+    model_of = compile_hle_accessor(sample, MODEL_KEY_CANDIDATES)
+    provider_of = compile_hle_accessor(sample, PROVIDER_KEY_CANDIDATES)
+    release_of = compile_hle_accessor(sample, HLE_RELEASE_KEY_CANDIDATES)
+    score_of = compile_hle_accessor(sample, HLE_SCORE_KEY_CANDIDATES)
+    calibration_of = compile_hle_accessor(sample, CALIBRATION_KEY_CANDIDATES)
+    hle_arc_of = compile_hle_accessor(sample, HLE_ARC_KEY_CANDIDATES)
+
+    for item in rows:
+        model_name = model_of(item)
         if not isinstance(model_name, str):
             continue
 
-        canonical = _canonical_name(model_name, aliases)
+        canonical = canonical_name(model_name, aliases)
         model_key = _slugify(canonical)
 
-        provider = _extract_first(item, PROVIDER_KEY_CANDIDATES)
-        release_date = _extract_first(item, ("release_date", "releaseDate", "created_at", "date"))
+        provider = provider_of(item)
+        release_date = release_of(item)
 
-        hle_score = _to_float(
-            _extract_first(
-                item,
-                ("hle", "hleScore", "hle_score", "humanitys_last_exam", "humanitysLastExam", "score", "accuracy"),
-            )
-        )
-        calibration_error = _to_float(
-            _extract_first(
-                item,
-                ("calibration_error", "hle_calibration_error", "calibrationError", "ece", "expected_calibration_error"),
-            )
-        )
-        hle_arc = _to_float(_extract_first(item, ("arc_agi_2", "arcAgi2", "arc", "arc_score")))
+        hle_score = _to_float(score_of(item))
+        calibration_error = _to_float(calibration_of(item))
+        hle_arc = _to_float(hle_arc_of(item))
 
         record = model_index.get(model_key)
         if record is None:
@@ -339,9 +562,9 @@ def normalize_sources() -> list[UnifiedModelRecord]:
             model_index[model_key] = record
             continue
 
-        if record.provider is None and provider is not None:
+        if record.provider is None and provider:
             record.provider = str(provider)
-        if record.release_date is None and release_date is not None:
+        if record.release_date is None and release_date:
             record.release_date = str(release_date)
         if hle_score is not None:
             record.hle_score = max(record.hle_score, hle_score) if record.hle_score is not None else hle_score
@@ -354,14 +577,176 @@ def normalize_sources() -> list[UnifiedModelRecord]:
         if hle_arc is not None:
             record.hle_arc_agi_2 = hle_arc
         record.source_hle = "https://dashboard.safe.ai/api/models"
+    return model_index
+
+
+def _min_or(a: Any, b: Any) -> Any:
+    return b if a is None else a if b is None else min(a, b)
+
+
+def _max_or(a: Any, b: Any) -> Any:
+    return b if a is None else a if b is None else max(a, b)
+
+
+def _merge_record(into: UnifiedModelRecord, other: UnifiedModelRecord) -> None:
+    """Fold a record reduced from a later shard into one from an earlier shard."""
+    into.provider = into.provider or other.provider
+    into.release_date = into.release_date or other.release_date
+    into.arc_score = _max_or(into.arc_score, other.arc_score)
+    into.arc_cost_per_task = _min_or(into.arc_cost_per_task, other.arc_cost_per_task)
+    into.arc_tasks_evaluated = _max_or(into.arc_tasks_evaluated, other.arc_tasks_evaluated)
+    into.hle_score = _max_or(into.hle_score, other.hle_score)
+    into.calibration_error = _min_or(into.calibration_error, other.calibration_error)
+    if other.hle_arc_agi_2 is not None:
+        into.hle_arc_agi_2 = other.hle_arc_agi_2
+    into.source_arc = into.source_arc or other.source_arc
+    into.source_hle = into.source_hle or other.source_hle
+
+
+def _merge_indexes(
+    into: dict[str, UnifiedModelRecord], other: dict[str, UnifiedModelRecord]
+) -> dict[str, UnifiedModelRecord]:
+    for key, record in other.items():
+        existing = into.get(key)
+        if existing is None:
+            into[key] = record
+        else:
+            _merge_record(existing, record)
+    return into
+
+
+def _init_worker(arc_model_meta: dict[str, dict[str, Any]], aliases: dict[str, str]) -> None:
+    _WORKER_STATE["arc_model_meta"] = arc_model_meta
+    _WORKER_STATE["aliases"] = aliases
+
+
+def _reduce_shard(kind: str, rows: list[dict[str, Any]]) -> dict[str, UnifiedModelRecord]:
+    if kind == "arc":
+        return _reduce_arc_evaluations(rows, _WORKER_STATE["arc_model_meta"], _WORKER_STATE["aliases"])
+    return _reduce_hle_models(rows, _WORKER_STATE["aliases"])
+
+
+def _shards(rows: list[dict[str, Any]], count: int) -> list[list[dict[str, Any]]]:
+    size = max(1, -(-len(rows) // count))
+    return [rows[i : i + size] for i in range(0, len(rows), size)]
+
+
+def _parallel_reduce(
+    arc_eval: list[dict[str, Any]],
+    hle_models: list[dict[str, Any]],
+    arc_model_meta: dict[str, dict[str, Any]],
+    aliases: dict[str, str],
+    workers: int,
+) -> dict[str, UnifiedModelRecord]:
+    """Reduce contiguous shards in a process pool and merge them in shard order.
+
+    Every merge rule is associative and the left operand keeps its insertion
+    order, so the result matches the serial fold record for record.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    shard_count = workers * 4
+    jobs = [("arc", shard) for shard in _shards(arc_eval, shard_count)]
+    jobs += [("hle", shard) for shard in _shards(hle_models, shard_count)]
+    if not jobs:
+        return {}
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(arc_model_meta, aliases)
+    ) as pool:
+        partials = list(pool.map(_reduce_shard, *zip(*jobs)))
+
+    arc_index: dict[str, UnifiedModelRecord] = {}
+    hle_index: dict[str, UnifiedModelRecord] = {}
+    for (kind, _), partial in zip(jobs, partials):
+        _merge_indexes(arc_index if kind == "arc" else hle_index, partial)
+    return _merge_indexes(arc_index, hle_index)
+
+
+def normalize_sources(
+    payloads: dict[str, Any] | None = None,
+    workers: int | None = None,
+) -> list[UnifiedModelRecord]:
+    """Merge ARC and HLE sources into one record per model.
+
+    ``payloads`` may supply already-parsed sources by name; anything missing
+    is read from SOURCES_DIR. Leaderboards with at least PARALLEL_MIN_ROWS
+    rows are sharded across ``workers`` processes (default: CPU count).
+    """
+    payloads = payloads or {}
+    with span("load_aliases") as step:
+        aliases = _load_aliases()
+        step.rows_out = len(aliases)
+    canonical_name = timed("alias_resolution", _canonical_name)
+
+    arc_eval, arc_models, hle_models = (
+        _source_rows(name, payloads[name] if name in payloads else load_source_payload(name))
+        for name in NORMALIZED_SOURCES
+    )
+
+    arc_model_meta = arc_model_index(arc_models)
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(arc_eval) + len(hle_models) >= PARALLEL_MIN_ROWS:
+        with span("merge.parallel", rows_in=len(arc_eval) + len(hle_models), workers=workers) as step:
+            model_index = _parallel_reduce(arc_eval, hle_models, arc_model_meta, aliases, workers)
+            step.rows_out = len(model_index)
+        return list(model_index.values())
+
+    with span("merge.arc_evaluations", rows_in=len(arc_eval)) as step:
+        model_index = _reduce_arc_evaluations(arc_eval, arc_model_meta, aliases, canonical_name)
+        step.rows_out = len(model_index)
+
+    with span("merge.hle_models", rows_in=len(hle_models)) as step:
+        _reduce_hle_models(hle_models, aliases, canonical_name, model_index)
+        step.rows_out = len(model_index)
 
     return list(model_index.values())
 
 
+def arc_evaluation_rows() -> list[dict[str, Any]]:
+    """One row per ARC evaluation with its dataset and resolved model_key.
+
+    Unlike normalize_sources this keeps every dataset instead of folding them
+    into one record per model. Hidden rows are kept with ``display`` False.
+    """
+    rows = _as_list(load_source_payload("arc_evaluations"))
+    arc_model_meta = arc_model_index(_as_list(load_source_payload("arc_models")))
+    aliases = _load_aliases()
+    sample = _sample(rows)
+    model_of = compile_accessor(sample, MODEL_KEY_CANDIDATES)
+    provider_of = compile_accessor(sample, PROVIDER_KEY_CANDIDATES)
+    score_of = compile_accessor(sample, ARC_SCORE_KEY_CANDIDATES)
+    cost_of = compile_accessor(sample, COST_KEY_CANDIDATES)
+
+    out = []
+    for item in rows:
+        model_id = model_of(item)
+        if not isinstance(model_id, str):
+            continue
+        arc_meta, canonical, model_key = arc_identity(model_id, arc_model_meta, aliases)
+        provider = provider_of(item) or _extract_first(arc_meta, PROVIDER_KEY_CANDIDATES)
+        out.append(
+            {
+                "dataset_id": _extract_first(item, ("datasetId", "dataset_id", "dataset")),
+                "model_id": model_id,
+                "model_key": model_key,
+                "model": canonical,
+                "provider": str(provider) if provider else None,
+                "score": arc_score_percent(score_of(item)),
+                "cost_per_task": _to_float(cost_of(item)),
+                "display": item.get("display") is not False,
+            }
+        )
+    out.sort(key=lambda row: (str(row["dataset_id"]), row["model_key"]))
+    return out
+
+
 def write_unified(records: list[UnifiedModelRecord]) -> Path:
     PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
     out_path = PROCESSED_DIR / "unified_models.json"
-    out_path.write_text(json.dumps([asdict(record) for record in records], indent=2), encoding="utf-8")
+    ordered = sorted(records, key=lambda record: record.model_key)
+    codec.write_json(out_path, [asdict(record) for record in ordered], sort_keys=True)
     return out_path
 
 
@@ -0,0 +1,207 @@
+"""Running-best frontiers and log-linear growth fits for the Twin Rivers timeline."""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import date as dt_date
+from typing import Any, Iterable
+
+BENCHMARK_FIELDS = {"arc": "arc_score", "hle": "hle_score"}
+DAYS_PER_YEAR = 365.25
+BOOTSTRAP_SAMPLES = 200
+BAND_QUANTILES = (0.05, 0.95)
+
+
+def release_ordinal(release_date: Any) -> int | None:
+    if not isinstance(release_date, str):
+        return None
+    try:
+        year, month, day = release_date[:10].split("-")
+        return dt_date(int(year), int(month), int(day)).toordinal()
+    except ValueError:
+        return None
+
+
+def _quantile(ordered: list[float], q: float) -> float:
+    if len(ordered) == 1:
+        return ordered[0]
+    pos = (len(ordered) - 1) * q
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+@dataclass
+class GrowthFit:
+    """Least-squares fit of log(score) against years, kept as running sums.
+
+    Each update is O(1), so a new frontier point never forces a refit.
+    """
+
+    origin: int
+    n: int = 0
+    sx: float = 0.0
+    sy: float = 0.0
+    sxx: float = 0.0
+    sxy: float = 0.0
+
+    def update(self, ordinal: int, score: float) -> None:
+        x = (ordinal - self.origin) / DAYS_PER_YEAR
+        y = math.log(score)
+        self.n += 1
+        self.sx += x
+        self.sy += y
+        self.sxx += x * x
+        self.sxy += x * y
+
+    def coefficients(self) -> tuple[float, float] | None:
+        return _solve(self.n, self.sx, self.sy, self.sxx, self.sxy)
+
+    def predict(self, ordinal: int) -> float | None:
+        coef = self.coefficients()
+        if coef is None:
+            return None
+        slope, intercept = coef
+        return math.exp(intercept + slope * (ordinal - self.origin) / DAYS_PER_YEAR)
+
+
+def _solve(n: float, sx: float, sy: float, sxx: float, sxy: float) -> tuple[float, float] | None:
+    denom = n * sxx - sx * sx
+    if n < 2 or abs(denom) < 1e-12:
+        return None
+    slope = (n * sxy - sx * sy) / denom
+    intercept = (sy - slope * sx) / n
+    return slope, intercept
+
+
+@dataclass
+class RiverTrend:
+    """Running best score for one benchmark, fed in release-date order."""
+
+    benchmark: str
+    frontier: list[dict[str, Any]] = field(default_factory=list)
+    fit: GrowthFit | None = None
+    last_ordinal: int | None = None
+
+    @property
+    def score_field(self) -> str:
+        return BENCHMARK_FIELDS[self.benchmark]
+
+    def add(self, point: dict[str, Any]) -> bool:
+        """Feed one timeline point; return True when it raises the running best."""
+        ordinal = release_ordinal(point.get("release_date"))
+        score = point.get(self.score_field)
+        if ordinal is None or score is None:
+            return False
+        if self.last_ordinal is not None and ordinal < self.last_ordinal:
+            raise ValueError(
+                f"{self.benchmark} trend received {point.get('release_date')} after a later release date"
+            )
+        self.last_ordinal = ordinal
+        if self.frontier and score <= self.frontier[-1]["score"]:
+            return False
+
+        self.frontier.append(
+            {
+                "model": point.get("model"),
+                "release_date": point["release_date"][:10],
+                "score": score,
+            }
+        )
+        if score > 0:
+            if self.fit is None:
+                self.fit = GrowthFit(origin=ordinal)
+            self.fit.update(ordinal, score)
+        return True
+
+    def extend(self, points: Iterable[dict[str, Any]]) -> int:
+        return sum(1 for point in points if self.add(point))
+
+    def _fit_samples(self) -> list[tuple[int, float]]:
+        return [
+            (release_ordinal(step["release_date"]), step["score"])
+            for step in self.frontier
+            if step["score"] > 0
+        ]
+
+    def _bootstrap(self, samples: list[tuple[int, float]], seed: int) -> list[tuple[float, float]]:
+        # Precompute per-sample terms once; each resample is then just index sums.
+        origin = self.fit.origin if self.fit else 0
+        xs = [(ordinal - origin) / DAYS_PER_YEAR for ordinal, _ in samples]
+        ys = [math.log(score) for _, score in samples]
+        xx = [x * x for x in xs]
+        xy = [x * y for x, y in zip(xs, ys)]
+
+        rng = random.Random(seed)
+        n = len(samples)
+        fits: list[tuple[float, float]] = []
+        for _ in range(BOOTSTRAP_SAMPLES):
+            idx = [rng.randrange(n) for _ in range(n)]
+            coef = _solve(
+                n,
+                sum(xs[i] for i in idx),
+                sum(ys[i] for i in idx),
+                sum(xx[i] for i in idx),
+                sum(xy[i] for i in idx),
+            )
+            if coef is not None:
+                fits.append(coef)
+        return fits
+
+    def summary(self, end_date: str | None = None, seed: int = 0) -> dict[str, Any]:
+        growth: dict[str, Any] | None = None
+        band: list[dict[str, Any]] = []
+        coef = self.fit.coefficients() if self.fit else None
+
+        if coef is not None and self.fit is not None:
+            slope, intercept = coef
+            samples = self._fit_samples()
+            fits = self._bootstrap(samples, seed)
+            multipliers = sorted(math.exp(s) for s, _ in fits)
+            growth = {
+                "log_slope_per_year": slope,
+                "annual_multiplier": math.exp(slope),
+                "doubling_months": (12 * math.log(2) / slope) if slope > 0 else None,
+                "annual_multiplier_ci": (
+                    [_quantile(multipliers, q) for q in BAND_QUANTILES] if multipliers else None
+                ),
+                "fit_points": self.fit.n,
+            }
+
+            band_dates = [step["release_date"] for step in self.frontier]
+            end_ordinal = release_ordinal(end_date)
+            if end_ordinal is not None and end_ordinal > release_ordinal(band_dates[-1]):
+                band_dates.append(end_date[:10])
+            for release_date in band_dates:
+                x = (release_ordinal(release_date) - self.fit.origin) / DAYS_PER_YEAR
+                preds = sorted(math.exp(b + s * x) for s, b in fits)
+                band.append(
+                    {
+                        "release_date": release_date,
+                        "fit": math.exp(intercept + slope * x),
+                        "lo": _quantile(preds, BAND_QUANTILES[0]) if preds else None,
+                        "hi": _quantile(preds, BAND_QUANTILES[1]) if preds else None,
+                    }
+                )
+
+        return {"frontier": self.frontier, "growth": growth, "band": band}
+
+
+def build_trends(points: list[dict[str, Any]]) -> dict[str, RiverTrend]:
+    """Sweep release-date-sorted timeline points once, updating every benchmark."""
+    trends = {name: RiverTrend(benchmark=name) for name in BENCHMARK_FIELDS}
+    for point in points:
+        for trend in trends.values():
+            trend.add(point)
+    return trends
+
+
+def trend_payload(points: list[dict[str, Any]]) -> dict[str, Any]:
+    trends = build_trends(points)
+    end_date = next(
+        (p["release_date"] for p in reversed(points) if release_ordinal(p.get("release_date")) is not None),
+        None,
+    )
+    return {name: trend.summary(end_date=end_date) for name, trend in trends.items()}
@@ -0,0 +1,225 @@
+"""Sampling uncertainty for benchmark scores and the metrics derived from them.
+
+Scores are treated as binomial pass rates over the tasks a benchmark run
+covered, and costs as exact:
+- scores get Wilson intervals;
+- efficiency ratios (score / cost) get the score interval divided by the cost;
+  with the cost fixed the ratio is monotone in the score, so a bootstrap
+  percentile interval would only reproduce that scaling;
+- ARC − HLE gaps get a normal approximation, not a bootstrap: the difference
+  of two independent errors, each standard error read off its Wilson width;
+- Pareto membership is the one bootstrap (parametric, truncated normal draws).
+Each function works on whole columns at once so a recompute stays cheap.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import random
+import sys
+from array import array
+from statistics import NormalDist
+from typing import Any, Sequence
+
+CONFIDENCE_Z = 1.959964  # two-sided 95%
+
+# ARC leaderboards rarely report tasks_evaluated; the semi-private sets hold
+# about this many tasks. HLE scores are over the full public question set.
+ARC_DEFAULT_TASKS = 100
+HLE_QUESTIONS = 2500
+
+PARETO_SAMPLES = 200
+# Bootstrap draws are truncated at this many standard errors, which makes the
+# contender pre-filter in pareto_probabilities exact.
+CONTENDER_Z = 4.0
+# Draws index a table of equal-probability strata of the truncated normal with
+# random 16-bit integers, which avoids a gauss() call per draw.
+NORMAL_TABLE_SIZE = 1 << 16
+
+Interval = tuple[float, float]
+
+
+@functools.cache
+def _truncated_normal_table(z: float = CONTENDER_Z) -> tuple[float, ...]:
+    dist = NormalDist()
+    lo = dist.cdf(-z)
+    width = dist.cdf(z) - lo
+    return tuple(dist.inv_cdf(lo + width * (k + 0.5) / NORMAL_TABLE_SIZE) for k in range(NORMAL_TABLE_SIZE))
+
+
+def _uint16(data: bytes) -> array:
+    values = array("H", data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def wilson_intervals(
+    scores: Sequence[float | None],
+    tasks: Sequence[int | None],
+    default_tasks: int,
+    z: float = CONFIDENCE_Z,
+) -> list[Interval | None]:
+    """Wilson score intervals for percentages over ``tasks`` trials each."""
+    z2 = z * z
+    # (denominator, centre offset, variance offset) per distinct task count.
+    constants: dict[int, tuple[float, float, float]] = {}
+    out: list[Interval | None] = []
+    append = out.append
+    for score, n in zip(scores, tasks):
+        if score is None:
+            append(None)
+            continue
+        n = n if n and n > 0 else default_tasks
+        c = constants.get(n)
+        if c is None:
+            c = constants[n] = (1.0 + z2 / n, z2 / (2 * n), z2 / (4 * n * n))
+        denom, shift, spread = c
+        p = score / 100.0
+        p = 0.0 if p < 0.0 else 1.0 if p > 1.0 else p
+        centre = (p + shift) / denom
+        half = z * math.sqrt(p * (1 - p) / n + spread) / denom
+        lo = centre - half
+        hi = centre + half
+        append((100.0 * lo if lo > 0.0 else 0.0, 100.0 * hi if hi < 1.0 else 100.0))
+    return out
+
+
+def interval_se(intervals: Sequence[Interval | None], z: float = CONFIDENCE_Z) -> list[float | None]:
+    """Standard errors implied by interval widths.
+
+    Unlike sqrt(p(1-p)/n) this stays positive at 0% and 100%.
+    """
+    return [None if ci is None else (ci[1] - ci[0]) / (2 * z) for ci in intervals]
+
+
+def difference_intervals(
+    a: Sequence[float], a_se: Sequence[float], b: Sequence[float], b_se: Sequence[float], z: float = CONFIDENCE_Z
+) -> list[Interval]:
+    """Intervals for ``a - b`` with independent errors."""
+    out = []
+    for x, sx, y, sy in zip(a, a_se, b, b_se):
+        half = z * math.hypot(sx, sy)
+        out.append((x - y - half, x - y + half))
+    return out
+
+
+def pareto_probabilities(
+    scores: Sequence[float],
+    costs: Sequence[float],
+    ses: Sequence[float],
+    samples: int = PARETO_SAMPLES,
+    seed: int = 0,
+) -> list[float]:
+    """Share of bootstrap draws in which each point is on the cost/score frontier.
+
+    Uses the same frontier rule as analyze._pareto_frontier, with costs held
+    fixed and the order within equal costs decided by each draw's scores: of
+    several points at one cost, only the best draw can be on the frontier. A
+    point whose upper bound cannot beat an earlier point's lower bound is never
+    on the frontier, and it never raises the running best either. Only the
+    remaining contenders are resampled, and a contender below the running best
+    of every sample is skipped without drawing.
+    """
+    order = sorted(range(len(scores)), key=lambda i: (costs[i], -scores[i]))
+    contenders: list[int] = []
+    best_lo = -math.inf
+    for i in order:
+        spread = CONTENDER_Z * ses[i]
+        if scores[i] + spread > best_lo:
+            contenders.append(i)
+        best_lo = max(best_lo, scores[i] - spread)
+
+    normal = _truncated_normal_table()
+    rng = random.Random(seed)
+    # Column k of the bootstrap: each contender is drawn for all samples at
+    # once and compared against the running best of every sample.
+    running = [-math.inf] * samples
+    floor = -math.inf
+    hits = [0] * len(contenders)
+    k = 0
+    while k < len(contenders):
+        end = k + 1
+        while end < len(contenders) and costs[contenders[end]] == costs[contenders[k]]:
+            end += 1
+        group: list[tuple[int, list[float]]] = []
+        for g in range(k, end):
+            centre, se = scores[contenders[g]], ses[contenders[g]]
+            if centre + CONTENDER_Z * se > floor:
+                group.append((g, [centre + se * normal[j] for j in _uint16(rng.randbytes(2 * samples))]))
+        k = end
+        if not group:
+            continue
+        if len(group) == 1:
+            g, draws = group[0]
+            winners = [g] * samples
+        else:
+            # Equal costs: per sample, the best draw stands for the group.
+            draws, winners = [], []
+            for column in zip(*(d for _, d in group)):
+                best = max(range(len(column)), key=column.__getitem__)
+                draws.append(column[best])
+                winners.append(group[best][0])
+        better = [d > r for d, r in zip(draws, running)]
+        if any(better):
+            for g, b in zip(winners, better):
+                hits[g] += b
+            running = [d if b else r for d, b, r in zip(draws, better, running)]
+            floor = min(running)
+
+    probabilities = [0.0] * len(scores)
+    for k, i in enumerate(contenders):
+        probabilities[i] = hits[k] / samples
+    return probabilities
+
+
+def annotate(
+    efficiency: list[dict[str, Any]],
+    confidence: list[dict[str, Any]],
+    transfer: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Add interval fields to the analysis points in place; return the method notes."""
+    score_ci = wilson_intervals(
+        [p["score"] for p in efficiency], [p.get("tasks_evaluated") for p in efficiency], ARC_DEFAULT_TASKS
+    )
+    score_se = interval_se(score_ci)
+    pareto = pareto_probabilities(
+        [p["score"] for p in efficiency], [p["cost_per_task"] for p in efficiency], score_se
+    )
+    for point, ci, prob in zip(efficiency, score_ci, pareto):
+        point["score_ci"] = ci
+        cost = point["cost_per_task"]
+        point["efficiency_ratio_ci"] = (ci[0] / cost, ci[1] / cost) if ci and cost else None
+        point["pareto_probability"] = prob
+
+    hle_ci = wilson_intervals([p["hle_score"] for p in confidence], [None] * len(confidence), HLE_QUESTIONS)
+    for point, ci in zip(confidence, hle_ci):
+        point["hle_score_ci"] = ci
+
+    arc_ci = wilson_intervals([p["arc_agi_2"] for p in transfer], [None] * len(transfer), ARC_DEFAULT_TASKS)
+    hle_ci = wilson_intervals([p["hle"] for p in transfer], [None] * len(transfer), HLE_QUESTIONS)
+    gap_ci = difference_intervals(
+        [p["arc_agi_2"] for p in transfer],
+        interval_se(arc_ci),
+        [p["hle"] for p in transfer],
+        interval_se(hle_ci),
+    )
+    for point, a, h, g in zip(transfer, arc_ci, hle_ci, gap_ci):
+        point["arc_agi_2_ci"] = a
+        point["hle_ci"] = h
+        point["gap_ci"] = g
+
+    return {
+        "confidence": 0.95,
+        "arc_default_tasks": ARC_DEFAULT_TASKS,
+        "hle_questions": HLE_QUESTIONS,
+        "pareto_samples": PARETO_SAMPLES,
+        "note": (
+            "Scores are treated as binomial pass rates (Wilson intervals). ARC runs without "
+            f"tasks_evaluated assume {ARC_DEFAULT_TASKS} tasks; HLE assumes {HLE_QUESTIONS} questions. "
+            "Costs are treated as exact, so efficiency-ratio intervals are score intervals over cost. "
+            "Gap intervals are a normal approximation on the difference; Pareto probabilities are "
+            "a parametric bootstrap."
+        ),
+    }
@@ -2,13 +2,72 @@ import { renderEfficiencyMap } from "./charts/efficiency-map.js";
 import { renderConfidenceLens } from "./charts/confidence-lens.js";
 import { renderTransferGap } from "./charts/transfer-gap.js";
 import { renderTwinRivers } from "./charts/twin-rivers.js";
+import { prepareChartData } from "./charts/prepare.js";
+import { loadSearchIndex, searchModels } from "./search.js";
 
-async function loadData() {
-  const res = await fetch("./data.json");
+async function fetchData(url) {
+  const res = await fetch(url);
   if (!res.ok) {
     throw new Error(`Unable to load data.json (${res.status})`);
   }
-  return res.json();
+  const dataset = await res.json();
+  prepareChartData(dataset.data);
+  return dataset;
+}
+
+// The manifest names the current content-hashed data file; without one (e.g.
+// a partial local build) the fixed data.json URL still works.
+async function loadManifest() {
+  try {
+    const res = await fetch("./manifest.json");
+    return res.ok ? await res.json() : {};
+  } catch {
+    return {};
+  }
+}
+
+function dataUrl(name) {
+  return new URL(`./${name}`, document.baseURI).href;
+}
+
+// Parse and prepare in a worker; fall back to the main thread where module
+// workers are unavailable.
+function loadData(url) {
+  if (typeof Worker === "undefined") {
+    return fetchData(url);
+  }
+  return new Promise((resolve, reject) => {
+    let worker;
+    try {
+      worker = new Worker("./data-worker.js", { type: "module" });
+    } catch {
+      fetchData(url).then(resolve, reject);
+      return;
+    }
+    worker.onmessage = ({ data }) => {
+      worker.terminate();
+      if (data.error) {
+        reject(new Error(data.error));
+      } else {
+        resolve(data.dataset);
+      }
+    };
+    worker.onerror = (event) => {
+      event.preventDefault();
+      worker.terminate();
+      fetchData(url).then(resolve, reject);
+    };
+    worker.postMessage({ url });
+  });
+}
+
+async function loadFreshness() {
+  try {
+    const res = await fetch("./freshness.json", { cache: "no-cache" });
+    return res.ok ? await res.json() : null;
+  } catch {
+    return null;
+  }
 }
 
 const SOURCE_LABELS = {
@@ -70,16 +129,118 @@ function renderAll(dataset) {
   writeMeta("efficiency", data.efficiency_map, modelCount);
   writeMeta("confidence", data.confidence_lens, modelCount);
   writeMeta("transfer", data.transfer_gap, modelCount);
-  writeLastRefresh(dataset.generated_at);
 
-  renderTwinRivers("#chart-timeline", data.twin_rivers.points);
+  renderTwinRivers("#chart-timeline", data.twin_rivers, () => highlightModel(highlighted));
   renderEfficiencyMap("#chart-efficiency", data.efficiency_map);
   renderConfidenceLens("#chart-confidence", data.confidence_lens);
   renderTransferGap("#chart-transfer", data.transfer_gap);
+  highlightModel(highlighted);
 }
 
-loadData()
-  .then(renderAll)
-  .catch((err) => {
-    document.body.innerHTML = `<main class=\"layout\"><section class=\"chart-card\"><h2>Data load error</h2><p>${err.message}</p></section></main>`;
+let highlighted = null;
+
+// Dim everything but the model's SVG marks in every chart. Charts drawn on
+// canvas (very large datasets) keep their points as they are.
+function highlightModel(name) {
+  highlighted = name;
+  for (const chart of document.querySelectorAll(".chart")) {
+    chart.classList.toggle("has-match", name != null);
+    d3.select(chart)
+      .selectAll("circle, line")
+      .classed("is-match", (d) => name != null && d?.model === name);
+  }
+}
+
+function renderSearchResults(list, results) {
+  list.replaceChildren(
+    ...results.map((result) => {
+      const item = document.createElement("li");
+      const button = document.createElement("button");
+      button.type = "button";
+      button.textContent = result.model;
+      button.addEventListener("click", () => highlightModel(result.model));
+      const meta = document.createElement("span");
+      meta.className = "search-meta";
+      const via = result.term !== result.model.toLowerCase() ? ` · ${result.term}` : "";
+      meta.textContent = `${result.provider || "unknown"}${via}`;
+      const link = document.createElement("a");
+      link.href = `pages/models/${result.key}.html`;
+      link.textContent = "details";
+      item.append(button, meta, link);
+      return item;
+    })
+  );
+}
+
+function setupSearch() {
+  const input = document.getElementById("model-search");
+  const list = document.getElementById("search-results");
+  if (!input || !list) {
+    return;
+  }
+  // The index is only fetched once someone starts to search.
+  let index = null;
+  const ensureIndex = () => (index ??= loadSearchIndex());
+  input.addEventListener("focus", () => ensureIndex().catch(() => undefined), { once: true });
+  input.addEventListener("input", async () => {
+    const query = input.value;
+    if (!query.trim()) {
+      list.replaceChildren();
+      highlightModel(null);
+      return;
+    }
+    try {
+      const results = searchModels(await ensureIndex(), query);
+      if (input.value === query) {
+        renderSearchResults(list, results);
+      }
+    } catch {
+      index = null;
+    }
+  });
+  input.addEventListener("keydown", (event) => {
+    if (event.key === "Enter") {
+      list.querySelector("button")?.click();
+    }
+  });
+}
+
+let currentVersion = null;
+
+async function loadAndRender() {
+  const manifest = await loadManifest();
+  currentVersion = manifest.version ?? null;
+  renderAll(await loadManifestData(manifest));
+}
+
+// A cached manifest can name a hashed file a later deploy no longer has;
+// the fixed data.json is always current.
+async function loadManifestData(manifest) {
+  if (!manifest.data) {
+    return loadData(dataUrl("data.json"));
+  }
+  try {
+    return await loadData(dataUrl(manifest.data));
+  } catch {
+    return loadData(dataUrl("data.json"));
+  }
+}
+
+loadFreshness().then((freshness) => writeLastRefresh(freshness?.generated_at));
+setupSearch();
+
+loadAndRender().catch((err) => {
+  document.body.innerHTML = `<main class=\"layout\"><section class=\"chart-card\"><h2>Data load error</h2><p>${err.message}</p></section></main>`;
+});
+
+if ("serviceWorker" in navigator) {
+  // The worker answers from cache first; when its background check finds a
+  // newer manifest version, re-render with the new data.
+  navigator.serviceWorker.addEventListener("message", (event) => {
+    if (event.data?.type === "data-updated" && event.data.version !== currentVersion) {
+      loadAndRender().catch(() => undefined);
+      loadFreshness().then((freshness) => writeLastRefresh(freshness?.generated_at));
+    }
   });
+  navigator.serviceWorker.register("./sw.js").catch(() => undefined);
+}
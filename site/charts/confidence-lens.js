@@ -1,10 +1,11 @@
 import { addLegend } from "./legend.js";
-import { createTooltip } from "./tooltip.js";
-import { COLORS, setupSvg } from "./utils.js";
+import { drawPoints } from "./points.js";
+import { COLORS, formatInterval, setupSvg } from "./utils.js";
 
 export function renderConfidenceLens(containerSelector, payload) {
   const points = payload.points || [];
-  const { svg, margin, innerWidth, innerHeight } = setupSvg(containerSelector, 370);
+  const chart = setupSvg(containerSelector, 370);
+  const { svg, margin, innerWidth, innerHeight } = chart;
   const g = svg.append("g").attr("transform", `translate(${margin.left},${margin.top})`);
 
   if (!points.length) {
@@ -15,15 +16,9 @@ export function renderConfidenceLens(containerSelector, payload) {
     return;
   }
 
-  const x = d3.scaleLinear().domain(d3.extent(points, (d) => d.hle_score)).range([0, innerWidth]).nice();
-  const y = d3
-    .scaleLinear()
-    .domain([0, d3.max(points, (d) => d.calibration_error) || 1])
-    .range([innerHeight, 0])
-    .nice();
-  const arcVals = points.map((d) => d.arc_agi_2 || 0).filter((v) => v > 0);
-  const rDomain = arcVals.length > 1 ? [0, d3.max(arcVals)] : [0, 100];
-  const r = d3.scaleSqrt().domain(rDomain).range([5, 16]);
+  const x = d3.scaleLinear().domain(payload.domains.x).range([0, innerWidth]).nice();
+  const y = d3.scaleLinear().domain(payload.domains.y).range([innerHeight, 0]).nice();
+  const r = d3.scaleSqrt().domain(payload.domains.r).range([5, 16]);
 
   g.append("g").attr("class", "axis").attr("transform", `translate(0,${innerHeight})`).call(d3.axisBottom(x));
   g.append("g").attr("class", "axis").call(d3.axisLeft(y));
@@ -53,24 +48,25 @@ export function renderConfidenceLens(containerSelector, payload) {
 
   g.append("text").attr("class", "quadrant-label").attr("x", 8).attr("y", 12).text("Danger: overconfident");
 
-  const tooltip = createTooltip();
-
-  g.selectAll("circle")
-    .data(points)
-    .join("circle")
-    .attr("cx", (d) => x(d.hle_score))
-    .attr("cy", (d) => y(d.calibration_error))
-    .attr("r", (d) => r(d.arc_agi_2 || 0))
-    .attr("fill", COLORS.arc)
-    .attr("opacity", 0.65)
-    .on("mouseenter", (event, d) => {
-      tooltip.show(
-        event,
-        `<strong>${d.model}</strong><br/>HLE: ${d.hle_score?.toFixed(1) ?? "n/a"}<br/>Calibration error: ${d.calibration_error?.toFixed(3) ?? "n/a"}<br/>ARC score proxy: ${d.arc_agi_2?.toFixed(1) ?? "n/a"}`
-      );
-    })
-    .on("mousemove", (event) => tooltip.move(event))
-    .on("mouseleave", () => tooltip.hide());
+  drawPoints(
+    chart,
+    g,
+    [
+      {
+        points,
+        className: "bubble",
+        cx: (d) => x(d.hle_score),
+        cy: (d) => y(d.calibration_error),
+        r: (d) => r(d.arc_agi_2 || 0),
+        fill: COLORS.arc,
+        opacity: 0.65,
+      },
+    ],
+    {
+      tooltipHtml: (d) =>
+        `<strong>${d.model}</strong><br/>HLE: ${d.hle_score?.toFixed(1) ?? "n/a"}${formatInterval(d.hle_score_ci)}<br/>Calibration error: ${d.calibration_error?.toFixed(3) ?? "n/a"}<br/>ARC score proxy: ${d.arc_agi_2?.toFixed(1) ?? "n/a"}`,
+    }
+  );
 
   addLegend(
     g,
@@ -1,13 +1,15 @@
 import { addLegend } from "./legend.js";
 import { addPointLabels } from "./labels.js";
-import { createTooltip } from "./tooltip.js";
-import { COLORS, providerColor, setupSvg } from "./utils.js";
+import { CANVAS_POINT_THRESHOLD, drawPoints } from "./points.js";
+import { MIN_COST } from "./prepare.js";
+import { COLORS, formatInterval, providerColor, setupSvg } from "./utils.js";
 
 export function renderEfficiencyMap(containerSelector, payload) {
   const points = payload.points || [];
   const pareto = payload.pareto_frontier || [];
 
-  const { svg, margin, innerWidth, innerHeight } = setupSvg(containerSelector, 380);
+  const chart = setupSvg(containerSelector, 380);
+  const { svg, margin, innerWidth, innerHeight } = chart;
   const g = svg.append("g").attr("transform", `translate(${margin.left},${margin.top})`);
 
   if (!points.length) {
@@ -15,52 +17,58 @@ export function renderEfficiencyMap(containerSelector, payload) {
     return;
   }
 
-  const x = d3
-    .scaleLog()
-    .domain(d3.extent(points, (d) => Math.max(0.0001, d.cost_per_task)))
-    .range([0, innerWidth])
-    .nice();
-
-  const y = d3
-    .scaleLinear()
-    .domain([0, d3.max(points, (d) => d.score) || 100])
-    .range([innerHeight, 0])
-    .nice();
+  const x = d3.scaleLog().domain(payload.domains.x).range([0, innerWidth]).nice();
+  const y = d3.scaleLinear().domain(payload.domains.y).range([innerHeight, 0]).nice();
+  const cx = (d) => x(Math.max(MIN_COST, d.cost_per_task));
 
   g.append("g").attr("class", "axis").attr("transform", `translate(0,${innerHeight})`).call(d3.axisBottom(x).ticks(6, "~g"));
   g.append("g").attr("class", "axis").call(d3.axisLeft(y));
 
-  const tooltip = createTooltip();
+  // 95% score intervals; skipped when the points themselves go to canvas.
+  if (points.length < CANVAS_POINT_THRESHOLD) {
+    g.selectAll("line.error-bar")
+      .data(points.filter((d) => d.score_ci))
+      .join("line")
+      .attr("class", "error-bar")
+      .attr("x1", cx)
+      .attr("x2", cx)
+      .attr("y1", (d) => y(d.score_ci[0]))
+      .attr("y2", (d) => y(d.score_ci[1]))
+      .attr("stroke", (d) => providerColor(d.provider));
+  }
 
-  g.selectAll("circle.point")
-    .data(points)
-    .join("circle")
-    .attr("class", "point")
-    .attr("cx", (d) => x(Math.max(0.0001, d.cost_per_task)))
-    .attr("cy", (d) => y(d.score))
-    .attr("r", (d) => Math.min(10, Math.max(4, Math.sqrt(d.tasks_evaluated || 16))))
-    .attr("fill", (d) => providerColor(d.provider))
-    .attr("opacity", 0.75)
-    .on("mouseenter", (event, d) => {
-      tooltip.show(
-        event,
-        `<strong>${d.model}</strong><br/>Provider: ${d.provider || "n/a"}<br/>ARC: ${d.score?.toFixed(1) ?? "n/a"}<br/>Cost/task: $${d.cost_per_task?.toFixed(4) ?? "n/a"}<br/>Efficiency: ${d.efficiency_ratio?.toFixed(2) ?? "n/a"}`
-      );
-    })
-    .on("mousemove", (event) => tooltip.move(event))
-    .on("mouseleave", () => tooltip.hide());
+  drawPoints(
+    chart,
+    g,
+    [
+      {
+        points,
+        className: "point",
+        cx,
+        cy: (d) => y(d.score),
+        r: (d) => Math.min(10, Math.max(4, Math.sqrt(d.tasks_evaluated || 16))),
+        fill: (d) => providerColor(d.provider),
+        opacity: 0.75,
+      },
+    ],
+    {
+      tooltipHtml: (d) =>
+        `<strong>${d.model}</strong><br/>Provider: ${d.provider || "n/a"}<br/>ARC: ${d.score?.toFixed(1) ?? "n/a"}${formatInterval(d.score_ci)}<br/>Cost/task: $${d.cost_per_task?.toFixed(4) ?? "n/a"}<br/>Efficiency: ${d.efficiency_ratio?.toFixed(2) ?? "n/a"}${formatInterval(d.efficiency_ratio_ci, 2)}` +
+        (d.pareto_probability != null ? `<br/>On frontier: ${Math.round(d.pareto_probability * 100)}%` : ""),
+    }
+  );
 
   g.append("path")
     .datum(pareto)
     .attr("fill", "none")
     .attr("stroke", COLORS.pareto)
     .attr("stroke-width", 2)
-    .attr("d", d3.line().x((d) => x(Math.max(0.0001, d.cost_per_task))).y((d) => y(d.score)));
+    .attr("d", d3.line().x(cx).y((d) => y(d.score)));
 
   addPointLabels(
     g,
     pareto.map((d) => ({ ...d, labelPriority: d.score || 0 })),
-    (d) => x(Math.max(0.0001, d.cost_per_task)),
+    cx,
     (d) => y(d.score),
     { topN: 10, yMinGap: 11 }
   );
@@ -0,0 +1,60 @@
+import { createTooltip } from "./tooltip.js";
+
+export const HOVER_RADIUS = 12;
+
+// One delegated listener per chart: pointer positions are mapped into the
+// plot's coordinates and resolved against a quadtree of drawn points, so
+// hover cost does not grow with the number of models and works the same for
+// SVG and canvas rendering. `hits` are { x, y, d } in plot coordinates.
+export function attachHover(svg, g, hits, tooltipHtml, radius = HOVER_RADIUS) {
+  const tree = d3
+    .quadtree()
+    .x((hit) => hit.x)
+    .y((hit) => hit.y)
+    .addAll(hits.filter((hit) => Number.isFinite(hit.x) && Number.isFinite(hit.y)));
+  const htmlCache = new Map();
+  const tooltip = createTooltip();
+
+  let current = null;
+  let pending = null;
+  let frame = 0;
+
+  const update = () => {
+    frame = 0;
+    const event = pending;
+    const [mx, my] = d3.pointer(event, g.node());
+    const hit = tree.find(mx, my, radius);
+    if (!hit) {
+      current = null;
+      tooltip.hide();
+      return;
+    }
+    if (hit.d !== current) {
+      current = hit.d;
+      let html = htmlCache.get(hit.d);
+      if (html === undefined) {
+        html = tooltipHtml(hit.d);
+        htmlCache.set(hit.d, html);
+      }
+      tooltip.show(event, html);
+    } else {
+      tooltip.move(event);
+    }
+  };
+
+  svg
+    .on("pointermove.hover", (event) => {
+      pending = event;
+      if (!frame) {
+        frame = requestAnimationFrame(update);
+      }
+    })
+    .on("pointerleave.hover", () => {
+      if (frame) {
+        cancelAnimationFrame(frame);
+        frame = 0;
+      }
+      current = null;
+      tooltip.hide();
+    });
+}
@@ -0,0 +1,68 @@
+import { attachHover } from "./hover.js";
+
+// Above this many points the DOM cost of one <circle> each dominates, so the
+// points are painted onto a canvas behind the SVG axes, paths and labels.
+export const CANVAS_POINT_THRESHOLD = 2000;
+
+const valueOf = (accessor, d) => (typeof accessor === "function" ? accessor(d) : accessor);
+
+// Each layer is { points, className, cx, cy, r, fill, opacity }.
+export function drawPoints(chart, g, layers, { tooltipHtml, threshold = CANVAS_POINT_THRESHOLD } = {}) {
+  const total = layers.reduce((sum, layer) => sum + layer.points.length, 0);
+  const hits = total >= threshold ? drawCanvasPoints(chart, layers) : drawSvgPoints(g, layers);
+  attachHover(chart.svg, g, hits, tooltipHtml);
+}
+
+function drawSvgPoints(g, layers) {
+  const hits = [];
+  for (const layer of layers) {
+    g.selectAll(`circle.${layer.className}`)
+      .data(layer.points)
+      .join("circle")
+      .attr("class", layer.className)
+      .attr("cx", layer.cx)
+      .attr("cy", layer.cy)
+      .attr("r", layer.r)
+      .attr("fill", layer.fill)
+      .attr("opacity", layer.opacity ?? 1);
+    for (const d of layer.points) {
+      hits.push({ x: layer.cx(d), y: layer.cy(d), d });
+    }
+  }
+  return hits;
+}
+
+function drawCanvasPoints(chart, layers) {
+  const { container, width, height, margin } = chart;
+  const ratio = window.devicePixelRatio || 1;
+  const canvas = container
+    .insert("canvas", "svg")
+    .attr("class", "chart-canvas")
+    .attr("width", Math.round(width * ratio))
+    .attr("height", Math.round(height * ratio));
+
+  const ctx = canvas.node().getContext("2d");
+  ctx.scale(ratio, ratio);
+  ctx.translate(margin.left, margin.top);
+
+  const hits = [];
+  for (const layer of layers) {
+    ctx.globalAlpha = layer.opacity ?? 1;
+    for (const d of layer.points) {
+      const px = layer.cx(d);
+      const py = layer.cy(d);
+      if (!Number.isFinite(px) || !Number.isFinite(py)) {
+        continue;
+      }
+      const fill = valueOf(layer.fill, d);
+      if (ctx.fillStyle !== fill) {
+        ctx.fillStyle = fill;
+      }
+      ctx.beginPath();
+      ctx.arc(px, py, valueOf(layer.r, d), 0, 2 * Math.PI);
+      ctx.fill();
+      hits.push({ x: px, y: py, d });
+    }
+  }
+  return hits;
+}
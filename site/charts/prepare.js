@@ -0,0 +1,75 @@
+// Scale domains and derived rows for every chart, computed once per dataset.
+// Runs inside data-worker.js (or on the main thread as a fallback), so it
+// must not depend on d3 or the DOM.
+
+export const MIN_COST = 0.0001;
+
+function extent(points, value) {
+  let lo = Infinity;
+  let hi = -Infinity;
+  for (const d of points) {
+    const v = value(d);
+    if (v == null || !Number.isFinite(v)) {
+      continue;
+    }
+    if (v < lo) lo = v;
+    if (v > hi) hi = v;
+  }
+  return lo <= hi ? [lo, hi] : [0, 1];
+}
+
+function maxOr(points, value, fallback) {
+  const [, hi] = extent(points, value);
+  return points.length && hi > 0 ? hi : fallback;
+}
+
+function prepareEfficiency(payload) {
+  const points = payload.points || [];
+  payload.domains = {
+    x: extent(points, (d) => Math.max(MIN_COST, d.cost_per_task)),
+    y: [0, maxOr(points, (d) => d.score, 100)],
+  };
+}
+
+function prepareConfidence(payload) {
+  const points = payload.points || [];
+  const arcVals = points.map((d) => d.arc_agi_2 || 0).filter((v) => v > 0);
+  payload.domains = {
+    x: extent(points, (d) => d.hle_score),
+    y: [0, maxOr(points, (d) => d.calibration_error, 1)],
+    r: arcVals.length > 1 ? [0, extent(arcVals, (v) => v)[1]] : [0, 100],
+  };
+}
+
+function prepareTransfer(payload) {
+  const points = payload.points || [];
+  payload.domains = { x: [0, maxOr(points, (d) => Math.max(d.arc_agi_2, d.hle), 100) * 1.15] };
+}
+
+// Dated rows in release order, from data.json or a fetched timeline resolution.
+export function timelineRows(points) {
+  return (points || [])
+    .map((d) => ({ ...d, t: Date.parse(d.release_date) }))
+    .filter((d) => d.release_date)
+    .filter((d) => Number.isFinite(d.t))
+    .sort((a, b) => a.t - b.t);
+}
+
+function prepareTwinRivers(payload) {
+  // Domains come from the inline resolution, which keeps the labelled (top)
+  // scores and each series' endpoints, so they hold when a larger one loads.
+  const rows = timelineRows(payload.points);
+  payload.rows = rows;
+  payload.domains = {
+    x: extent(rows, (d) => d.t),
+    y: [0, maxOr(rows, (d) => Math.max(d.arc_score || 0, d.hle_score || 0), 100)],
+  };
+}
+
+export function prepareChartData(data) {
+  prepareTwinRivers(data.twin_rivers || {});
+  prepareEfficiency(data.efficiency_map || {});
+  prepareConfidence(data.confidence_lens || {});
+  prepareTransfer(data.transfer_gap || {});
+  return data;
+}
@@ -1,6 +1,6 @@
 import { addLegend } from "./legend.js";
-import { createTooltip } from "./tooltip.js";
-import { COLORS, setupSvg } from "./utils.js";
+import { attachHover } from "./hover.js";
+import { COLORS, formatInterval, setupSvg } from "./utils.js";
 
 export function renderTransferGap(containerSelector, payload) {
   const points = payload.points || [];
@@ -19,67 +19,76 @@ export function renderTransferGap(containerSelector, payload) {
     .range([0, innerHeight])
     .padding(0.25);
 
-  // Leave 15% of width as right padding so gap labels don't clip
-  const xMax = d3.max(points, (d) => Math.max(d.arc_agi_2, d.hle)) || 100;
-  const x = d3
-    .scaleLinear()
-    .domain([0, xMax * 1.15])
-    .range([0, innerWidth]);
+  // The domain leaves 15% of width as right padding so gap labels don't clip
+  const x = d3.scaleLinear().domain(payload.domains.x).range([0, innerWidth]);
 
   g.append("g").attr("class", "axis").call(d3.axisLeft(y));
   g.append("g").attr("class", "axis").attr("transform", `translate(0,${innerHeight})`).call(d3.axisBottom(x));
 
-  const tooltip = createTooltip();
+  const rowY = (d) => y(d.model) + y.bandwidth() / 2;
 
   g.selectAll("line.gap")
     .data(points)
     .join("line")
     .attr("x1", (d) => x(Math.min(d.arc_agi_2, d.hle)))
     .attr("x2", (d) => x(Math.max(d.arc_agi_2, d.hle)))
-    .attr("y1", (d) => y(d.model) + y.bandwidth() / 2)
-    .attr("y2", (d) => y(d.model) + y.bandwidth() / 2)
+    .attr("y1", rowY)
+    .attr("y2", rowY)
     .attr("stroke", "#a8bbb0")
-    .attr("stroke-width", 2)
-    .on("mouseenter", (event, d) => {
-      tooltip.show(
-        event,
-        `<strong>${d.model}</strong><br/>ARC-AGI: ${d.arc_agi_2?.toFixed(1)}<br/>HLE: ${d.hle?.toFixed(1)}<br/>Gap: ${d.gap >= 0 ? "+" : ""}${d.gap?.toFixed(1)}`
-      );
-    })
-    .on("mousemove", (event) => tooltip.move(event))
-    .on("mouseleave", () => tooltip.hide());
+    .attr("stroke-width", 2);
 
-  const circleTooltipHtml = (d) =>
-    `<strong>${d.model}</strong><br/>ARC-AGI: ${d.arc_agi_2?.toFixed(1)}<br/>HLE: ${d.hle?.toFixed(1)}<br/>Gap: ${d.gap >= 0 ? "+" : ""}${d.gap?.toFixed(1)}`;
+  // 95% interval whiskers behind each score dot.
+  for (const [key, color] of [
+    ["arc_agi_2_ci", COLORS.arc],
+    ["hle_ci", COLORS.hle],
+  ]) {
+    g.selectAll(`line.error-bar.${key}`)
+      .data(points.filter((d) => d[key]))
+      .join("line")
+      .attr("class", `error-bar ${key}`)
+      .attr("x1", (d) => x(d[key][0]))
+      .attr("x2", (d) => x(d[key][1]))
+      .attr("y1", (d) => rowY(d) - 3)
+      .attr("y2", (d) => rowY(d) - 3)
+      .attr("stroke", color);
+  }
 
   g.selectAll("circle.arc")
     .data(points)
     .join("circle")
     .attr("cx", (d) => x(d.arc_agi_2))
-    .attr("cy", (d) => y(d.model) + y.bandwidth() / 2)
+    .attr("cy", rowY)
     .attr("r", 5)
-    .attr("fill", COLORS.arc)
-    .on("mouseenter", (event, d) => tooltip.show(event, circleTooltipHtml(d)))
-    .on("mousemove", (event) => tooltip.move(event))
-    .on("mouseleave", () => tooltip.hide());
+    .attr("fill", COLORS.arc);
 
   g.selectAll("circle.hle")
     .data(points)
     .join("circle")
     .attr("cx", (d) => x(d.hle))
-    .attr("cy", (d) => y(d.model) + y.bandwidth() / 2)
+    .attr("cy", rowY)
     .attr("r", 5)
-    .attr("fill", COLORS.hle)
-    .on("mouseenter", (event, d) => tooltip.show(event, circleTooltipHtml(d)))
-    .on("mousemove", (event) => tooltip.move(event))
-    .on("mouseleave", () => tooltip.hide());
+    .attr("fill", COLORS.hle);
+
+  // Both dots and the middle of each gap line resolve to the model's row.
+  const hits = points.flatMap((d) => [
+    { x: x(d.arc_agi_2), y: rowY(d), d },
+    { x: x(d.hle), y: rowY(d), d },
+    { x: x((d.arc_agi_2 + d.hle) / 2), y: rowY(d), d },
+  ]);
+  attachHover(
+    svg,
+    g,
+    hits,
+    (d) =>
+      `<strong>${d.model}</strong><br/>ARC-AGI: ${d.arc_agi_2?.toFixed(1)}${formatInterval(d.arc_agi_2_ci)}<br/>HLE: ${d.hle?.toFixed(1)}${formatInterval(d.hle_ci)}<br/>Gap: ${d.gap >= 0 ? "+" : ""}${d.gap?.toFixed(1)}${formatInterval(d.gap_ci)}`
+  );
 
   g.selectAll("text.gap")
     .data(points)
     .join("text")
     .attr("class", "gap-label")
     .attr("x", (d) => x(Math.max(d.arc_agi_2, d.hle)) + 6)
-    .attr("y", (d) => y(d.model) + y.bandwidth() / 2 + 3)
+    .attr("y", (d) => rowY(d) + 3)
     .text((d) => `${d.gap >= 0 ? "+" : ""}${d.gap.toFixed(1)}`);
 
   addLegend(
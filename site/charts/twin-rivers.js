@@ -1,33 +1,81 @@
 import { addLegend } from "./legend.js";
 import { addPointLabels } from "./labels.js";
-import { createTooltip } from "./tooltip.js";
+import { drawPoints } from "./points.js";
 import { COLORS, setupSvg } from "./utils.js";
 
-export function renderTwinRivers(containerSelector, points) {
-  const rows = (points || [])
-    .filter((d) => d.release_date)
-    .map((d) => ({ ...d, date: new Date(d.release_date) }))
-    .filter((d) => !Number.isNaN(d.date.getTime()))
-    .sort((a, b) => a.date - b.date);
+import { timelineRows } from "./prepare.js";
 
-  const { svg, margin, innerWidth, innerHeight } = setupSvg(containerSelector, 380);
+// Must match pipeline/downsample.py PX_PER_POINT.
+const PX_PER_POINT = 2;
+
+// Smallest resolution with enough points for the plot width. Resolutions are
+// ordered by size and end with the full series (size null).
+function pickResolution(resolutions, plotWidth) {
+  const wanted = plotWidth / PX_PER_POINT;
+  const list = resolutions || [];
+  return list.find((entry) => entry.size != null && entry.size >= wanted) || list[list.length - 1] || null;
+}
+
+async function loadResolution(entry) {
+  const res = await fetch(new URL(`./${entry.data}`, document.baseURI));
+  if (!res.ok) {
+    throw new Error(`Unable to load ${entry.data} (${res.status})`);
+  }
+  return res.json();
+}
+
+// data.json carries the smallest resolution; a wider plot fetches its own
+// series once, then draws again and calls onRedraw so the page can restyle
+// the new marks (e.g. reapply a highlight).
+function upgradeResolution(containerSelector, payload, entry, onRedraw) {
+  payload.shown ??= payload.resolutions[0].data;
+  if (entry.data === payload.shown || entry.data === payload.pending) {
+    return;
+  }
+  payload.pending = entry.data;
+  loadResolution(entry)
+    .then((series) => {
+      payload.rows = timelineRows(series.points);
+      for (const key of ["arc", "hle"]) {
+        if (payload.trend?.[key]) {
+          payload.trend[key] = { ...payload.trend[key], frontier: series.frontier[key] };
+        }
+      }
+      payload.shown = entry.data;
+      renderTwinRivers(containerSelector, payload, onRedraw);
+      onRedraw?.();
+    })
+    .catch(() => undefined)
+    .finally(() => {
+      payload.pending = null;
+    });
+}
+
+export function renderTwinRivers(containerSelector, payload, onRedraw) {
+  const trend = payload.trend || {};
+  const rows = payload.rows || [];
+
+  const chart = setupSvg(containerSelector, 380);
+  const { svg, margin, innerWidth, innerHeight } = chart;
   const g = svg.append("g").attr("transform", `translate(${margin.left},${margin.top})`);
 
+  const resolution = pickResolution(payload.resolutions, innerWidth);
+  if (resolution) {
+    upgradeResolution(containerSelector, payload, resolution, onRedraw);
+  }
+
   if (!rows.length) {
     g.append("text").text("No release-date aligned data available").attr("x", 10).attr("y", 20);
     return;
   }
 
-  const x = d3.scaleTime().domain(d3.extent(rows, (d) => d.date)).range([0, innerWidth]);
-  const y = d3
-    .scaleLinear()
-    .domain([0, d3.max(rows, (d) => Math.max(d.arc_score || 0, d.hle_score || 0)) || 100])
-    .range([innerHeight, 0])
-    .nice();
+  const x = d3.scaleTime().domain(payload.domains.x).range([0, innerWidth]);
+  const y = d3.scaleLinear().domain(payload.domains.y).range([innerHeight, 0]).nice();
 
   g.append("g").attr("class", "axis").attr("transform", `translate(0,${innerHeight})`).call(d3.axisBottom(x).ticks(6));
   g.append("g").attr("class", "axis").call(d3.axisLeft(y));
 
+  // A resolution sets the score of a series it dropped a point from to null.
   const arcSeries = rows.filter((d) => d.arc_score != null);
   const hleSeries = rows.filter((d) => d.hle_score != null);
 
@@ -39,7 +87,7 @@ export function renderTwinRivers(containerSelector, points) {
       .attr("stroke-opacity", 0.7)
       .attr("stroke-width", 2)
       .attr("stroke-dasharray", "5,3")
-      .attr("d", d3.line().x((d) => x(d.date)).y((d) => y(d.arc_score)));
+      .attr("d", d3.line().x((d) => x(d.t)).y((d) => y(d.arc_score)));
   }
 
   if (hleSeries.length > 1) {
@@ -50,53 +98,69 @@ export function renderTwinRivers(containerSelector, points) {
       .attr("stroke-opacity", 0.7)
       .attr("stroke-width", 2)
       .attr("stroke-dasharray", "5,3")
-      .attr("d", d3.line().x((d) => x(d.date)).y((d) => y(d.hle_score)));
+      .attr("d", d3.line().x((d) => x(d.t)).y((d) => y(d.hle_score)));
+  }
+
+  for (const [key, color] of [["arc", COLORS.arc], ["hle", COLORS.hle]]) {
+    const series = trend[key] || {};
+    const band = (series.band || [])
+      .filter((d) => d.lo != null && d.hi != null)
+      .map((d) => ({ ...d, date: new Date(d.release_date) }));
+    if (band.length > 1) {
+      const yMax = y.domain()[1];
+      g.append("path")
+        .datum(band)
+        .attr("class", "trend-band")
+        .attr("fill", color)
+        .attr("opacity", 0.08)
+        .attr("d", d3.area().x((d) => x(d.date)).y0((d) => y(Math.min(d.lo, yMax))).y1((d) => y(Math.min(d.hi, yMax))));
+      g.append("path")
+        .datum(band)
+        .attr("class", "trend-fit")
+        .attr("fill", "none")
+        .attr("stroke", color)
+        .attr("stroke-opacity", 0.6)
+        .attr("stroke-dasharray", "4,3")
+        .attr("d", d3.line().x((d) => x(d.date)).y((d) => y(Math.min(d.fit, yMax))));
+    }
+
+    const steps = (series.frontier || []).map((d) => ({ ...d, date: new Date(d.release_date) }));
+    if (steps.length) {
+      steps.push({ ...steps[steps.length - 1], date: x.domain()[1] });
+      g.append("path")
+        .datum(steps)
+        .attr("class", "running-best")
+        .attr("fill", "none")
+        .attr("stroke", color)
+        .attr("stroke-width", 1.5)
+        .attr("stroke-opacity", 0.8)
+        .attr("d", d3.line().curve(d3.curveStepAfter).x((d) => x(d.date)).y((d) => y(d.score)));
+    }
   }
 
   g.selectAll("line.bridge")
     .data(rows.filter((d) => d.arc_score != null && d.hle_score != null))
     .join("line")
-    .attr("x1", (d) => x(d.date))
-    .attr("x2", (d) => x(d.date))
+    .attr("x1", (d) => x(d.t))
+    .attr("x2", (d) => x(d.t))
     .attr("y1", (d) => y(d.arc_score))
     .attr("y2", (d) => y(d.hle_score))
     .attr("stroke", "#8fb8b0")
     .attr("stroke-width", 1.5)
     .attr("stroke-dasharray", "2,2");
 
-  const tooltip = createTooltip();
-
-  g.selectAll("circle.arc")
-    .data(arcSeries)
-    .join("circle")
-    .attr("cx", (d) => x(d.date))
-    .attr("cy", (d) => y(d.arc_score))
-    .attr("r", 4.5)
-    .attr("fill", COLORS.arc)
-    .on("mouseenter", (event, d) => {
-      tooltip.show(
-        event,
-        `<strong>${d.model}</strong><br/>Release: ${d.release_date}<br/>ARC: ${d.arc_score?.toFixed(1) ?? "n/a"}<br/>HLE: ${d.hle_score?.toFixed(1) ?? "n/a"}`
-      );
-    })
-    .on("mousemove", (event) => tooltip.move(event))
-    .on("mouseleave", () => tooltip.hide());
-
-  g.selectAll("circle.hle")
-    .data(hleSeries)
-    .join("circle")
-    .attr("cx", (d) => x(d.date))
-    .attr("cy", (d) => y(d.hle_score))
-    .attr("r", 4.5)
-    .attr("fill", COLORS.hle)
-    .on("mouseenter", (event, d) => {
-      tooltip.show(
-        event,
-        `<strong>${d.model}</strong><br/>Release: ${d.release_date}<br/>ARC: ${d.arc_score?.toFixed(1) ?? "n/a"}<br/>HLE: ${d.hle_score?.toFixed(1) ?? "n/a"}`
-      );
-    })
-    .on("mousemove", (event) => tooltip.move(event))
-    .on("mouseleave", () => tooltip.hide());
+  drawPoints(
+    chart,
+    g,
+    [
+      { points: arcSeries, className: "arc", cx: (d) => x(d.t), cy: (d) => y(d.arc_score), r: 4.5, fill: COLORS.arc },
+      { points: hleSeries, className: "hle", cx: (d) => x(d.t), cy: (d) => y(d.hle_score), r: 4.5, fill: COLORS.hle },
+    ],
+    {
+      tooltipHtml: (d) =>
+        `<strong>${d.model}</strong><br/>Release: ${d.release_date}<br/>ARC: ${d.arc_score?.toFixed(1) ?? "n/a"}<br/>HLE: ${d.hle_score?.toFixed(1) ?? "n/a"}`,
+    }
+  );
 
   // Label ARC series (or fall back to HLE if ARC has few points)
   const labelSeries = arcSeries.length >= 4 ? arcSeries : hleSeries;
@@ -107,7 +171,7 @@ export function renderTwinRivers(containerSelector, points) {
   addPointLabels(
     g,
     labelSeries.map((d) => ({ ...d, labelPriority: d[labelPriorityKey] || 0 })),
-    (d) => x(d.date),
+    (d) => x(d.t),
     labelY,
     { topN: 10 }
   );
@@ -117,6 +181,7 @@ export function renderTwinRivers(containerSelector, points) {
     [
       { label: "ARC-AGI", color: COLORS.arc },
       { label: "HLE", color: COLORS.hle },
+      { label: "Running best + trend", color: COLORS.neutral },
     ],
     { x: 0, y: -8, itemGap: 92 }
   );
@@ -49,6 +49,7 @@ export function setupSvg(containerSelector, height = 340, marginOverrides = {})
     .attr("preserveAspectRatio", "xMidYMid meet");
 
   return {
+    container,
     svg,
     width,
     height,
@@ -57,3 +58,8 @@ export function setupSvg(containerSelector, height = 340, marginOverrides = {})
     margin,
   };
 }
+
+// "[lo–hi]" suffix for a 95% interval from analysis.json, or "" when absent.
+export function formatInterval(ci, digits = 1) {
+  return ci ? ` [${ci[0].toFixed(digits)}–${ci[1].toFixed(digits)}]` : "";
+}
@@ -0,0 +1,17 @@
+// Fetches and parses data.json off the main thread and precomputes chart
+// domains, so large payloads do not block the first paint.
+import { prepareChartData } from "./charts/prepare.js";
+
+self.onmessage = async (event) => {
+  try {
+    const res = await fetch(event.data.url);
+    if (!res.ok) {
+      throw new Error(`Unable to load data.json (${res.status})`);
+    }
+    const dataset = await res.json();
+    prepareChartData(dataset.data);
+    self.postMessage({ dataset });
+  } catch (err) {
+    self.postMessage({ error: err.message });
+  }
+};
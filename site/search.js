@@ -0,0 +1,105 @@
+// Client for search-index.json (see pipeline/search.py). Prefix matches come
+// from a binary search over the sorted terms; fuzzy matches count shared
+// trigrams through the posting lists. No DOM access, so it can run anywhere.
+
+const PREFIX_BONUS = 1;
+const MIN_FUZZY_SCORE = 0.5;
+
+// Must match pipeline/search.py normalize().
+export function normalize(text) {
+  return (text.normalize("NFKD").toLowerCase().match(/[a-z0-9]+/g) || []).join(" ");
+}
+
+function trigrams(term) {
+  const padded = ` ${term} `;
+  const grams = new Set();
+  for (let i = 0; i + 3 <= padded.length; i += 1) {
+    grams.add(padded.slice(i, i + 3));
+  }
+  return grams;
+}
+
+function decode(deltas) {
+  const ids = new Array(deltas.length);
+  let id = 0;
+  for (let i = 0; i < deltas.length; i += 1) {
+    id += deltas[i];
+    ids[i] = id;
+  }
+  return ids;
+}
+
+export async function loadSearchIndex(url = "./search-index.json") {
+  const res = await fetch(url);
+  if (!res.ok) {
+    throw new Error(`Unable to load search index (${res.status})`);
+  }
+  const index = await res.json();
+  // Posting lists are decoded lazily, once per trigram.
+  index.decoded = new Map();
+  return index;
+}
+
+function postings(index, gram) {
+  let ids = index.decoded.get(gram);
+  if (!ids) {
+    ids = index.grams[gram] ? decode(index.grams[gram]) : [];
+    index.decoded.set(gram, ids);
+  }
+  return ids;
+}
+
+function lowerBound(terms, query) {
+  let lo = 0;
+  let hi = terms.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (terms[mid] < query) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+// Best matches first, one per model: { model, key, provider, term, score }.
+export function searchModels(index, query, limit = 8) {
+  const q = normalize(query);
+  if (!q) {
+    return [];
+  }
+  const scores = new Map();
+  const consider = (termId, score) => {
+    const model = index.term_models[termId];
+    const best = scores.get(model);
+    if (!best || score > best.score) {
+      scores.set(model, { termId, score });
+    }
+  };
+
+  for (let i = lowerBound(index.terms, q); i < index.terms.length && index.terms[i].startsWith(q); i += 1) {
+    consider(i, PREFIX_BONUS + q.length / index.terms[i].length);
+  }
+
+  // Share of the query's trigrams found in the term, so substrings and
+  // near-misses of longer names still rank.
+  const grams = trigrams(q);
+  const shared = new Map();
+  for (const gram of grams) {
+    for (const termId of postings(index, gram)) {
+      shared.set(termId, (shared.get(termId) || 0) + 1);
+    }
+  }
+  for (const [termId, count] of shared) {
+    const score = count / grams.size;
+    if (score >= MIN_FUZZY_SCORE) {
+      consider(termId, score);
+    }
+  }
+
+  return [...scores]
+    .sort((a, b) => b[1].score - a[1].score || index.terms[a[1].termId].length - index.terms[b[1].termId].length)
+    .slice(0, limit)
+    .map(([model, { termId, score }]) => {
+      const [name, key, provider] = index.models[model];
+      return { model: name, key, provider, term: index.terms[termId], score };
+    });
+}
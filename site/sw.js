@@ -0,0 +1,157 @@
+// Service worker: precached app shell, a stale-while-revalidate manifest, and
+// cache-first content-hashed data files named by that manifest (and the
+// timeline resolutions named by those). data.json and the search index are
+// served stale-while-revalidate.
+//
+// Bump SHELL_VERSION when files are added to or removed from SHELL; edits to
+// existing files are picked up by the background refresh on the next visit.
+const SHELL_VERSION = "v2";
+const SHELL_CACHE = `atlas-shell-${SHELL_VERSION}`;
+const DATA_CACHE = "atlas-data";
+
+const SHELL = [
+  "./",
+  "index.html",
+  "style.css",
+  "app.js",
+  "data-worker.js",
+  "search.js",
+  "charts/confidence-lens.js",
+  "charts/efficiency-map.js",
+  "charts/hover.js",
+  "charts/labels.js",
+  "charts/legend.js",
+  "charts/points.js",
+  "charts/prepare.js",
+  "charts/tooltip.js",
+  "charts/transfer-gap.js",
+  "charts/twin-rivers.js",
+  "charts/utils.js",
+];
+// Only present on the deployed site; local checkouts fall back to the CDN.
+const OPTIONAL_SHELL = ["vendor/d3.min.js"];
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    caches.open(SHELL_CACHE).then(async (cache) => {
+      await cache.addAll(SHELL);
+      await Promise.all(OPTIONAL_SHELL.map((path) => cache.add(path).catch(() => undefined)));
+      await self.skipWaiting();
+    })
+  );
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches
+      .keys()
+      .then((keys) =>
+        Promise.all(
+          keys
+            .filter((key) => key.startsWith("atlas-shell-") && key !== SHELL_CACHE)
+            .map((key) => caches.delete(key))
+        )
+      )
+      .then(() => self.clients.claim())
+  );
+});
+
+async function broadcast(message) {
+  const clients = await self.clients.matchAll({ type: "window" });
+  for (const client of clients) {
+    client.postMessage(message);
+  }
+}
+
+async function staleWhileRevalidate(cacheName, request, onFresh) {
+  const cache = await caches.open(cacheName);
+  const cached = await cache.match(request);
+  // The cached body goes to the page, so compare against a copy.
+  const stale = cached && onFresh ? cached.clone() : undefined;
+  const refresh = fetch(request)
+    .then(async (response) => {
+      if (response.ok) {
+        await cache.put(request, response.clone());
+        if (onFresh) {
+          await onFresh(response.clone(), stale);
+        }
+      }
+      return response;
+    })
+    .catch(() => cached || Response.error());
+  return { cached, refresh };
+}
+
+async function handleManifest(event) {
+  const { cached, refresh } = await staleWhileRevalidate(DATA_CACHE, event.request, async (fresh, stale) => {
+    if (!stale) {
+      return;
+    }
+    const [next, previous] = await Promise.all([fresh.json(), stale.json()]);
+    if (next.version !== previous.version) {
+      await broadcast({ type: "data-updated", version: next.version });
+    }
+  });
+  event.waitUntil(refresh);
+  return cached || refresh;
+}
+
+const HASHED_DATA = /^data\.[0-9a-f]+\.json$/;
+const HASHED_TIMELINE = /^timeline\/(\w+)\.[0-9a-f]+\.json$/;
+
+function scopePath(url) {
+  return new URL(url).pathname.slice(new URL(self.registration.scope).pathname.length);
+}
+
+// Hashed files never change once published, so a cached copy is current by
+// construction; older versions (paths matching `supersedes`) are dropped once
+// a new one lands.
+async function handleHashed(request, supersedes) {
+  const cache = await caches.open(DATA_CACHE);
+  const cached = await cache.match(request);
+  if (cached) {
+    return cached;
+  }
+  const response = await fetch(request);
+  if (response.ok) {
+    for (const key of await cache.keys()) {
+      if (supersedes(scopePath(key.url))) {
+        await cache.delete(key);
+      }
+    }
+    await cache.put(request, response.clone());
+  }
+  return response;
+}
+
+async function handleData(event) {
+  const { cached, refresh } = await staleWhileRevalidate(DATA_CACHE, event.request);
+  event.waitUntil(refresh);
+  return cached || refresh;
+}
+
+async function handleShell(event) {
+  const { cached, refresh } = await staleWhileRevalidate(SHELL_CACHE, event.request);
+  event.waitUntil(refresh);
+  return cached || refresh;
+}
+
+self.addEventListener("fetch", (event) => {
+  const url = new URL(event.request.url);
+  if (event.request.method !== "GET" || url.origin !== self.location.origin) {
+    return;
+  }
+  const path = scopePath(url);
+  if (path === "manifest.json") {
+    event.respondWith(handleManifest(event));
+  } else if (HASHED_DATA.test(path)) {
+    event.respondWith(handleHashed(event.request, (other) => HASHED_DATA.test(other)));
+  } else if (HASHED_TIMELINE.test(path)) {
+    const label = path.match(HASHED_TIMELINE)[1];
+    event.respondWith(handleHashed(event.request, (other) => other.match(HASHED_TIMELINE)?.[1] === label));
+  } else if (path === "data.json" || path === "search-index.json") {
+    event.respondWith(handleData(event));
+  } else if (SHELL.includes(path || "./") || OPTIONAL_SHELL.includes(path)) {
+    event.respondWith(handleShell(event));
+  }
+});
@@ -1,3 +1,6 @@
+import json
+
+from pipeline import analyze
 from pipeline.analyze import _pareto_frontier
 
 
@@ -22,3 +25,17 @@ def test_pareto_frontier_skips_missing_score_and_non_dominant_points():
     ]
     frontier = _pareto_frontier(points)
     assert [row["model"] for row in frontier] == ["cheap", "better"]
+
+
+def test_timeline_sorts_unpadded_release_dates_by_date(monkeypatch, tmp_path):
+    rows = [
+        {"canonical_name": "late", "release_date": "2024-10-01", "arc_score": 20.0},
+        {"canonical_name": "early", "release_date": "2024-9-01", "arc_score": 10.0},
+    ]
+    (tmp_path / "unified_models.json").write_text(json.dumps(rows), encoding="utf-8")
+    monkeypatch.setattr(analyze, "PROCESSED_DIR", tmp_path)
+    monkeypatch.setattr(analyze, "load_milestones", lambda: [])
+
+    twin = analyze.build_analysis_payload()["twin_rivers"]
+    assert [p["model"] for p in twin["points"]] == ["early", "late"]
+    assert [s["model"] for s in twin["trend"]["arc"]["frontier"]] == ["early", "late"]
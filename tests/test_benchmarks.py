@@ -0,0 +1,33 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_benchmarks():
+    sys.path.insert(0, str(ROOT / "benchmarks"))
+    try:
+        spec = importlib.util.spec_from_file_location("run_benchmarks", ROOT / "benchmarks" / "run_benchmarks.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        sys.path.remove(str(ROOT / "benchmarks"))
+
+
+def _snapshot(*dirs):
+    return {
+        path: (path.stat().st_size, path.stat().st_mtime_ns)
+        for directory in dirs
+        for path in directory.rglob("*")
+        if path.is_file()
+    }
+
+
+def test_benchmark_run_leaves_repo_outputs_untouched():
+    outputs = (ROOT / "site", ROOT / "data", ROOT / "assets")
+    before = _snapshot(*outputs)
+    run = _load_benchmarks().bench_scale(rows=600, datasets=2, repeat=1)
+    assert run["stages"]["export_site_data"]["wall_seconds"] > 0
+    assert _snapshot(*outputs) == before
@@ -0,0 +1,50 @@
+from pipeline import chart_theme, charts
+
+DATA = {
+    "efficiency_map": {
+        "points": [
+            {"model": "Alpha <x>", "score": 40.0, "cost_per_task": 1.5},
+            {"model": "Beta", "score": 20.0, "cost_per_task": 0.2},
+        ],
+        "pareto_frontier": [
+            {"model": "Beta", "score": 20.0, "cost_per_task": 0.2},
+            {"model": "Alpha <x>", "score": 40.0, "cost_per_task": 1.5},
+        ],
+    },
+}
+
+
+def test_themes_only_change_colours_and_fonts():
+    template = chart_theme.compile_template(charts._efficiency(DATA, charts.FRAMES["desktop"]))
+    light = chart_theme.render(template, chart_theme.LIGHT)
+    dark = chart_theme.render(template, chart_theme.DARK)
+
+    assert "\x00" not in light
+    assert chart_theme.LIGHT.arc in light and chart_theme.DARK.arc not in light
+    assert chart_theme.DARK.background in dark
+    assert "Alpha &lt;x&gt;" in dark
+    assert light.count("<circle") == dark.count("<circle")
+
+
+def test_model_names_cannot_inject_slots():
+    data = {"efficiency_map": {"points": [{"model": "a\x00text\x00b", "score": 1.0, "cost_per_task": 1.0}]}}
+    svg = charts._efficiency(data, charts.FRAMES["desktop"])
+    assert "atextb" in chart_theme.render(chart_theme.compile_template(svg), chart_theme.LIGHT)
+
+
+def test_variant_names():
+    assert charts.variant_name("twin-rivers", "desktop", "light") == "twin-rivers.svg"
+    assert charts.variant_name("twin-rivers", "desktop", "dark") == "twin-rivers.dark.svg"
+    assert charts.variant_name("twin-rivers", "mobile", "dark") == "twin-rivers.mobile.dark.svg"
+
+
+def test_generate_writes_every_variant(tmp_path, monkeypatch):
+    monkeypatch.setattr(charts, "_load", lambda: DATA)
+    monkeypatch.setattr(charts, "OUT_DIR", tmp_path)
+    charts.generate()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "efficiency-map.dark.svg",
+        "efficiency-map.mobile.dark.svg",
+        "efficiency-map.mobile.svg",
+        "efficiency-map.svg",
+    ]
@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+CLI = Path(__file__).resolve().parents[1] / "tools" / "atlas_cli.py"
+
+
+def test_scan_stays_off_network_stack(tmp_path):
+    (tmp_path / "a.txt").write_text("x", encoding="utf-8")
+    result = subprocess.run(
+        [sys.executable, str(CLI), "--profile-startup", "scan", "--path", str(tmp_path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    report = json.loads(result.stderr)
+    assert report["stage_imports"] == []
+    assert report["network_stack_loaded"] == []
+    assert json.loads(result.stdout)["file_count"] == 1
+
+
+def test_scan_honours_gitignore_and_skips_git_dir(tmp_path):
+    (tmp_path / ".gitignore").write_text("build/\n*.log\n!keep.log\n", encoding="utf-8")
+    for rel in (".git/HEAD", "build/out.js", "src/app.py", "src/debug.log", "src/keep.log", "src/.gitignore"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("data", encoding="utf-8")
+    (tmp_path / "src" / ".gitignore").write_text("/app.py\n", encoding="utf-8")
+
+    result = subprocess.run(
+        [sys.executable, str(CLI), "scan", "--path", str(tmp_path), "--jobs", "2"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    report = json.loads(result.stdout)
+    assert sorted(report["sample"]) == [".gitignore", "src/.gitignore", "src/keep.log"]
+    assert report["total_bytes"] == sum((tmp_path / p).stat().st_size for p in report["sample"])
+
+
+
+def test_parallel_scan_skips_unreadable_top_level_entries(tmp_path):
+    (tmp_path / "a.txt").write_text("data", encoding="utf-8")
+    (tmp_path / "loop").symlink_to("loop")
+    (tmp_path / "dangling").symlink_to("missing")
+
+    result = subprocess.run(
+        [sys.executable, str(CLI), "scan", "--path", str(tmp_path), "--jobs", "2"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(result.stdout)["sample"] == ["a.txt"]
+
+def test_pipeline_graph_imports_stage_modules_lazily():
+    code = (
+        "import sys; from pipeline import run_pipeline; "
+        "graph = run_pipeline.build_graph().subgraph(['site_data'], upstream=False); "
+        "print([m for s in graph.stages.values() for m in s.modules]); "
+        "print(sorted(m for m in ('pipeline.export', 'pipeline.charts', 'pipeline.pages', 'pipeline.ingest') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=CLI.parents[1], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.splitlines() == ["['export']", "[]"]
@@ -0,0 +1,25 @@
+import pytest
+
+from pipeline import codec
+
+
+@pytest.fixture(params=codec.BACKENDS)
+def backend(request):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    codec.set_backend(request.param)
+    yield request.param
+    codec.set_backend()
+
+
+def test_roundtrip_pretty_and_compact(backend, tmp_path):
+    payload = {"model": "Gemini 3.1 Pro", "scores": [45.9, None], "note": "naïve"}
+    path = codec.write_json(tmp_path / "out.json", payload, pretty=False)
+    assert codec.read_json(path) == payload
+    assert b"\n" not in path.read_bytes()
+    assert codec.dumps(payload).startswith('{\n  "model"')
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        codec.set_backend("simdjson")
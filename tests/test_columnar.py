@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from pipeline import columnar, transform  # noqa: E402
+
+
+def test_columnar_export_writes_typed_dictionary_encoded_tables(monkeypatch, tmp_path):
+    sources, processed = tmp_path / "sources", tmp_path / "processed"
+    sources.mkdir()
+    processed.mkdir()
+    (sources / "arc_evaluations.json").write_text(
+        json.dumps(
+            [
+                {"datasetId": "v2", "modelId": "m1", "score": 0.5, "costPerTask": 2.0},
+                {"datasetId": "v1", "modelId": "m1", "score": 0.25, "costPerTask": 1.0, "display": False},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (sources / "arc_models.json").write_text(
+        json.dumps([{"id": "m1", "displayName": "Model One", "providerId": "Acme"}]), encoding="utf-8"
+    )
+    unified = [{"model_key": "model-one", "canonical_name": "Model One", "provider": "Acme",
+                "release_date": "2025-01-02", "arc_score": 50.0, "arc_tasks_evaluated": 3}]
+    (processed / "unified_models.json").write_text(json.dumps(unified), encoding="utf-8")
+    analysis = {"efficiency_map": {"points": [{"model": "Model One", "provider": "Acme", "score": 50.0,
+                                              "cost_per_task": 2.0}]}}
+    (processed / "analysis.json").write_text(json.dumps(analysis), encoding="utf-8")
+    cube = {"cells": [{"provider": "acme", "month": "2025-01", "benchmark": "arc", "count": 1, "sum": 50.0,
+                       "best": 50.0, "median": 50.0, "best_model": "Model One", "histogram": [0, 1]}]}
+    (processed / "cube.json").write_text(json.dumps(cube), encoding="utf-8")
+    monkeypatch.setattr(transform, "SOURCES_DIR", sources)
+    monkeypatch.setattr(transform, "_load_aliases", lambda: {})
+    monkeypatch.setattr(columnar, "PROCESSED_DIR", processed)
+    monkeypatch.setattr(columnar, "COLUMNAR_DIR", processed / "columnar")
+
+    paths = columnar.export_columnar()
+    tables = {p.stem: pa.ipc.open_file(pa.memory_map(str(p))).read_all() for p in paths}
+
+    models = tables["unified_models"]
+    assert pa.types.is_dictionary(models.schema.field("model_key").type)
+    assert models.schema.field("release_date").type == pa.date32()
+    assert models.column("arc_tasks_evaluated").to_pylist() == [3]
+    results = tables["arc_results"].to_pylist()
+    assert [(r["dataset_id"], r["model_key"], r["score"], r["display"]) for r in results] == [
+        ("v1", "model-one", 25.0, False),
+        ("v2", "model-one", 50.0, True),
+    ]
+    assert tables["efficiency_map"].num_rows == 1
+    assert tables["transfer_gap"].num_rows == 0
+    assert tables["cube_cells"].column("histogram").to_pylist() == [[0, 1]]
+    assert "hle_subject_cells" not in tables
+
+    subjects = {"subjects": [{"subject": "Math", "questions": 2, "accuracy": 50.0}],
+                "models": [{"model": "Model One", "model_key": "model-one", "in_unified": True, "questions": 2}],
+                "cells": [{"subject": "Math", "model_key": "model-one", "questions": 2, "accuracy": 50.0,
+                           "bins": [[1, 1, 0.9]]}]}
+    (processed / "hle_subjects.json").write_text(json.dumps(subjects), encoding="utf-8")
+    paths = columnar.export_columnar()
+    cells = pa.ipc.open_file(pa.memory_map(str(processed / "columnar" / "hle_subject_cells.arrow"))).read_all()
+    assert cells.to_pylist() == [{"subject": "Math", "model_key": "model-one", "questions": 2, "accuracy": 50.0,
+                                  "mean_confidence": None, "calibration_error": None}]
+    assert {p.stem for p in paths} >= {"hle_subjects", "hle_subject_models", "hle_subject_cells"}
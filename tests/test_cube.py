@@ -0,0 +1,81 @@
+import pytest
+
+from pipeline import cube
+
+
+def _row(name, provider, release, arc=None, cost=None, hle=None):
+    return {
+        "canonical_name": name,
+        "provider": provider,
+        "release_date": release,
+        "arc_score": arc,
+        "arc_cost_per_task": cost,
+        "hle_score": hle,
+    }
+
+
+ROWS = [
+    _row("A", "OpenAI", "2024-01-10", arc=10.0, cost=1.0, hle=20.0),
+    _row("B", "openai", "2024-01-20", arc=30.0, cost=10.0),
+    _row("C", "OpenAI", "2024-02-05", arc=50.0, cost=2.0),
+    _row("D", "Google", "2024-04-01", arc=40.0, cost=4.0, hle=35.0),
+    _row("E", "Google", None, arc=99.0),
+]
+
+
+def test_cells_group_by_provider_month_benchmark():
+    built = cube.build_cube(ROWS)
+    assert built["undated_models"] == 1
+    assert built["providers"] == {"openai": "OpenAI", "google": "Google"}
+    cells = {(c["provider"], c["month"], c["benchmark"]): c for c in built["cells"]}
+    jan = cells[("openai", "2024-01", "arc")]
+    assert (jan["count"], jan["best"], jan["best_model"], jan["median"]) == (2, 30.0, "B", 20.0)
+    assert (jan["best_efficiency"], jan["best_efficiency_model"]) == (10.0, "A")
+    assert sum(jan["histogram"]) == 2
+    assert cells[("openai", "2024-01", "hle")]["best_efficiency"] is None
+    assert len(cells) == 5
+
+
+def test_rollups_come_from_cells_alone():
+    built = cube.build_cube(ROWS)
+    overall = {c["benchmark"]: c for c in cube.rollup(built, by=("benchmark",))}
+    assert overall["arc"]["count"] == 4
+    assert overall["arc"]["best_model"] == "C"
+    assert overall["arc"]["best_efficiency_model"] == "C"
+    assert overall["arc"]["sum"] == 130.0
+    assert 30.0 <= overall["arc"]["median"] <= 40.0
+
+    quarters = cube.rollup(built, by=("provider", "month", "benchmark"), period="quarter")
+    q1 = next(c for c in quarters if c["provider"] == "openai" and c["benchmark"] == "arc")
+    assert (q1["month"], q1["count"], q1["best"]) == ("2024-Q1", 3, 50.0)
+    # A single cell keeps its exact median.
+    q2 = next(c for c in quarters if c["provider"] == "google" and c["benchmark"] == "arc")
+    assert (q2["month"], q2["median"]) == ("2024-Q2", 40.0)
+
+    only_google = cube.rollup(built, where=lambda c: c["provider"] == "google")
+    assert [c["count"] for c in only_google] == [1, 1]
+    with pytest.raises(ValueError):
+        cube.rollup(built, by=("model",))
+
+
+
+def test_rollup_breaks_ties_like_build_cube():
+    rows = [
+        _row("Zeta", "OpenAI", "2024-01-10", arc=40.0, cost=4.0),
+        _row("Alpha", "Google", "2024-01-10", arc=40.0, cost=4.0),
+    ]
+    built = cube.build_cube(rows)
+    together = cube.build_cube([{**r, "provider": "OpenAI"} for r in rows])["cells"][0]
+    (merged,) = cube.rollup(built, by=("benchmark",))
+    assert merged["best_model"] == together["best_model"] == "Zeta"
+    assert merged["best_efficiency_model"] == together["best_efficiency_model"] == "Zeta"
+
+    # Cell order must not matter.
+    built["cells"].reverse()
+    assert cube.rollup(built, by=("benchmark",))[0]["best_model"] == "Zeta"
+
+def test_histogram_median_interpolates():
+    histogram = [0] * cube.HISTOGRAM_BINS
+    histogram[2] = 2  # two scores in [10, 15)
+    assert cube.histogram_median(histogram) == 12.5
+    assert cube.histogram_median([0] * cube.HISTOGRAM_BINS) is None
@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from pipeline.dag import Graph, Stage
+
+
+def _stage(name, inputs=(), outputs=(), log=None, wait=None, release=None):
+    def run(values):
+        if log is not None:
+            log.append((name, dict(values)))
+        if release is not None:
+            release.set()
+        if wait is not None:
+            assert wait.wait(5), f"{name} never overlapped"
+        return {artifact: f"{name}:{artifact}" for artifact in outputs}
+
+    return Stage(name, run, inputs=tuple(inputs), outputs=tuple(outputs))
+
+
+def test_stages_get_their_producers_outputs_in_dependency_order():
+    log = []
+    graph = Graph(
+        [
+            _stage("report", ["table", "chart"], ["site"], log),
+            _stage("load", [], ["rows"], log),
+            _stage("table", ["rows"], ["table"], log),
+            _stage("chart", ["rows", "external.json"], ["chart"], log),
+        ]
+    )
+    assert graph.deps["report"] == ["chart", "table"]
+    result = graph.run(workers=1)
+    assert [name for name, _ in log] == ["load", "table", "chart", "report"]
+    assert log[2][1] == {"rows": "load:rows"}
+    assert result.artifacts["site"] == "report:site"
+    assert result.critical_path()[0] == "load" and result.critical_path()[-1] == "report"
+
+    with pytest.raises(ValueError, match="cycle"):
+        Graph([_stage("a", ["y"], ["x"]), _stage("b", ["x"], ["y"])])
+
+
+def test_independent_stages_overlap_in_the_pool():
+    left_started, right_started = threading.Event(), threading.Event()
+    graph = Graph(
+        [
+            _stage("left", outputs=["l"], release=left_started, wait=right_started),
+            _stage("right", outputs=["r"], release=right_started, wait=left_started),
+            _stage("join", ["l", "r"], ["out"]),
+        ]
+    )
+    result = graph.run(workers=2)
+    assert result.artifacts["out"] == "join:out"
+    assert set(result.deps["join"]) == {"left", "right"}
+    assert max(result.timings["left"][0], result.timings["right"][0]) < min(result.timings["left"][1], result.timings["right"][1])
+
+
+def test_subgraph_takes_what_a_target_needs():
+    graph = Graph(
+        [
+            _stage("fetch", [], ["raw"]),
+            _stage("analyze", ["raw"], ["analysis"]),
+            _stage("export", ["analysis"], ["site"]),
+            _stage("charts", ["analysis"], ["svg"]),
+        ]
+    )
+    assert list(graph.subgraph(["analysis"]).stages) == ["fetch", "analyze"]
+    only = graph.subgraph(["site"], upstream=False)
+    assert list(only.stages) == ["export"] and only.deps["export"] == []
+    assert only.run().artifacts == {"site": "export:site"}
+    with pytest.raises(KeyError):
+        graph.subgraph(["nope"])
+
+
+def test_exclusive_stages_run_alone_on_the_main_thread():
+    seen = {}
+    active = []
+
+    def run_as(name, outputs):
+        def run(_):
+            active.append(name)
+            seen[name] = (threading.current_thread() is threading.main_thread(), list(active))
+            active.remove(name)
+            return {artifact: name for artifact in outputs}
+
+        return run
+
+    graph = Graph(
+        [
+            Stage("a", run_as("a", ["x"]), outputs=("x",)),
+            Stage("b", run_as("b", ["y"]), outputs=("y",)),
+            Stage("pool", run_as("pool", ["z"]), inputs=("x",), outputs=("z",), exclusive=True),
+            Stage("c", run_as("c", ["w"]), inputs=("x",), outputs=("w",)),
+        ]
+    )
+    graph.run(workers=4)
+    assert seen["pool"] == (True, ["pool"])
+    assert not seen["c"][0]
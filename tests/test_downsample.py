@@ -0,0 +1,79 @@
+from datetime import date, timedelta
+
+from pipeline import downsample
+
+
+def test_lttb_keeps_endpoints_and_spikes():
+    xs = list(range(100))
+    ys = [0.0] * 100
+    ys[37] = 50.0
+    kept = downsample.lttb(xs, ys, 10)
+    assert len(kept) == 10
+    assert kept[0] == 0 and kept[-1] == 99
+    assert 37 in kept
+    assert kept == sorted(kept)
+    assert downsample.lttb(xs, ys, 200) == xs
+
+
+def test_downsample_always_keeps_forced_indices():
+    xs = list(range(50))
+    ys = [float(x % 7) for x in xs]
+    kept = downsample.downsample(xs, ys, 10, keep=[3, 44])
+    assert {3, 44} <= set(kept)
+    assert len(kept) <= 10
+    # More forced points than the budget: the first ones win.
+    assert downsample.downsample(xs, ys, 4, keep=[9, 8, 7, 6, 5]) == [6, 7, 8, 9]
+
+
+def test_timeline_resolutions_keep_labelled_models_and_pick_by_width():
+    start = date(2023, 1, 1)
+    points = [
+        {
+            "model": f"m{i}",
+            "release_date": (start + timedelta(days=i)).isoformat(),
+            "arc_score": float(i % 13),
+            "hle_score": None,
+        }
+        for i in range(400)
+    ]
+    points[200]["arc_score"] = 90.0  # top score: labelled
+    trend = {"arc": {"frontier": [{"model": "m0", "release_date": "2023-01-01", "score": 0.0}]}, "hle": {}}
+    milestones = [{"surpassed_by": "m5"}]
+
+    resolutions = downsample.timeline_resolutions(points, trend, milestones)
+    assert [r["size"] for r in resolutions] == [100, 250]
+    small = resolutions[0]
+    assert {0, 5, 200} <= set(small["arc"])
+    assert len(small["arc"]) <= 100
+    assert small["dropped"] == {"arc": 0, "hle": 0}
+    assert small["hle"] == []
+    assert small["frontier"]["arc"] == [0]
+
+    assert downsample.pick_resolution(resolutions, 150)["size"] == 100
+    assert downsample.pick_resolution(resolutions, 400)["size"] == 250
+    assert downsample.pick_resolution(resolutions, 900) is None
+
+
+def test_timeline_resolutions_stay_within_budget_when_every_point_is_forced():
+    start = date(2023, 1, 1)
+    points = [
+        {
+            "model": f"m{i}",
+            "release_date": (start + timedelta(days=i)).isoformat(),
+            "arc_score": i / 4,
+            "hle_score": None,
+        }
+        for i in range(400)
+    ]
+    # A rising series: every model is on the running-best frontier.
+    frontier = [{"model": p["model"], "release_date": p["release_date"], "score": p["arc_score"]} for p in points]
+    trend = {"arc": {"frontier": frontier}, "hle": {}}
+
+    for entry in downsample.timeline_resolutions(points, trend, []):
+        assert len(entry["arc"]) == entry["size"]
+        assert len(entry["frontier"]["arc"]) <= entry["size"]
+        assert entry["dropped"]["arc"] == 400 - entry["size"]
+        assert 399 in entry["arc"]  # highest score, labelled
+        series = downsample.resolution_series({"points": points, "trend": trend}, entry)
+        assert len(series["points"]) <= entry["size"]
+        assert len(series["frontier"]["arc"]) <= entry["size"]
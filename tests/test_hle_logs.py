@@ -0,0 +1,100 @@
+import gzip
+import json
+
+from pipeline import hle_logs, transform
+
+
+def _write(path, rows, compress=False):
+    text = "\n".join(r if isinstance(r, str) else json.dumps(r) for r in rows) + "\n"
+    if compress:
+        with gzip.open(path, "wt", encoding="utf-8") as handle:
+            handle.write(text)
+    else:
+        path.write_text(text, encoding="utf-8")
+
+
+def test_stats_give_accuracy_and_binned_calibration():
+    stats = hle_logs.SubjectStats()
+    for _ in range(4):
+        stats.add(True, 0.95)  # bin 9: accuracy 1.0, confidence 0.95
+    for correct in (True, False, False, False):
+        stats.add(correct, 0.05)  # bin 0: accuracy 0.25, confidence 0.05
+    stats.add(False, None)
+    summary = stats.summary()
+    assert summary["questions"] == 9
+    assert round(summary["accuracy"], 6) == round(500 / 9, 6)
+    assert round(summary["mean_confidence"], 6) == 50.0
+    assert round(summary["calibration_error"], 6) == round(100 * ((0.05**2 + 0.2**2) / 2) ** 0.5, 6)
+
+    merged = hle_logs.SubjectStats()
+    merged.merge(stats)
+    merged.merge(stats)
+    assert merged.questions == 18 and merged.summary()["calibration_error"] == summary["calibration_error"]
+
+
+def test_logs_stream_into_a_matrix_joined_through_aliases(tmp_path, monkeypatch):
+    logs = tmp_path / "logs"
+    (logs / "run2").mkdir(parents=True)
+    _write(
+        logs / "a.jsonl",
+        [
+            {"model": "gpt-4o-2024-08-06", "subject": "Math", "correct": "yes", "confidence": "90%"},
+            {"model": "gpt-4o-2024-08-06", "subject": "Math", "correct": "no", "confidence": 80},
+            "{not json",
+            {"model": "mystery-model", "subject": "Biology", "correct": True, "confidence": 0.5},
+        ],
+    )
+    _write(
+        logs / "run2" / "b.jsonl.gz",
+        [{"model_id": "GPT-4o", "category": "Math", "is_correct": 1, "confidence": 1.0}, {"subject": "Math"}],
+        compress=True,
+    )
+    aliases = tmp_path / "aliases.json"
+    aliases.write_text(json.dumps({"gpt-4o": "GPT-4o"}), encoding="utf-8")
+    monkeypatch.setattr(transform, "ALIASES_PATH", aliases)
+
+    files = hle_logs.log_files(logs)
+    assert [p.name for p in files] == ["a.jsonl", "b.jsonl.gz"]
+    cells, counts = hle_logs.aggregate_logs(files, workers=1)
+    assert counts == {"files": 2, "lines": 4, "skipped_lines": 2, "damaged_files": 0}
+
+    matrix = hle_logs.build_matrix(cells, [{"model_key": "gpt-4o", "canonical_name": "GPT-4o"}])
+    math_cell = next(c for c in matrix["cells"] if c["subject"] == "Math")
+    assert math_cell["model_key"] == "gpt-4o" and math_cell["questions"] == 3
+    assert round(math_cell["accuracy"], 6) == round(200 / 3, 6)
+    gpt = next(m for m in matrix["models"] if m["model_key"] == "gpt-4o")
+    assert gpt["in_unified"] and sorted(gpt["log_ids"]) == ["GPT-4o", "gpt-4o-2024-08-06"]
+    assert matrix["unmatched"] == ["mystery-model"]
+    assert [s["subject"] for s in matrix["subjects"]] == ["Biology", "Math"]
+
+
+def test_parallel_aggregation_matches_serial(tmp_path, monkeypatch):
+    for i in range(3):
+        rows = [
+            {"model": f"m{j % 2}", "subject": f"s{j % 3}", "correct": j % (i + 2) == 0, "confidence": (j * 7 % 100)}
+            for j in range(200)
+        ]
+        _write(tmp_path / f"{i}.jsonl", rows)
+    files = hle_logs.log_files(tmp_path)
+    serial, _ = hle_logs.aggregate_logs(files, workers=1)
+    monkeypatch.setattr(hle_logs, "PARALLEL_MIN_BYTES", 0)
+    parallel, counts = hle_logs.aggregate_logs(files, workers=2)
+    assert counts["lines"] == 600
+    assert {k: v.summary() for k, v in parallel.items()} == {k: v.summary() for k, v in serial.items()}
+
+
+def test_undecodable_lines_are_skipped_and_truncated_files_keep_what_was_read(tmp_path):
+    good = json.dumps({"model": "m", "subject": "Math", "correct": True}).encode()
+    (tmp_path / "a.jsonl").write_bytes(good + b"\n\xff\xfe\n" + good + b"\n")
+    packed = gzip.compress(b"\n".join([good] * 50) + b"\n")
+    (tmp_path / "b.jsonl.gz").write_bytes(packed[: len(packed) - 12])
+
+    hle_logs.codec.set_backend("stdlib")
+    try:
+        cells, counts = hle_logs.aggregate_logs(hle_logs.log_files(tmp_path), workers=1)
+    finally:
+        hle_logs.codec.set_backend()
+    assert counts["skipped_lines"] == 1
+    assert counts["damaged_files"] == 1
+    assert 2 < counts["lines"] <= 52
+    assert cells[("Math", "m")].questions == counts["lines"]
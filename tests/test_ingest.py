@@ -1,6 +1,108 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pipeline import ingest
 from pipeline.config import SOURCES
+from pipeline.profiling import recording
 
 
 def test_sources_present():
     assert "arc_evaluations" in SOURCES
     assert "hle_models" in SOURCES
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        self.server.targets.append(self.path)
+        if self.path == "/moved":
+            self.send_response(301)
+            self.send_header("Location", "/b.json")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"path": self.path, "rows": list(range(500))}).encode()
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.sent_bytes += len(body)
+        # Simulate a server dropping idle keep-alive connections without notice.
+        self.close_connection = self.server.drop_idle
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+    httpd.connections = 0
+    httpd.sent_bytes = 0
+    httpd.drop_idle = False
+    httpd.targets = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fetch_all_reuses_one_connection_and_decodes_gzip(server, monkeypatch, tmp_path):
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    sources = {"a": f"{base}/a.json", "b": f"{base}/moved", "c": f"{base}/c.json?x=1"}
+    monkeypatch.setattr(ingest, "SOURCES", sources)
+    monkeypatch.setattr(ingest, "SOURCES_DIR", tmp_path)
+
+    with recording(trace_memory=False) as recorder:
+        ingest.fetch_all(retries=0)
+
+    assert server.connections == 1
+    assert json.loads((tmp_path / "b.json").read_text(encoding="utf-8"))["path"] == "/b.json"
+    assert json.loads((tmp_path / "c.json").read_text(encoding="utf-8"))["rows"][-1] == 499
+
+    attrs = {node.name: node.attrs for node in recorder.roots}
+    assert [attrs[f"fetch.{name}"]["reused_connection"] for name in sources] == [False, True, True]
+    assert {a["encoding"] for a in attrs.values()} == {"gzip"}
+    assert sum(a["wire_bytes"] for a in attrs.values()) == server.sent_bytes
+    assert all(a["body_bytes"] > a["wire_bytes"] for a in attrs.values())
+
+
+def test_dropped_keep_alive_connection_is_reopened(server, monkeypatch, tmp_path):
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    server.drop_idle = True
+    monkeypatch.setattr(ingest, "SOURCES", {"a": f"{base}/a.json", "b": f"{base}/b.json"})
+    monkeypatch.setattr(ingest, "SOURCES_DIR", tmp_path)
+
+    ingest.fetch_all(retries=0)
+
+    assert server.connections == 2
+    assert json.loads((tmp_path / "b.json").read_text(encoding="utf-8"))["path"] == "/b.json"
+
+
+def test_plain_http_goes_through_the_configured_proxy(server, monkeypatch, tmp_path):
+    monkeypatch.setenv("http_proxy", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.delenv("no_proxy", raising=False)
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    monkeypatch.setattr(ingest, "SOURCES", {"a": "http://upstream.invalid/a.json"})
+    monkeypatch.setattr(ingest, "SOURCES_DIR", tmp_path)
+
+    ingest.fetch_all(retries=0)
+
+    assert server.targets == ["http://upstream.invalid/a.json"]
+    assert (tmp_path / "a.json").exists()
@@ -0,0 +1,54 @@
+from pipeline import milestones
+
+
+def test_parse_milestones_yaml_subset():
+    text = """# comment
+milestones:
+  - date: "2023-01-01"
+    benchmark: "ARC-AGI"
+    score: 5
+    note: "Baseline # not a comment"
+  - date: '2025-01-01'
+    benchmark: HLE  # trailing comment
+    score: 10.5
+"""
+    items = milestones.parse_milestones(text)
+    assert items == [
+        {"date": "2023-01-01", "benchmark": "ARC-AGI", "score": 5, "note": "Baseline # not a comment"},
+        {"date": "2025-01-01", "benchmark": "HLE", "score": 10.5},
+    ]
+
+
+def test_align_milestones_time_to_surpass_and_margin():
+    trend = {
+        "arc": {
+            "frontier": [
+                {"model": "A", "release_date": "2023-06-01", "score": 3.0},
+                {"model": "B", "release_date": "2024-01-01", "score": 6.0},
+                {"model": "C", "release_date": "2024-06-01", "score": 20.0},
+            ]
+        }
+    }
+    aligned = milestones.align_milestones(
+        [
+            {"date": "2023-12-01", "benchmark": "ARC-AGI", "score": 5},
+            {"date": "2024-02-01", "benchmark": "ARC-AGI", "score": 50},
+        ],
+        trend,
+    )
+    first, second = aligned
+    assert first["best_at_date"] == 3.0
+    assert first["surpassed_by"] == "B"
+    assert first["days_to_surpass"] == 31
+    assert first["already_surpassed"] is False
+    assert first["margin"] == 15.0
+    assert second["surpassed_by"] is None
+    assert second["margin"] == -30.0
+
+
+def test_align_milestones_flags_goals_beaten_before_their_date():
+    trend = {"arc": {"frontier": [{"model": "A", "release_date": "2023-06-01", "score": 10.0}]}}
+    (aligned,) = milestones.align_milestones([{"date": "2024-01-01", "benchmark": "ARC", "score": 5}], trend)
+    assert aligned["surpassed_by"] == "A"
+    assert aligned["days_to_surpass"] == 0
+    assert aligned["already_surpassed"] is True
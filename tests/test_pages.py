@@ -0,0 +1,57 @@
+from pipeline import pages
+
+
+def _unified(score=40.0):
+    return [
+        {"model_key": "alpha", "canonical_name": "Alpha <1>", "provider": "OpenAI", "arc_score": score, "hle_score": 20.0},
+        {"model_key": "beta", "canonical_name": "Beta", "provider": "openai", "arc_score": 10.0, "hle_score": None},
+        {"model_key": "gamma", "canonical_name": "Gamma", "provider": None, "arc_score": None, "hle_score": 5.0},
+    ]
+
+
+def _analysis():
+    return {"efficiency_map": {"points": [{"model": "Alpha <1>", "score_ci": [30.0, 50.0], "pareto_probability": 0.5}]}}
+
+
+def _build(monkeypatch, tmp_path, unified, workers=1):
+    monkeypatch.setattr(pages, "SITE_PAGES_DIR", tmp_path / "pages")
+    monkeypatch.setattr(pages, "PAGES_MANIFEST_PATH", tmp_path / "pages_manifest.json")
+    evaluations = [{"model_key": "alpha", "dataset_id": "v2", "score": 40.0, "cost_per_task": 1.5, "display": True}]
+    return pages.build_pages(pages.build_contexts(unified, _analysis(), evaluations), workers=workers)
+
+
+def test_pages_group_providers_and_escape_names(monkeypatch, tmp_path):
+    stats = _build(monkeypatch, tmp_path, _unified())
+    assert stats == {"pages": 6, "rendered": 6, "removed": 0}
+
+    html = (tmp_path / "pages" / "models" / "alpha.html").read_text(encoding="utf-8")
+    assert "Alpha &lt;1&gt;" in html
+    assert "[30.0–50.0]" in html
+    assert 'href="../providers/openai.html"' in html
+    provider = (tmp_path / "pages" / "providers" / "openai.html").read_text(encoding="utf-8")
+    assert "models/alpha.html" in provider and "models/beta.html" in provider
+    assert (tmp_path / "pages" / "providers" / "unknown.json").exists()
+
+
+def test_rebuild_renders_only_changed_pages(monkeypatch, tmp_path):
+    _build(monkeypatch, tmp_path, _unified())
+    assert _build(monkeypatch, tmp_path, _unified())["rendered"] == 0
+
+    (tmp_path / "pages" / "models" / "beta.html").unlink()
+    assert _build(monkeypatch, tmp_path, _unified())["rendered"] == 1
+
+    # Alpha's score feeds its own page and its provider's list only.
+    assert _build(monkeypatch, tmp_path, _unified(score=41.0))["rendered"] == 2
+
+    stats = _build(monkeypatch, tmp_path, _unified()[:2])
+    assert stats["removed"] == 2
+    assert not (tmp_path / "pages" / "models" / "gamma.html").exists()
+
+
+def test_parallel_render_matches_serial(monkeypatch, tmp_path):
+    monkeypatch.setattr(pages, "PARALLEL_MIN_PAGES", 1)
+    _build(monkeypatch, tmp_path / "parallel", _unified(), workers=2)
+    _build(monkeypatch, tmp_path / "serial", _unified(), workers=1)
+    for path in sorted((tmp_path / "serial" / "pages").rglob("*.*")):
+        twin = tmp_path / "parallel" / "pages" / path.relative_to(tmp_path / "serial" / "pages")
+        assert twin.read_bytes() == path.read_bytes()
@@ -0,0 +1,49 @@
+import json
+import threading
+import time
+
+from pipeline import profiling
+
+
+def test_spans_are_noops_without_recording():
+    with profiling.span("idle") as step:
+        step.rows_out = 3
+    assert profiling.timed("helper", len) is len
+
+
+def test_recording_writes_nested_report_with_rows_and_memory(tmp_path):
+    report_path = tmp_path / "run_report.json"
+    with profiling.recording(report_path=report_path):
+        with profiling.span("stage", rows_in=2) as stage:
+            counted = profiling.timed("helper", lambda x: x * 2)
+            with profiling.span("alloc") as step:
+                blob = [bytearray(1024) for _ in range(256)]
+                step.rows_out = len(blob)
+            stage.rows_out = sum(counted(i) for i in range(3))
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    stage_span = report["spans"][0]
+    helper, alloc = stage_span["children"]
+    assert stage_span["rows_in"] == 2 and stage_span["rows_out"] == 6
+    assert helper["name"] == "helper" and helper["calls"] == 3
+    assert alloc["rows_out"] == 256
+    assert alloc["peak_bytes"] >= 256 * 1024
+    assert stage_span["peak_bytes"] >= alloc["peak_bytes"]
+
+
+def test_concurrent_spans_report_thread_cpu_and_process_totals():
+    def idle(name):
+        with profiling.span(name):
+            time.sleep(0.2)
+
+    with profiling.recording() as recorder:
+        threads = [threading.Thread(target=idle, args=(f"stage{i}",)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    report = recorder.to_dict()
+    assert sorted(s["name"] for s in report["spans"]) == ["stage0", "stage1", "stage2"]
+    assert all(s["cpu_seconds"] < 0.1 for s in report["spans"])
+    assert report["process_wall_seconds"] < sum(s["wall_seconds"] for s in report["spans"])
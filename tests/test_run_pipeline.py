@@ -0,0 +1,57 @@
+import json
+
+from pipeline import run_pipeline, transform
+
+
+def test_only_unusable_sources_fall_back_to_bootstrap(monkeypatch, tmp_path):
+    sources = tmp_path / "sources"
+    bootstrap = tmp_path / "bootstrap"
+    sources.mkdir()
+    bootstrap.mkdir()
+
+    live_eval = [{"modelId": "live-model", "score": 0.3, "costPerTask": 1.0}]
+    (sources / "arc_evaluations.json").write_text(json.dumps(live_eval), encoding="utf-8")
+    (sources / "arc_models.json").write_text(json.dumps([{"id": "live-model"}]), encoding="utf-8")
+    (sources / "hle_models.json").write_text(json.dumps({"error": "rate limited"}), encoding="utf-8")
+    for name in transform.NORMALIZED_SOURCES:
+        (bootstrap / f"{name}.json").write_text(
+            json.dumps([{"name": "boot-model", "modelId": "boot-model", "id": "boot-model", "score": 12.0}]),
+            encoding="utf-8",
+        )
+
+    monkeypatch.setattr(transform, "SOURCES_DIR", sources)
+    monkeypatch.setattr(run_pipeline, "SOURCES_DIR", sources)
+    monkeypatch.setattr(run_pipeline, "BOOTSTRAP_DIR", bootstrap)
+
+    payloads = {name: run_pipeline._checked_payload(name) for name in transform.NORMALIZED_SOURCES}
+    assert payloads["arc_evaluations"] == live_eval
+    assert payloads["hle_models"][0]["name"] == "boot-model"
+    assert json.loads((sources / "hle_models.json").read_text(encoding="utf-8"))[0]["name"] == "boot-model"
+
+
+def test_missing_malformed_or_unexpected_sources_fall_back_to_bootstrap(monkeypatch, tmp_path):
+    sources = tmp_path / "sources"
+    bootstrap = tmp_path / "bootstrap"
+    sources.mkdir()
+    bootstrap.mkdir()
+    boot = [{"name": "boot-model", "modelId": "boot-model", "id": "boot-model", "score": 12.0}]
+    for name in transform.NORMALIZED_SOURCES:
+        (bootstrap / f"{name}.json").write_text(json.dumps(boot), encoding="utf-8")
+    # arc_evaluations is missing; arc_models is truncated JSON.
+    (sources / "arc_models.json").write_text('[{"id": ', encoding="utf-8")
+    (sources / "hle_models.json").write_text(json.dumps([{"name": "live"}]), encoding="utf-8")
+
+    real_count = transform.count_usable_records
+
+    def count(name, payload):
+        if payload == [{"name": "live"}]:
+            raise TypeError("unexpected row shape")
+        return real_count(name, payload)
+
+    monkeypatch.setattr(transform, "SOURCES_DIR", sources)
+    monkeypatch.setattr(run_pipeline, "SOURCES_DIR", sources)
+    monkeypatch.setattr(run_pipeline, "BOOTSTRAP_DIR", bootstrap)
+    monkeypatch.setattr(run_pipeline, "count_usable_records", count)
+
+    for name in transform.NORMALIZED_SOURCES:
+        assert run_pipeline._checked_payload(name) == boot
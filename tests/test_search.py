@@ -0,0 +1,56 @@
+import json
+
+from pipeline import profiling, run_pipeline, search
+
+
+def _decode(deltas):
+    ids, total = [], 0
+    for step in deltas:
+        total += step
+        ids.append(total)
+    return ids
+
+
+def test_normalize_folds_case_accents_and_punctuation():
+    assert search.normalize("  Claude-3.5_Sonnet (Café) ") == "claude 3 5 sonnet cafe"
+
+
+def test_index_covers_names_raw_ids_and_aliases():
+    unified = [
+        {"model_key": "gpt-4o", "canonical_name": "GPT-4o", "provider": "OpenAI"},
+        {"model_key": "claude-3-5-sonnet", "canonical_name": "Claude 3.5 Sonnet", "provider": "Anthropic"},
+    ]
+    aliases = {"gpt-4o-2024-08-06": "GPT-4o", "unknown-model": "Not In Catalogue"}
+    raw_ids = {"claude-3-5-sonnet": {"anthropic/claude-3.5-sonnet-20241022"}}
+    index = search.build_index(unified, aliases, raw_ids)
+
+    assert [m[0] for m in index["models"]] == ["Claude 3.5 Sonnet", "GPT-4o"]
+    assert index["terms"] == sorted(index["terms"])
+    terms = dict(zip(index["terms"], index["term_models"]))
+    assert terms["gpt 4o 2024 08 06"] == 1
+    assert terms["anthropic claude 3 5 sonnet 20241022"] == 0
+    assert not any("unknown" in term for term in index["terms"])
+
+    for gram, deltas in index["grams"].items():
+        ids = _decode(deltas)
+        assert ids == sorted(set(ids))
+        assert all(gram in f" {index['terms'][i]} " for i in ids)
+    sonnet = {index["terms"][i] for i in _decode(index["grams"]["son"])}
+    assert sonnet == {t for t in index["terms"] if "son" in t}
+
+
+def test_search_index_span_reports_size_and_build_time(monkeypatch, tmp_path):
+    (tmp_path / "unified_models.json").write_text(
+        json.dumps([{"model_key": "gpt-4o", "canonical_name": "GPT-4o", "provider": "OpenAI"}]), encoding="utf-8"
+    )
+    monkeypatch.setattr(search, "PROCESSED_DIR", tmp_path)
+    monkeypatch.setattr(search, "ALIASES_PATH", tmp_path / "aliases.json")
+    monkeypatch.setattr(search, "SITE_SEARCH_INDEX_PATH", tmp_path / "search-index.json")
+    monkeypatch.setattr(search, "arc_evaluation_rows", lambda: [])
+
+    with profiling.recording() as recorder:
+        run_pipeline._search_index({})
+    (span,) = recorder.roots
+    assert span.name == "search_index"
+    assert span.attrs["bytes"] == (tmp_path / "search-index.json").stat().st_size
+    assert 0 <= span.attrs["build_seconds"] <= span.wall_seconds
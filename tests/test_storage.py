@@ -0,0 +1,88 @@
+import json
+import os
+
+from pipeline import downsample, export, storage
+
+
+def test_write_if_changed_skips_identical_content(tmp_path):
+    path = tmp_path / "out" / "a.json"
+    assert storage.write_if_changed(path, b"{}")
+    os.utime(path, (1, 1))
+    assert not storage.write_if_changed(path, b"{}")
+    assert path.stat().st_mtime == 1
+    assert storage.write_if_changed(path, b"[]")
+    assert path.read_bytes() == b"[]"
+    assert [p.name for p in path.parent.iterdir()] == ["a.json"]
+
+
+def test_site_data_is_byte_stable_and_freshness_is_separate(monkeypatch, tmp_path):
+    (tmp_path / "analysis.json").write_text(json.dumps({"b": 1, "a": [2, 1]}), encoding="utf-8")
+    monkeypatch.setattr(export, "PROCESSED_DIR", tmp_path)
+    monkeypatch.setattr(export, "SITE_DATA_PATH", tmp_path / "site" / "data.json")
+    monkeypatch.setattr(export, "SITE_FRESHNESS_PATH", tmp_path / "site" / "freshness.json")
+    monkeypatch.setattr(export, "SITE_MANIFEST_PATH", tmp_path / "site" / "manifest.json")
+
+    first = export.export_site_data().read_bytes()
+    second = export.export_site_data().read_bytes()
+    assert first == second
+    assert b"generated_at" not in first
+    freshness = json.loads((tmp_path / "site" / "freshness.json").read_text(encoding="utf-8"))
+    assert freshness["data_sha256"] == storage.content_hash(first)
+    version = freshness["data_sha256"][:12]
+    manifest = json.loads((tmp_path / "site" / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest == {"data": f"data.{version}.json", "version": version}
+    assert (tmp_path / "site" / manifest["data"]).read_bytes() == first
+
+
+def test_old_hashed_data_files_are_pruned(monkeypatch, tmp_path):
+    site = tmp_path / "site"
+    site.mkdir()
+    monkeypatch.setattr(export, "SITE_DATA_PATH", site / "data.json")
+    old = [site / f"data.{i:012x}.json" for i in range(4)]
+    for age, path in enumerate(old):
+        path.write_text("{}", encoding="utf-8")
+        os.utime(path, (100 - age, 100 - age))
+    current = site / "data.ffffffffffff.json"
+    current.write_text("{}", encoding="utf-8")
+    os.utime(current, (1, 1))
+    (site / "data.notes.json").write_text("{}", encoding="utf-8")
+
+    removed = export.prune_data_versions(current, keep=3)
+    assert sorted(removed) == old[2:]
+    assert sorted(p.name for p in site.iterdir()) == sorted(
+        ["data.notes.json", current.name, old[0].name, old[1].name]
+    )
+
+
+def test_site_data_ships_the_smallest_timeline_resolution(monkeypatch, tmp_path):
+    points = [
+        {
+            "model": f"m{i}",
+            "release_date": f"2024-{1 + i // 28:02d}-{1 + i % 28:02d}",
+            "arc_score": float(i % 9),
+            "hle_score": 1.0,
+        }
+        for i in range(300)
+    ]
+    twin = {"points": points, "trend": {"arc": {"frontier": [], "band": []}, "hle": {"frontier": []}}}
+    twin["resolutions"] = downsample.timeline_resolutions(points, twin["trend"], [])
+    (tmp_path / "analysis.json").write_text(json.dumps({"twin_rivers": twin}), encoding="utf-8")
+    site = tmp_path / "site"
+    monkeypatch.setattr(export, "PROCESSED_DIR", tmp_path)
+    monkeypatch.setattr(export, "SITE_DATA_PATH", site / "data.json")
+    monkeypatch.setattr(export, "SITE_FRESHNESS_PATH", site / "freshness.json")
+    monkeypatch.setattr(export, "SITE_MANIFEST_PATH", site / "manifest.json")
+    monkeypatch.setattr(export, "SITE_TIMELINE_DIR", site / "timeline")
+
+    export.export_site_data()
+    shipped = json.loads((site / "data.json").read_text(encoding="utf-8"))["data"]["twin_rivers"]
+    index = shipped["resolutions"]
+    assert [entry["size"] for entry in index] == [100, 250, None]
+    assert len(shipped["points"]) == index[0]["points"] <= 2 * 100
+    assert shipped["trend"]["arc"]["band"] == []
+    full = json.loads((site / index[-1]["data"]).read_text(encoding="utf-8"))
+    assert full["points"] == points
+    for entry in index[:-1]:
+        series = json.loads((site / entry["data"]).read_text(encoding="utf-8"))
+        assert sum(p["arc_score"] is not None for p in series["points"]) <= entry["size"]
+        assert sum(p["hle_score"] is not None for p in series["points"]) <= entry["size"]
@@ -167,3 +167,96 @@ def test_pareto_frontier_with_realistic_shape_fields():
     ]
     frontier = _pareto_frontier(points)
     assert [row["model"] for row in frontier] == ["A", "C", "E"]
+
+
+def test_count_usable_records_uses_normalizer_fields():
+    arc_eval = [
+        {"modelId": "a", "score": 0.4},
+        {"modelId": "b", "score": 0.5, "display": False},
+        {"modelId": "c", "score": "n/a"},
+        {"datasetId": "v1", "score": 0.2},
+    ]
+    hle = {"data": [{"name": "x", "scores": {"hle_calibration_error": 12.0}}, {"name": "y", "scores": {}}]}
+    assert transform.count_usable_records("arc_evaluations", arc_eval) == 1
+    assert transform.count_usable_records("hle_models", hle) == 1
+    assert transform.count_usable_records("arc_models", {"unexpected": True}) == 0
+
+
+def test_parallel_normalization_matches_serial(monkeypatch):
+    import random
+
+    rng = random.Random(7)
+    arc_models = [
+        {"id": f"m{i}", "displayName": f"Model {i % 40}", "providerId": rng.choice(["OpenAI", "", None])}
+        for i in range(60)
+    ]
+    arc_eval = [
+        {
+            "modelId": f"m{rng.randrange(60)}",
+            "score": round(rng.random(), 3),
+            "costPerTask": rng.choice([None, round(rng.random(), 3)]),
+            "tasksEvaluated": rng.choice([None, rng.randrange(400)]),
+            "display": rng.random() > 0.1,
+        }
+        for _ in range(500)
+    ]
+    hle = [
+        {
+            "name": f"Model {rng.randrange(60)}",
+            "provider": rng.choice(["openai", None]),
+            "scores": {"hle": rng.uniform(1, 40), "hle_calibration_error": rng.uniform(5, 80)}
+            | ({"arc_agi_2": rng.uniform(0, 50)} if rng.random() > 0.5 else {}),
+        }
+        for _ in range(120)
+    ]
+    payloads = {"arc_evaluations": arc_eval, "arc_models": arc_models, "hle_models": hle}
+    monkeypatch.setattr(transform, "_load_aliases", lambda: {})
+
+    serial = transform.normalize_sources(payloads, workers=1)
+    monkeypatch.setattr(transform, "PARALLEL_MIN_ROWS", 0)
+    parallel = transform.normalize_sources(payloads, workers=3)
+    assert parallel == serial
+
+
+def test_compiled_accessors_match_flattened_probe():
+    rows = [
+        {"name": "a", "scores": {"hleScore": 30.0, "calibrationError": 40.0}},
+        {"name": "b", "scores": {"hle": 12.0, "hle_calibration_error": 55.0}},
+        {"model": "c", "hle": 9.0, "scores": {"ece": 0.2, "arcAgi2": 3.0}},
+        {"id": "d", "scores": "n/a"},
+        {"provider": "x"},
+    ]
+    fields = (
+        transform.MODEL_KEY_CANDIDATES,
+        transform.HLE_SCORE_KEY_CANDIDATES,
+        transform.CALIBRATION_KEY_CANDIDATES,
+        transform.HLE_ARC_KEY_CANDIDATES,
+        transform.HLE_RELEASE_KEY_CANDIDATES,
+    )
+    for keys in fields:
+        get = transform.compile_hle_accessor(rows[:1], keys)
+        expected = [transform._extract_first(transform._flatten_hle_record(row), keys) for row in rows]
+        assert [get(row) for row in rows] == expected
+        get = transform.compile_accessor(rows[2:3], keys)
+        assert [get(row) for row in rows] == [transform._extract_first(row, keys) for row in rows]
+
+
+def test_hle_accessors_match_slow_path_when_layouts_change_after_the_sample():
+    flat = [{"model": f"f{i}", "hle": float(i), "calibration_error": 1.0} for i in range(40)]
+    nested = [
+        {"name": "n1", "scores": {"hleScore": 30.0, "calibrationError": 40.0}},
+        {"model_name": "n2", "scores": {"hle_score": 12.0, "ece": 0.2}},
+        {"id": "n3", "scores": {"humanitys_last_exam": 7.0}},
+        {"id": "n4", "scores": "n/a"},
+    ]
+    fields = (
+        transform.MODEL_KEY_CANDIDATES,
+        transform.HLE_SCORE_KEY_CANDIDATES,
+        transform.CALIBRATION_KEY_CANDIDATES,
+        transform.HLE_ARC_KEY_CANDIDATES,
+    )
+    for rows in (flat + nested, nested * 10 + flat):
+        sample = rows[: transform.SCHEMA_SAMPLE_SIZE]
+        for keys in fields:
+            get = transform.compile_hle_accessor(sample, keys)
+            assert [get(row) for row in rows] == [transform._extract_hle_first(row, keys) for row in rows]
@@ -0,0 +1,41 @@
+import math
+
+from pipeline import trends
+
+
+def test_running_best_single_sweep_keeps_only_improvements():
+    points = [
+        {"model": "A", "release_date": "2024-01-01", "arc_score": 10.0, "hle_score": 5.0},
+        {"model": "B", "release_date": "2024-03-01", "arc_score": 8.0, "hle_score": 7.0},
+        {"model": "C", "release_date": "2024-06-01", "arc_score": 20.0, "hle_score": None},
+        {"model": "D", "release_date": "2024-09-01", "arc_score": 20.0, "hle_score": 6.0},
+    ]
+    built = trends.build_trends(points)
+    assert [s["model"] for s in built["arc"].frontier] == ["A", "C"]
+    assert [s["model"] for s in built["hle"].frontier] == ["A", "B"]
+
+
+def test_log_linear_fit_recovers_doubling_rate():
+    points = [
+        {"model": f"m{i}", "release_date": f"{2020 + i}-01-01", "arc_score": 2.0 * 2**i}
+        for i in range(5)
+    ]
+    summary = trends.trend_payload(points)["arc"]
+    assert math.isclose(summary["growth"]["annual_multiplier"], 2.0, rel_tol=0.01)
+    lo, hi = summary["growth"]["annual_multiplier_ci"]
+    assert lo <= summary["growth"]["annual_multiplier"] <= hi
+    assert len(summary["band"]) == len(summary["frontier"])
+
+
+def test_incremental_add_matches_full_sweep():
+    points = [
+        {"model": "A", "release_date": "2024-01-01", "arc_score": 4.0},
+        {"model": "B", "release_date": "2024-07-01", "arc_score": 9.0},
+        {"model": "C", "release_date": "2025-01-01", "arc_score": 15.0},
+    ]
+    trend = trends.RiverTrend(benchmark="arc")
+    trend.extend(points[:2])
+    assert trend.add(points[2]) is True
+    full = trends.build_trends(points)["arc"]
+    assert trend.fit == full.fit
+    assert trend.frontier == full.frontier
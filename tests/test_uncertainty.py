@@ -0,0 +1,56 @@
+import math
+
+from pipeline import uncertainty
+
+
+def test_wilson_intervals_known_values_and_defaults():
+    (ci, none, edge) = uncertainty.wilson_intervals([50.0, None, 0.0], [100, None, None], default_tasks=100)
+    assert math.isclose(ci[0], 40.383, abs_tol=0.01)
+    assert math.isclose(ci[1], 59.617, abs_tol=0.01)
+    assert none is None
+    assert edge[0] == 0.0 and edge[1] > 0.0
+    (wide,) = uncertainty.wilson_intervals([50.0], [None], default_tasks=25)
+    assert wide[1] - wide[0] > ci[1] - ci[0]
+
+
+def test_pareto_probabilities_certain_and_dominated_points():
+    scores = [10.0, 90.0, 50.0, 91.0]
+    costs = [1.0, 2.0, 3.0, 4.0]
+    ses = [0.1, 0.1, 0.1, 5.0]
+    probs = uncertainty.pareto_probabilities(scores, costs, ses, samples=400, seed=1)
+    assert probs[0] == 1.0
+    assert probs[1] == 1.0
+    assert probs[2] == 0.0  # cannot beat point 1 within its bounds
+    assert 0.3 < probs[3] < 0.7
+    assert probs == uncertainty.pareto_probabilities(scores, costs, ses, samples=400, seed=1)
+
+
+def test_annotate_adds_intervals_to_points():
+    efficiency = [
+        {"score": 20.0, "cost_per_task": 2.0, "tasks_evaluated": 400},
+        {"score": 10.0, "cost_per_task": 1.0, "tasks_evaluated": None},
+    ]
+    confidence = [{"hle_score": 25.0}]
+    transfer = [{"arc_agi_2": 30.0, "hle": 20.0, "gap": 10.0}]
+    notes = uncertainty.annotate(efficiency, confidence, transfer)
+
+    assert notes["confidence"] == 0.95
+    lo, hi = efficiency[0]["score_ci"]
+    assert lo < 20.0 < hi
+    assert efficiency[0]["efficiency_ratio_ci"] == (lo / 2.0, hi / 2.0)
+    assert efficiency[1]["score_ci"][1] - efficiency[1]["score_ci"][0] > hi - lo
+    assert efficiency[1]["pareto_probability"] == 1.0
+    assert confidence[0]["hle_score_ci"][0] < 25.0 < confidence[0]["hle_score_ci"][1]
+    gap_lo, gap_hi = transfer[0]["gap_ci"]
+    assert gap_lo < 10.0 < gap_hi
+    arc_half = (transfer[0]["arc_agi_2_ci"][1] - transfer[0]["arc_agi_2_ci"][0]) / 2
+    assert gap_hi - gap_lo > 2 * arc_half
+
+
+def test_pareto_probabilities_split_ties_on_cost_by_draw():
+    probs = uncertainty.pareto_probabilities([50.0, 50.0], [1.0, 1.0], [2.0, 2.0], samples=2000, seed=3)
+    assert 0.45 < probs[0] < 0.55 and 0.45 < probs[1] < 0.55
+    assert math.isclose(sum(probs), 1.0)
+    # A cheaper certain point still outranks both.
+    probs = uncertainty.pareto_probabilities([60.0, 50.0, 50.0], [0.5, 1.0, 1.0], [0.1, 2.0, 2.0], samples=200)
+    assert probs == [1.0, 0.0, 0.0]
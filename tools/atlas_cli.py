@@ -4,57 +4,326 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import fnmatch
+import importlib
 import json
+import os
 import sys
+import time
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from pipeline.dag import GraphRun
+
+_STARTED = time.perf_counter()
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from pipeline.analyze import build_analysis_payload, write_analysis
-from pipeline.export import export_site_data
-from pipeline.ingest import fetch_all
-from pipeline.transform import normalize_sources, write_unified
+# Stage modules are imported on first use so that commands which never touch
+# the network (scan, viz) do not pay for urllib/http.client/ssl at startup.
+NETWORK_MODULES = ("urllib.request", "http.client", "ssl")
+_IMPORT_TIMES: list[dict[str, float | str]] = []
 
 
-def cmd_scan(args: argparse.Namespace) -> int:
-    root = Path(args.path).resolve()
-    files = [p for p in root.rglob("*") if p.is_file()]
+def _stage(name: str) -> ModuleType:
+    module_name = f"pipeline.{name}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    before = set(sys.modules)
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    _IMPORT_TIMES.append(
+        {
+            "module": module_name,
+            "seconds": round(time.perf_counter() - start, 6),
+            "new_modules": len(set(sys.modules) - before),
+        }
+    )
+    return module
+
+
+def _startup_report(command: str) -> dict:
+    return {
+        "command": command,
+        "total_seconds": round(time.perf_counter() - _STARTED, 6),
+        "stage_imports": _IMPORT_TIMES,
+        "network_stack_loaded": [name for name in NETWORK_MODULES if name in sys.modules],
+        "loaded_module_count": len(sys.modules),
+    }
+
+
+SCAN_ALWAYS_SKIP = frozenset({".git"})
+
+
+class IgnoreRule(NamedTuple):
+    base: str
+    pattern: str
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+
+def _read_ignore_rules(directory: str, base: str) -> list[IgnoreRule]:
+    try:
+        with open(os.path.join(directory, ".gitignore"), encoding="utf-8") as handle:
+            lines = handle.read().splitlines()
+    except OSError:
+        return []
+
+    rules: list[IgnoreRule] = []
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.strip("/") if dir_only else line
+        anchored = "/" in line
+        rules.append(IgnoreRule(base, line.lstrip("/"), negate, dir_only, anchored))
+    return rules
+
+
+def _is_ignored(rel_path: str, name: str, is_dir: bool, rules: list[IgnoreRule]) -> bool:
+    ignored = False
+    for rule in rules:
+        if rule.dir_only and not is_dir:
+            continue
+        if rule.anchored:
+            if rule.base:
+                if not rel_path.startswith(rule.base + "/"):
+                    continue
+                target = rel_path[len(rule.base) + 1 :]
+            else:
+                target = rel_path
+        else:
+            target = name
+        if fnmatch.fnmatchcase(target, rule.pattern):
+            ignored = not rule.negate
+    return ignored
+
+
+class ScanStats:
+    """File counts and sizes for one scanned subtree; merged across workers."""
+
+    def __init__(self) -> None:
+        self.file_count = 0
+        self.total_bytes = 0
+        self.by_extension: dict[str, list[int]] = {}
+        self.sample: list[str] = []
+
+    def add(self, rel_path: str, name: str, size: int | None, sample_size: int) -> None:
+        self.file_count += 1
+        if len(self.sample) < sample_size:
+            self.sample.append(rel_path)
+        if size is None:
+            return
+        self.total_bytes += size
+        ext = os.path.splitext(name)[1].lower() or "(none)"
+        bucket = self.by_extension.setdefault(ext, [0, 0])
+        bucket[0] += 1
+        bucket[1] += size
+
+    def merge(self, other: "ScanStats", sample_size: int) -> None:
+        self.file_count += other.file_count
+        self.total_bytes += other.total_bytes
+        for ext, (count, size) in other.by_extension.items():
+            bucket = self.by_extension.setdefault(ext, [0, 0])
+            bucket[0] += count
+            bucket[1] += size
+        self.sample.extend(other.sample[: max(0, sample_size - len(self.sample))])
+
+
+def _walk(
+    root: str,
+    rel_dir: str,
+    rules: list[IgnoreRule],
+    stats: ScanStats,
+    sample_size: int,
+    *,
+    with_stats: bool = True,
+    use_ignore: bool = True,
+) -> bool:
+    """Depth-first os.scandir walk; returns False once a sample-only scan is full."""
+    stack = [(rel_dir, rules)]
+    while stack:
+        current, current_rules = stack.pop()
+        directory = os.path.join(root, current) if current else root
+        if use_ignore:
+            current_rules = current_rules + _read_ignore_rules(directory, current)
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            rel_path = f"{current}/{entry.name}" if current else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+            if is_dir and entry.name in SCAN_ALWAYS_SKIP:
+                continue
+            if use_ignore and _is_ignored(rel_path, entry.name, is_dir, current_rules):
+                continue
+            if is_dir:
+                subdirs.append((rel_path, current_rules))
+            elif is_file:
+                size = None
+                if with_stats:
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        pass
+                stats.add(rel_path, entry.name, size, sample_size)
+                if not with_stats and len(stats.sample) >= sample_size:
+                    return False
+        stack.extend(reversed(subdirs))
+    return True
+
+
+def scan_tree(
+    root: Path,
+    *,
+    sample_size: int = 20,
+    jobs: int = 1,
+    with_stats: bool = True,
+    use_ignore: bool = True,
+) -> dict:
+    root_str = str(root)
+    rules = _read_ignore_rules(root_str, "") if use_ignore else []
+    stats = ScanStats()
+
+    if not with_stats or jobs <= 1:
+        _walk(root_str, "", [], stats, sample_size, with_stats=with_stats, use_ignore=use_ignore)
+    else:
+        # Files at the top level are handled here; each top-level directory is
+        # walked by its own worker and merged back in name order.
+        top_dirs: list[str] = []
+        with os.scandir(root_str) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    is_file = not is_dir and entry.is_file()
+                except OSError:
+                    continue
+                if is_dir and entry.name in SCAN_ALWAYS_SKIP:
+                    continue
+                if use_ignore and _is_ignored(entry.name, entry.name, is_dir, rules):
+                    continue
+                if is_dir:
+                    top_dirs.append(entry.name)
+                elif is_file:
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        size = None
+                    stats.add(entry.name, entry.name, size, sample_size)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _subtree(name: str) -> ScanStats:
+            partial = ScanStats()
+            _walk(root_str, name, rules, partial, sample_size, use_ignore=use_ignore)
+            return partial
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for partial in pool.map(_subtree, top_dirs):
+                stats.merge(partial, sample_size)
+
     report = {
-        "path": str(root),
-        "file_count": len(files),
-        "sample": [str(p.relative_to(root)) for p in files[:20]],
+        "path": root_str,
+        "file_count": stats.file_count,
+        "sample": stats.sample,
+        "complete": with_stats,
     }
+    if with_stats:
+        report["total_bytes"] = stats.total_bytes
+        report["by_extension"] = {
+            ext: {"files": count, "bytes": size}
+            for ext, (count, size) in sorted(stats.by_extension.items(), key=lambda kv: (-kv[1][0], kv[0]))
+        }
+    return report
+
+
+def cmd_scan(args: argparse.Namespace) -> int:
+    report = scan_tree(
+        Path(args.path).resolve(),
+        sample_size=args.sample,
+        jobs=args.jobs,
+        with_stats=not args.sample_only,
+        use_ignore=not args.no_ignore,
+    )
     print(json.dumps(report, indent=2))
     return 0
 
 
-def cmd_eval(_: argparse.Namespace) -> int:
-    fetch_all()
-    records = normalize_sources()
-    write_unified(records)
-    payload = build_analysis_payload()
-    out = write_analysis(payload)
-    print(json.dumps({"status": "ok", "analysis_path": str(out), "model_count": len(records)}, indent=2))
+def _run_subgraph(targets: list[str], jobs: int = 1, upstream: bool = True) -> "GraphRun":
+    graph = _stage("run_pipeline").build_graph().subgraph(targets, upstream=upstream)
+    # Stages import their modules as they run; loading them here times each one.
+    for stage in graph.stages.values():
+        for name in stage.modules:
+            _stage(name)
+    # Stage progress goes to stderr so stdout stays a single JSON document.
+    with contextlib.redirect_stdout(sys.stderr):
+        return graph.run(workers=jobs)
+
+
+def cmd_eval(args: argparse.Namespace) -> int:
+    result = _run_subgraph(["analysis"], args.jobs)
+    report = {
+        "status": "ok",
+        "analysis_path": str(result.artifacts["analysis"]),
+        "model_count": len(result.artifacts["unified"]),
+        "critical_path": result.critical_path(),
+    }
+    print(json.dumps(report, indent=2))
     return 0
 
 
 def cmd_viz(_: argparse.Namespace) -> int:
-    out = export_site_data()
-    print(json.dumps({"status": "ok", "site_data": str(out)}, indent=2))
+    result = _run_subgraph(["site_data"], upstream=False)
+    print(json.dumps({"status": "ok", "site_data": str(result.artifacts["site_data"])}, indent=2))
     return 0
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="atlas", description="BenchmarkAtlas agent-first CLI")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report per-module import time and network-stack usage as JSON on stderr",
+    )
     sub = parser.add_subparsers(dest="command", required=True)
 
     scan = sub.add_parser("scan", help="Scan repository and emit JSON report")
     scan.add_argument("--path", default=".")
+    scan.add_argument("--sample", type=int, default=20, help="Number of file paths to include in the sample")
+    scan.add_argument(
+        "--sample-only",
+        action="store_true",
+        help="Stop as soon as the sample is full; skip counts and size statistics",
+    )
+    scan.add_argument(
+        "--jobs",
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help="Worker threads for walking top-level directories in parallel",
+    )
+    scan.add_argument("--no-ignore", action="store_true", help="Do not apply .gitignore rules")
     scan.set_defaults(func=cmd_scan)
 
     eval_cmd = sub.add_parser("eval", help="Fetch + transform + analyze benchmark data")
+    eval_cmd.add_argument("--jobs", type=int, default=4, help="Pipeline stages to run at once")
     eval_cmd.set_defaults(func=cmd_eval)
 
     viz = sub.add_parser("viz", help="Export processed analysis to site/data.json")
@@ -66,7 +335,10 @@ def build_parser() -> argparse.ArgumentParser:
 def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
-    return args.func(args)
+    status = args.func(args)
+    if args.profile_startup:
+        print(json.dumps(_startup_report(args.command), indent=2), file=sys.stderr)
+    return status
 
 
 if __name__ == "__main__":